@@ -7,17 +7,23 @@ Supports: bar, line, pie, scatter, area, stacked bar, grouped bar, donut charts
 
 import json
 import os
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import IO, Any, Dict, List, Optional, Tuple, Union
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend for server use
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
+from matplotlib.figure import Figure
 import numpy as np
 
 
+# Python 3.10+: no per-instance __dict__ for the data classes
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 class ChartType(Enum):
     """Supported chart types."""
     BAR = "bar"
@@ -111,9 +117,9 @@ class ChartStyle:
         )
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class DataSeries:
-    """A single data series for charts."""
+    """A single data series for charts (immutable)."""
     name: str
     values: List[float]
     color: Optional[str] = None
@@ -121,9 +127,9 @@ class DataSeries:
     line_style: Optional[str] = None  # For line: '-', '--', '-.', ':'
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ChartData:
-    """Complete chart data structure."""
+    """Complete chart data structure (immutable, safe to share between renders)."""
     chart_type: ChartType
     title: str = ""
     x_label: str = ""
@@ -230,18 +236,47 @@ class ChartRenderer:
     Renders chart data to PNG images using matplotlib.
 
     Supports multiple chart types with customizable styling.
+
+    render() reuses one Figure across calls (cleared between charts), so a
+    renderer instance must not be shared between threads.
     """
 
-    def __init__(self, style: Optional[ChartStyle] = None):
+    def __init__(
+        self,
+        style: Optional[ChartStyle] = None,
+        compress_level: int = 6,
+        figure: Optional[Figure] = None
+    ):
         """
         Initialize the chart renderer.
 
         Args:
             style: Chart styling configuration. Uses default if not provided.
+            compress_level: zlib level for render() PNGs (0-9). PNG encoding
+                dominates save time; 1 is noticeably faster for slightly
+                larger files. 6 is Pillow's default.
+            figure: Existing Figure to draw into. It is cleared and resized
+                on every render(); by default the renderer creates its own.
         """
         self.style = style or ChartStyle()
+        self.compress_level = compress_level
+        self._figure: Optional[Figure] = figure
         self._setup_fonts()
 
+    def _get_figure(self, style: ChartStyle) -> Figure:
+        """Return the renderer's Figure, cleared and sized for style."""
+        if self._figure is None:
+            # Created outside pyplot so it is never registered as a global figure
+            self._figure = Figure(
+                figsize=(style.figure_width, style.figure_height),
+                dpi=style.dpi
+            )
+        else:
+            self._figure.clear()
+            self._figure.set_size_inches(style.figure_width, style.figure_height)
+            self._figure.set_dpi(style.dpi)
+        return self._figure
+
     def _setup_fonts(self) -> None:
         """Configure fonts for Korean text support."""
         # Try to find Korean fonts
@@ -263,30 +298,29 @@ class ChartRenderer:
     def render(
         self,
         chart_data: Union[ChartData, Dict[str, Any]],
-        output_path: str,
+        output_path: Union[str, os.PathLike, IO[bytes]],
         style: Optional[ChartStyle] = None
-    ) -> str:
+    ) -> Union[str, IO[bytes]]:
         """
         Render chart data to PNG file.
 
         Args:
             chart_data: Chart data (ChartData object or dict)
-            output_path: Path to save the PNG file
+            output_path: Path to save the PNG file, or a writable binary
+                stream (e.g. io.BytesIO) to render in memory
             style: Optional style override
 
         Returns:
-            Path to the generated PNG file
+            Path to the generated PNG file (or the stream passed in)
         """
         if isinstance(chart_data, dict):
             chart_data = ChartData.from_dict(chart_data)
 
         style = style or self.style
 
-        # Create figure with style
-        fig, ax = plt.subplots(
-            figsize=(style.figure_width, style.figure_height),
-            dpi=style.dpi
-        )
+        # Reuse the figure with style
+        fig = self._get_figure(style)
+        ax = fig.add_subplot(111)
         fig.patch.set_facecolor(style.background_color)
         ax.set_facecolor(style.background_color)
 
@@ -308,22 +342,33 @@ class ChartRenderer:
         # Apply common styling
         self._apply_styling(ax, chart_data, style)
 
-        # Ensure output directory exists
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        is_stream = hasattr(output_path, "write")
+        if is_stream:
+            output_format = 'png'
+        else:
+            # Ensure output directory exists
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_format = output_path.suffix[1:].lower() or plt.rcParams['savefig.format']
+
+        # compress_level only applies to the Pillow-backed PNG writer
+        save_kwargs = {}
+        if output_format == 'png':
+            save_kwargs['pil_kwargs'] = {'compress_level': self.compress_level}
 
         # Save figure
-        plt.tight_layout(pad=style.padding * 10)
-        plt.savefig(
+        fig.tight_layout(pad=style.padding * 10)
+        fig.savefig(
             output_path,
             dpi=style.dpi,
             facecolor=style.background_color,
             edgecolor='none',
-            bbox_inches='tight'
+            bbox_inches='tight',
+            format=output_format,
+            **save_kwargs
         )
-        plt.close(fig)
 
-        return str(output_path)
+        return output_path if is_stream else os.fspath(output_path)
 
     def _get_colors(self, count: int, series: List[DataSeries], style: ChartStyle) -> List[str]:
         """Get colors for data series."""
@@ -660,7 +705,7 @@ class ChartRenderer:
     def render_multiple(
         self,
         charts: List[Union[ChartData, Dict[str, Any]]],
-        output_path: str,
+        output_path: Union[str, os.PathLike],
         layout: Tuple[int, int] = None,
         style: Optional[ChartStyle] = None
     ) -> str:
@@ -740,7 +785,7 @@ class ChartRenderer:
         )
         plt.close(fig)
 
-        return str(output_path)
+        return os.fspath(output_path)
 
 
 def render_chart(
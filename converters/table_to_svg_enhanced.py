@@ -10,12 +10,13 @@ Features:
 - Markdown table parsing
 - Korean text support with proper font handling
 """
+import io
 import os
 import sys
 import json
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import IO, Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass, field
 
 try:
@@ -30,6 +31,9 @@ try:
 except ImportError:
     HAS_CAIROSVG = False
 
+# Markdown table separator row, e.g. |---|:---:|
+SEPARATOR_ROW_RE = re.compile(r"^\|[\s\-:|]+\|$")
+
 
 @dataclass
 class CellStyle:
@@ -110,14 +114,16 @@ class Table:
 
         for line_idx, line in enumerate(lines):
             # Skip separator row (|---|---|)
-            if re.match(r"^\|[\s\-:|]+\|$", line):
+            if SEPARATOR_ROW_RE.match(line):
                 continue
 
             # Parse cells
             parts = [p.strip() for p in line.split("|")]
-            # Remove empty parts from leading/trailing pipes
-            # Use enumerate to avoid index() bug with duplicate values
-            parts = [p for idx, p in enumerate(parts) if p or idx not in (0, len(parts) - 1)]
+            # Remove empty parts from leading/trailing pipes (interior empty cells stay)
+            if parts and not parts[-1]:
+                parts.pop()
+            if parts and not parts[0]:
+                del parts[0]
 
             if not parts:
                 continue
@@ -293,20 +299,22 @@ class TableSvgRenderer:
     def render(
         self,
         table: Table,
-        output_path: str,
+        output_path: Union[str, os.PathLike, IO],
         title: Optional[str] = None,
-    ) -> str:
+    ) -> Union[str, os.PathLike, IO]:
         """
         Render table to SVG file.
 
         Args:
             table: Table structure to render
-            output_path: Output SVG file path
+            output_path: Output SVG file path, or a writable text/binary
+                stream (e.g. io.BytesIO) to render in memory
             title: Optional title to display above table
 
         Returns:
-            Path to generated SVG file
+            Path to generated SVG file (or the stream passed in)
         """
+        is_stream = hasattr(output_path, "write")
         col_widths, row_heights, total_width, total_height = self._calculate_dimensions(table)
 
         # Add space for title if provided
@@ -315,7 +323,7 @@ class TableSvgRenderer:
 
         # Create SVG drawing
         dwg = svgwrite.Drawing(
-            output_path,
+            "noname.svg" if is_stream else output_path,
             size=(total_width, total_height),
             profile="full",
         )
@@ -424,13 +432,21 @@ class TableSvgRenderer:
                     class_="korean-text" if self._has_korean(line) else None,
                 ))
 
-        dwg.save()
+        if not is_stream:
+            dwg.save()
+        elif isinstance(output_path, io.TextIOBase):
+            dwg.write(output_path)
+        else:
+            text = io.TextIOWrapper(output_path, encoding="utf-8")
+            dwg.write(text)
+            text.flush()
+            text.detach()  # keep the caller's stream open
         return output_path
 
     def render_to_png(
         self,
         table: Table,
-        output_path: str,
+        output_path: Union[str, os.PathLike],
         scale: float = 2.0,
         title: Optional[str] = None,
     ) -> str:
@@ -450,6 +466,7 @@ class TableSvgRenderer:
             raise ImportError("cairosvg required for PNG export: pip install cairosvg")
 
         # Render to temporary SVG first
+        output_path = os.fspath(output_path)
         svg_path = output_path.replace(".png", ".tmp.svg")
         self.render(table, svg_path, title)
 
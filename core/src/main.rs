@@ -255,6 +255,19 @@ enum Commands {
         mode: String,
     },
 
+    /// Serve conversions over stdin/stdout for long-lived callers.
+    ///
+    /// Reads one JSON request per line —
+    /// `{"input": ..., "output": ..., "format": "mdx", "extract_images": false, "ocr": false}` —
+    /// and answers each with one JSON line (`{"ok": true}` or
+    /// `{"ok": false, "error": ...}`) once the conversion has finished.
+    /// Converter status output is suppressed so stdout carries only responses.
+    /// Exits when stdin is closed.
+    ///
+    /// Example:
+    ///   echo '{"input":"a.hwp","output":"out"}' | hwp2mdm serve
+    Serve,
+
     /// Generate HWPX from Markdown — Korean government document presets included.
     ///
     /// Converts Markdown text to a .hwpx file with proper formatting.
@@ -607,6 +620,12 @@ fn main() {
                 std::process::exit(1);
             }
         }
+        Some(Commands::Serve) => {
+            if let Err(e) = serve() {
+                eprintln!("error: {}", e);
+                std::process::exit(1);
+            }
+        }
         Some(Commands::Generate { input, output, format, preset }) => {
             cmd_generate(&input, output.as_deref(), &format, preset.as_deref());
         }
@@ -1042,6 +1061,51 @@ fn stream_convert(ext: &str, mode: &str) -> io::Result<()> {
     Ok(())
 }
 
+/// Line-delimited JSON conversion server (see `Commands::Serve`).
+///
+/// Keeps one process (and its parser state / Rayon pool) alive across many
+/// conversions so callers don't pay process start-up per document.
+fn serve() -> io::Result<()> {
+    use std::io::BufRead as _;
+
+    let stdin = io::stdin();
+    for line in stdin.lock().lines() {
+        let line = line?;
+        if line.trim().is_empty() {
+            continue;
+        }
+
+        let response = match serde_json::from_str::<serde_json::Value>(&line) {
+            Ok(req) => match req.get("input").and_then(|v| v.as_str()) {
+                Some(input) => {
+                    let output = req.get("output").and_then(|v| v.as_str()).unwrap_or("./output");
+                    let format = req.get("format").and_then(|v| v.as_str()).unwrap_or("mdx");
+                    let extract_images = req.get("extract_images").and_then(|v| v.as_bool()).unwrap_or(false);
+                    let ocr = req.get("ocr").and_then(|v| v.as_bool()).unwrap_or(false);
+
+                    let converted = {
+                        let _silencer = StdoutSilencer::new()?;
+                        std::panic::catch_unwind(std::panic::AssertUnwindSafe(|| {
+                            convert_file(Path::new(input), Path::new(output), format, extract_images, false, ocr)
+                        }))
+                    }; // stdout restored here
+                    match converted {
+                        Ok(()) => json!({"ok": true}),
+                        Err(_) => json!({"ok": false, "error": "converter panicked"}),
+                    }
+                }
+                None => json!({"ok": false, "error": "request has no \"input\""}),
+            },
+            Err(e) => json!({"ok": false, "error": format!("invalid request: {}", e)}),
+        };
+
+        let mut stdout = io::stdout().lock();
+        writeln!(stdout, "{}", response)?;
+        stdout.flush()?;
+    }
+    Ok(())
+}
+
 /// Remove a leading `---\n...\n---\n` YAML frontmatter block, if present.
 fn strip_frontmatter(s: &str) -> String {
     let bytes = s.as_bytes();
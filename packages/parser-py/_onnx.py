@@ -0,0 +1,99 @@
+"""
+ONNX Runtime backend for EasyOCR's CRAFT text detector
+
+The detector is exported from the loaded torch model once, cached on disk,
+and then run through an onnxruntime session using the best available
+execution provider. The session object stands in for reader.detector, so
+EasyOCR's own box post-processing and CRNN recognizer run unchanged.
+"""
+import os
+
+try:
+    import onnxruntime as ort
+    HAS_ONNXRUNTIME = True
+except ImportError:
+    HAS_ONNXRUNTIME = False
+
+DEFAULT_ONNX_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'mdm-media', 'onnx')
+
+# Preferred execution providers, fastest first; CPU is always available
+PROVIDER_PREFERENCE = (
+    'TensorrtExecutionProvider',
+    'CUDAExecutionProvider',
+    'OpenVINOExecutionProvider',
+    'CoreMLExecutionProvider',
+    'CPUExecutionProvider',
+)
+
+
+def export_detector(reader, path, opset_version=17):
+    """Export reader's CRAFT detector to an ONNX file with dynamic batch/size axes"""
+    import torch
+
+    # On CUDA EasyOCR wraps the model in DataParallel
+    detector = getattr(reader.detector, 'module', reader.detector)
+    device = next(detector.parameters()).device
+    dummy = torch.zeros(1, 3, 640, 640, device=device)
+
+    tmp_path = path + '.tmp'
+    with torch.no_grad():
+        torch.onnx.export(
+            detector, dummy, tmp_path,
+            input_names=['image'],
+            output_names=['y', 'feature'],
+            dynamic_axes={
+                'image': {0: 'batch', 2: 'height', 3: 'width'},
+                'y': {0: 'batch', 1: 'out_height', 2: 'out_width'},
+                'feature': {0: 'batch', 2: 'out_height', 3: 'out_width'},
+            },
+            opset_version=opset_version,
+        )
+    os.replace(tmp_path, path)
+
+
+class OnnxDetector:
+    """Callable drop-in for reader.detector backed by an onnxruntime session"""
+
+    def __init__(self, model_path, providers=None):
+        available = ort.get_available_providers()
+        self.providers = providers or [p for p in PROVIDER_PREFERENCE if p in available]
+        self.session = ort.InferenceSession(model_path, providers=self.providers)
+
+    def __call__(self, x):
+        import torch
+
+        y, feature = self.session.run(None, {'image': x.cpu().numpy()})
+        return torch.from_numpy(y), torch.from_numpy(feature)
+
+    def eval(self):
+        return self
+
+
+def use_onnx_detector(reader, cache_dir=None):
+    """
+    Swap reader.detector for an ONNX Runtime session
+
+    The export is keyed by EasyOCR version and reused across runs. Leaves
+    the torch detector in place (with a warning) if onnxruntime is missing
+    or the export fails.
+    """
+    if not HAS_ONNXRUNTIME:
+        print("Warning: onnxruntime not installed; using the torch detector")
+        return reader
+
+    import easyocr
+
+    cache_dir = cache_dir or DEFAULT_ONNX_DIR
+    model_path = os.path.join(cache_dir, f"craft-{easyocr.__version__}.onnx")
+    try:
+        if not os.path.exists(model_path):
+            os.makedirs(cache_dir, exist_ok=True)
+            export_detector(reader, model_path)
+        detector = OnnxDetector(model_path)
+    except Exception as e:
+        print(f"Warning: ONNX detector unavailable ({e}); using the torch detector")
+        return reader
+
+    reader.detector = detector
+    print(f"EasyOCR detector: ONNX Runtime ({detector.providers[0]})")
+    return reader
@@ -0,0 +1,71 @@
+"""
+Multi-process EasyOCR pool sharing one copy of the model weights
+
+The parent's reader is handed to spawn-started workers through
+torch.multiprocessing, which moves the detector/recognizer tensors into
+shared memory instead of copying them, so N workers cost one set of
+weights rather than N separately initialised readers.
+"""
+import os
+
+try:
+    import torch
+    import torch.multiprocessing as mp
+    HAS_TORCH = True
+except ImportError:
+    HAS_TORCH = False
+
+_reader = None
+
+
+def _init_worker(reader, num_threads):
+    """Pool initializer: keep the shared reader for this worker"""
+    global _reader
+    _reader = reader
+    # Workers split the cores between them instead of each using all of them
+    torch.set_num_threads(num_threads)
+
+
+def _readtext(image_path):
+    """Run EasyOCR on one image; returns (results, error)"""
+    try:
+        return _reader.readtext(image_path), None
+    except Exception as e:
+        return None, str(e)
+
+
+class EasyOcrPool:
+    """Process pool whose workers all run OCR with one shared EasyOCR reader"""
+
+    def __init__(self, reader, processes=None):
+        """
+        Args:
+            reader: Loaded easyocr.Reader to share with the workers
+            processes: Worker count (default: CPU count)
+        """
+        if not HAS_TORCH:
+            raise ImportError("torch not installed")
+
+        processes = processes or os.cpu_count() or 1
+        reader.detector.share_memory()
+        reader.recognizer.share_memory()
+        # spawn: forking a process that already initialised torch/CUDA is unsafe
+        self._pool = mp.get_context('spawn').Pool(
+            processes,
+            initializer=_init_worker,
+            initargs=(reader, max(1, (os.cpu_count() or 1) // processes)),
+        )
+
+    def map(self, image_paths, chunksize=4):
+        """OCR image_paths in order; returns one (results, error) per image"""
+        return self._pool.map(_readtext, [str(path) for path in image_paths], chunksize)
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
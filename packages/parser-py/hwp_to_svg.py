@@ -1,6 +1,8 @@
 import sys
 import os
 import json
+import logging
+from xml.sax.saxutils import escape
 
 try:
     from pyhwp import hwp5
@@ -17,16 +19,51 @@ except ImportError:
     HAS_SVGWRITE = False
     print("Warning: svgwrite not installed. Run: pip install svgwrite")
 
+try:
+    from lxml import etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+
+# Prebuilt markup for tiny (<= 4 cell) tables, written without any XML library
+_TINY_SVG = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    '<svg xmlns="' + SVG_NS + '" version="1.1" width="{w}" height="{h}">'
+    '<rect x="0" y="0" width="{w}" height="{h}" fill="white"/>'
+    '{cells}</svg>'
+)
+_TINY_CELL = (
+    '<rect x="{x}" y="{y}" width="{cw}" height="{ch}" fill="{fill}" '
+    'stroke="#333" stroke-width="1"/>'
+    '<text x="{tx}" y="{ty}" text-anchor="middle" font-size="14" '
+    'font-family="Arial" fill="#333">{text}</text>'
+)
+
+logger = logging.getLogger(__name__)
+
 class HwpToSvgConverter:
+    # Table cell geometry; even sizes keep all SVG coordinates integral
+    CELL_WIDTH = 120
+    CELL_HEIGHT = 40
+    PADDING = 10
+
     def __init__(self, file_path):
+        assert self.CELL_WIDTH % 2 == 0 and self.CELL_HEIGHT % 2 == 0
         self.file_path = file_path
         self.validate_file()
 
     def validate_file(self):
-        if not os.path.exists(self.file_path):
-            raise FileNotFoundError(f"File not found: {self.file_path}")
-        if not self.file_path.lower().endswith('.hwp'):
+        try:
+            st = os.stat(self.file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {self.file_path}") from None
+        self._lower_path = self.file_path.lower()
+        if not self._lower_path.endswith('.hwp'):
              raise ValueError("Not a valid HWP file")
+        if st.st_size == 0:
+            raise ValueError("Empty HWP file")
 
     def convert(self, output_dir):
         """
@@ -42,12 +79,15 @@ class HwpToSvgConverter:
                 tables = self.extract_tables(hwp)
                 
                 svg_files = []
+                prefix = os.path.join(output_dir, "table_")
                 for i, table in enumerate(tables):
-                    svg_path = os.path.join(output_dir, f"table_{i+1}.svg")
+                    svg_path = f"{prefix}{i+1}.svg"
                     self.render_table_to_svg(table, svg_path)
                     svg_files.append(svg_path)
-                    print(f"  Created: {svg_path}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Created: %s", svg_path)
                 
+                logger.info("Created %d SVGs", len(svg_files))
                 return svg_files
             except Exception as e:
                 print(f"Error with pyhwp: {e}")
@@ -99,17 +139,17 @@ class HwpToSvgConverter:
         """
         Render table data to SVG file
         """
-        if not HAS_SVGWRITE:
-            raise ImportError("svgwrite required for SVG rendering")
+        if not HAS_LXML and not HAS_SVGWRITE:
+            raise ImportError("lxml or svgwrite required for SVG rendering")
         
         rows = table_data.get('rows', [])
         if not rows:
             return
         
         # Calculate dimensions
-        cell_width = 120
-        cell_height = 40
-        padding = 10
+        cell_width = self.CELL_WIDTH
+        cell_height = self.CELL_HEIGHT
+        padding = self.PADDING
         
         num_rows = len(rows)
         num_cols = max(len(row) for row in rows)
@@ -117,6 +157,16 @@ class HwpToSvgConverter:
         width = num_cols * cell_width + padding * 2
         height = num_rows * cell_height + padding * 2
         
+        if num_rows * num_cols <= 4:
+            self._write_tiny_table_svg(rows, output_path, width, height,
+                                       cell_width, cell_height, padding)
+            return
+        
+        if HAS_LXML:
+            self._stream_table_svg(rows, output_path, width, height,
+                                   cell_width, cell_height, padding)
+            return
+        
         # Create SVG
         dwg = svgwrite.Drawing(output_path, size=(width, height))
         
@@ -142,10 +192,10 @@ class HwpToSvgConverter:
                 ))
                 
                 # Cell text
-                text_y = y + cell_height/2 + 5
+                text_y = y + cell_height // 2 + 5
                 dwg.add(dwg.text(
                     str(cell),
-                    insert=(x + cell_width/2, text_y),
+                    insert=(x + cell_width // 2, text_y),
                     text_anchor='middle',
                     font_size=14,
                     font_family='Arial',
@@ -154,6 +204,71 @@ class HwpToSvgConverter:
         
         dwg.save()
 
+    def _write_tiny_table_svg(self, rows, output_path, width, height,
+                              cell_width, cell_height, padding):
+        """
+        Write a tiny table from the prebuilt template (no XML library)
+        """
+        cells = []
+        for i, row in enumerate(rows):
+            y = i * cell_height + padding
+            fill_color = '#e8f4f8' if i == 0 else 'white'
+            for j, cell in enumerate(row):
+                x = j * cell_width + padding
+                cells.append(_TINY_CELL.format(
+                    x=x, y=y, cw=cell_width, ch=cell_height, fill=fill_color,
+                    tx=x + cell_width // 2, ty=y + cell_height // 2 + 5,
+                    text=escape(str(cell)),
+                ))
+        
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(_TINY_SVG.format(w=width, h=height, cells=''.join(cells)))
+
+    def _stream_table_svg(self, rows, output_path, width, height,
+                          cell_width, cell_height, padding):
+        """
+        Write table SVG incrementally with lxml (no in-memory DOM)
+        """
+        with etree.xmlfile(output_path, encoding='utf-8') as xf:
+            xf.write_declaration()
+            with xf.element('svg', {'version': '1.1',
+                                    'width': str(width),
+                                    'height': str(height)},
+                            nsmap={None: SVG_NS}):
+                xf.write(etree.Element('rect', {'x': '0', 'y': '0',
+                                                'width': str(width),
+                                                'height': str(height),
+                                                'fill': 'white'}))
+                
+                for i, row in enumerate(rows):
+                    y = i * cell_height + padding
+                    fill_color = '#e8f4f8' if i == 0 else 'white'
+                    text_y = str(y + cell_height // 2 + 5)
+                    
+                    for j, cell in enumerate(row):
+                        x = j * cell_width + padding
+                        
+                        xf.write(etree.Element('rect', {
+                            'x': str(x),
+                            'y': str(y),
+                            'width': str(cell_width),
+                            'height': str(cell_height),
+                            'fill': fill_color,
+                            'stroke': '#333',
+                            'stroke-width': '1',
+                        }))
+                        
+                        text = etree.Element('text', {
+                            'x': str(x + cell_width // 2),
+                            'y': text_y,
+                            'text-anchor': 'middle',
+                            'font-size': '14',
+                            'font-family': 'Arial',
+                            'fill': '#333',
+                        })
+                        text.text = str(cell)
+                        xf.write(text)
+
 def main():
     if len(sys.argv) < 3:
         print("Usage: python hwp_to_svg.py <input.hwp> <output_dir>")
@@ -161,6 +276,8 @@ def main():
     
     input_path = sys.argv[1]
     output_dir = sys.argv[2]
+
+    logging.basicConfig(level=logging.INFO, format="  %(message)s")
     
     try:
         converter = HwpToSvgConverter(input_path)
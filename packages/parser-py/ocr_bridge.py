@@ -14,10 +14,58 @@ import json
 import re
 import tempfile
 import base64
+import binascii
+import hashlib
+import io
 import mimetypes
+import multiprocessing
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, TextIO, Tuple
 from dataclasses import dataclass, field
+from datetime import date
+
+try:
+    import tesserocr  # In-process Tesseract API (keeps language data loaded)
+    HAS_TESSEROCR = True
+except ImportError:
+    HAS_TESSEROCR = False
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any, indent: bool = False) -> str:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode("utf-8")
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any, indent: bool = False) -> str:
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+    _json_loads = json.loads
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import imagesize  # Header-only dimension reader
+    HAS_IMAGESIZE = True
+except ImportError:
+    HAS_IMAGESIZE = False
+
+try:
+    import yaml  # type: ignore[import-untyped]  # PyYAML has no bundled type stubs
+    # libyaml-backed loader when PyYAML was built with it
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    HAS_YAML = True
+except ImportError:
+    HAS_YAML = False
 
 # Import local OCR processor
 try:
@@ -39,6 +87,88 @@ OPENROUTER_PAID_MODELS = [
     "mistral/mistral-small-3.1-24b-instruct",  # Good for documents
 ]
 
+# Per-image separator requested from the model in batched extraction
+BATCH_IMAGE_MARKER = "--- IMAGE {i} ---"
+BATCH_IMAGE_MARKER_RE = re.compile(r"^\s*-{3}\s*IMAGE\s+(\d+)\s*-{3}\s*$", re.MULTILINE)
+
+# Markdown image reference: ![alt](path)
+IMAGE_MD_RE = re.compile(r"!\[([^\]]*)\]\(([^)]*)\)")
+# Suffixes tried, in order, when resolving an image by name
+IMAGE_EXTENSIONS = ("", ".png", ".jpg", ".jpeg", ".gif", ".bmp")
+
+# Any image reference OCR text can be attached to: markdown ![alt](path)
+# (group 1: path) or <img ... src="path"> (group 2: src)
+IMAGE_REF_RE = re.compile(
+    r"!\[[^\]]*\]\(([^)]*)\)"
+    r"|<img\b[^>]*?\bsrc\s*=\s*[\"']?([^\"'\s>]+)[^>]*>"
+)
+
+# Images sent to OpenRouter are downscaled/re-encoded to keep payloads small
+API_IMAGE_MAX_SIDE = 1280
+API_JPEG_QUALITY = 85
+API_SMALL_JPEG_BYTES = 512 * 1024
+BASE64_CHUNK_SIZE = 48 * 1024
+
+# Text precheck: a pixel counts as an edge when its gray-level step exceeds this.
+# Off by default: sparse, thin or low-contrast text can fall under any density
+# threshold. SUGGESTED_TEXT_PROBABILITY_THRESHOLD skips blank/flat images.
+EDGE_STEP_THRESHOLD = 32
+TEXT_CHECK_MAX_SIDE = 512
+DEFAULT_TEXT_PROBABILITY_THRESHOLD = 0.0
+SUGGESTED_TEXT_PROBABILITY_THRESHOLD = 0.001
+
+# Retries for a failed/rate-limited OpenRouter request (exponential backoff)
+API_MAX_RETRIES = 5
+
+# Output buffer for enhanced MDX files
+WRITE_BUFFER_SIZE = 1 << 20
+
+# process_directory resume state, kept in the output directory
+RESUME_STATE_FILE = "processed_keys.json"
+RESUME_FLUSH_EVERY = 10
+
+# Persistent OCR cache location (override with MDM_OCR_CACHE_DIR or --cache-dir)
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "mdm-media", "ocr")
+
+
+class _Base64DataUrlWriter(io.RawIOBase):
+    """Write-only stream that base64-encodes bytes into a data: URL as they arrive"""
+
+    def __init__(self, mime_type: str):
+        super().__init__()
+        self._url = bytearray(f"data:{mime_type};base64,".encode("ascii"))
+        self._pending = b""  # < 3 bytes carried over so chunks join without padding
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        size = memoryview(data).nbytes
+        buf = self._pending + bytes(data)
+        whole = len(buf) - len(buf) % 3
+        self._url += binascii.b2a_base64(buf[:whole], newline=False)
+        self._pending = buf[whole:]
+        return size
+
+    def getvalue(self) -> str:
+        return (self._url + binascii.b2a_base64(self._pending, newline=False)).decode("ascii")
+
+
+# Per-process Tesseract handle for the local OCR worker pool
+_tess_api = None
+
+
+def _init_tesseract_worker(lang: str) -> None:
+    """Process pool initializer: load Tesseract language data once per worker"""
+    global _tess_api
+    _tess_api = tesserocr.PyTessBaseAPI(lang=lang)
+
+
+def _tesseract_worker_extract(image_path: str) -> str:
+    """Run Tesseract on one image inside a pool worker"""
+    _tess_api.SetImageFile(image_path)
+    return _tess_api.GetUTF8Text().strip()
+
 
 class OpenRouterOcrEngine:
     """
@@ -54,6 +184,8 @@ class OpenRouterOcrEngine:
         model: Optional[str] = None,
         use_free_model: bool = True,
         custom_prompt: Optional[str] = None,
+        stream: bool = True,
+        on_token: Optional[Callable[[str], None]] = None,
     ):
         """
         Initialize OpenRouter OCR engine.
@@ -63,6 +195,8 @@ class OpenRouterOcrEngine:
             model: Specific model to use (defaults to free model if use_free_model=True)
             use_free_model: Use free-tier model (default: True)
             custom_prompt: Custom extraction prompt
+            stream: Stream the reply as server-sent events (default: True)
+            on_token: Called with each streamed text fragment as it arrives
         """
         self.api_key = api_key or os.environ.get("OPENROUTER_API_KEY", "")
 
@@ -80,6 +214,8 @@ class OpenRouterOcrEngine:
             self.model = OPENROUTER_PAID_MODELS[0]
 
         self.custom_prompt = custom_prompt or self._default_prompt()
+        self.stream = stream
+        self.on_token = on_token
 
         # Check for requests library
         try:
@@ -88,6 +224,37 @@ class OpenRouterOcrEngine:
         except ImportError:
             raise ImportError("requests library required: pip install requests")
 
+        # One pooled session so every request reuses the same TLS connection
+        self.session = requests.Session()
+        # Retry rate limits / gateway errors with exponential backoff per request
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        retry = Retry(
+            total=API_MAX_RETRIES,
+            backoff_factor=1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session.mount("https://", HTTPAdapter(max_retries=retry))
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://github.com/seunghan91/markdown-media",
+            "X-Title": "MDM Parser OCR",
+        })
+
+    def close(self) -> None:
+        """Close the pooled HTTP session"""
+        self.session.close()
+
+    def __enter__(self) -> "OpenRouterOcrEngine":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _default_prompt(self) -> str:
         """Default OCR extraction prompt"""
         return """Extract ALL text from this image exactly as it appears.
@@ -104,6 +271,11 @@ Output ONLY the extracted text, no explanations or metadata."""
 
     def _encode_image(self, image_path: str) -> Tuple[str, str]:
         """Encode image to base64 with proper MIME type"""
+        # JPEG encoder output is base64-encoded as it is written (no BytesIO copy)
+        writer = _Base64DataUrlWriter("image/jpeg")
+        if self._prepare_image_for_api(image_path, writer):
+            return writer.getvalue(), "image/jpeg"
+
         mime_type, _ = mimetypes.guess_type(image_path)
         if mime_type is None:
             # Default based on extension
@@ -119,67 +291,81 @@ Output ONLY the extracted text, no explanations or metadata."""
             mime_type = mime_map.get(ext, "image/png")
 
         with open(image_path, "rb") as f:
-            image_data = base64.b64encode(f.read()).decode("utf-8")
+            return self._data_url(f, mime_type), mime_type
 
-        return f"data:{mime_type};base64,{image_data}", mime_type
-
-    def extract_text(self, image_path: str, prompt: Optional[str] = None) -> str:
+    @staticmethod
+    def _data_url(stream, mime_type: str) -> str:
+        """Base64-encode a binary stream into a data: URL, one chunk at a time"""
+        # Chunk size is a multiple of 3 so the pieces concatenate without padding
+        url = bytearray(f"data:{mime_type};base64,".encode("ascii"))
+        for chunk in iter(lambda: stream.read(BASE64_CHUNK_SIZE), b""):
+            url += base64.b64encode(chunk)
+        return url.decode("ascii")
+
+    def _prepare_image_for_api(
+        self,
+        image_path: str,
+        out: BinaryIO,
+        max_side: int = API_IMAGE_MAX_SIDE,
+        jpeg_quality: int = API_JPEG_QUALITY,
+    ) -> bool:
         """
-        Extract text from image using OpenRouter vision model.
-
-        Args:
-            image_path: Path to image file
-            prompt: Optional custom prompt for this extraction
+        Downscale and re-encode an image as JPEG into out to shrink the request payload.
 
-        Returns:
-            Extracted text
+        Returns False when the original file should be sent as-is (already a
+        small JPEG, or Pillow is unavailable / can't read it).
         """
-        if not os.path.exists(image_path):
-            raise FileNotFoundError(f"Image not found: {image_path}")
-
-        image_data, mime_type = self._encode_image(image_path)
-        extraction_prompt = prompt or self.custom_prompt
+        try:
+            from PIL import Image
+        except ImportError:
+            return False
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/seunghan91/markdown-media",
-            "X-Title": "MDM Parser OCR",
-        }
+        try:
+            with Image.open(image_path) as img:
+                if (
+                    img.format == "JPEG"
+                    and max(img.size) <= max_side
+                    and os.path.getsize(image_path) <= API_SMALL_JPEG_BYTES
+                ):
+                    return False
+
+                img = img.convert("RGB")
+                if max(img.size) > max_side:
+                    img.thumbnail((max_side, max_side), Image.LANCZOS)
+
+                img.save(out, "JPEG", quality=jpeg_quality, optimize=True)
+                return True
+        except Exception:
+            return False
 
+    def _chat_completion(self, content: List[Dict[str, Any]]) -> str:
+        """Send one user message (text + image parts) and return the reply text"""
         payload = {
             "model": self.model,
             "messages": [
                 {
                     "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": extraction_prompt,
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": image_data,
-                            },
-                        },
-                    ],
+                    "content": content,
                 }
             ],
             "max_tokens": 4096,
             "temperature": 0.1,  # Low temperature for accurate extraction
+            "stream": self.stream,
         }
 
         try:
-            response = self.requests.post(
+            with self.session.post(
                 OPENROUTER_API_URL,
-                headers=headers,
                 json=payload,
                 timeout=60,
-            )
-            response.raise_for_status()
+                stream=self.stream,
+            ) as response:
+                response.raise_for_status()
+
+                if "text/event-stream" in response.headers.get("Content-Type", ""):
+                    return self._read_stream(response)
 
-            result = response.json()
+                result = response.json()
 
             if "choices" in result and len(result["choices"]) > 0:
                 return result["choices"][0]["message"]["content"].strip()
@@ -189,67 +375,136 @@ Output ONLY the extracted text, no explanations or metadata."""
         except self.requests.exceptions.RequestException as e:
             raise RuntimeError(f"OpenRouter API request failed: {e}")
 
-    def extract_text_from_url(self, image_url: str, prompt: Optional[str] = None) -> str:
+    def _read_stream(self, response) -> str:
+        """Accumulate a server-sent-events chat completion, stopping at finish_reason"""
+        parts: List[str] = []
+
+        for line in response.iter_lines():
+            # Skip keep-alive comments (": OPENROUTER PROCESSING") and blank lines
+            if not line.startswith(b"data:"):
+                continue
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                break
+
+            chunk = _json_loads(data)
+            if "error" in chunk:
+                raise ValueError(f"OpenRouter stream error: {chunk['error']}")
+            if not chunk.get("choices"):
+                continue
+
+            choice = chunk["choices"][0]
+            text = (choice.get("delta") or {}).get("content")
+            if text:
+                parts.append(text)
+                if self.on_token is not None:
+                    self.on_token(text)
+            if choice.get("finish_reason"):
+                break
+
+        if not parts:
+            raise ValueError("Unexpected API response: empty stream")
+        return "".join(parts).strip()
+
+    def extract_text(self, image_path: str, prompt: Optional[str] = None) -> str:
         """
-        Extract text from image URL using OpenRouter vision model.
+        Extract text from image using OpenRouter vision model.
 
         Args:
-            image_url: URL of the image
-            prompt: Optional custom prompt
+            image_path: Path to image file
+            prompt: Optional custom prompt for this extraction
 
         Returns:
             Extracted text
         """
+        if not os.path.exists(image_path):
+            raise FileNotFoundError(f"Image not found: {image_path}")
+
+        image_data, mime_type = self._encode_image(image_path)
         extraction_prompt = prompt or self.custom_prompt
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/seunghan91/markdown-media",
-            "X-Title": "MDM Parser OCR",
-        }
+        return self._chat_completion([
+            {"type": "text", "text": extraction_prompt},
+            {"type": "image_url", "image_url": {"url": image_data}},
+        ])
 
-        payload = {
-            "model": self.model,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": extraction_prompt,
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": image_url,
-                            },
-                        },
-                    ],
-                }
-            ],
-            "max_tokens": 4096,
-            "temperature": 0.1,
-        }
+    def extract_text_batch(
+        self,
+        image_paths: List[str],
+        batch_size: int = 4,
+        prompt: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Extract text from several images, sending up to batch_size images per request.
 
-        try:
-            response = self.requests.post(
-                OPENROUTER_API_URL,
-                headers=headers,
-                json=payload,
-                timeout=60,
-            )
-            response.raise_for_status()
+        Each reply is split back into per-image text on the
+        ``--- IMAGE n ---`` markers the model is asked to emit.
 
-            result = response.json()
+        Args:
+            image_paths: Paths to image files
+            batch_size: Max images per chat completion request
+            prompt: Optional custom prompt for this extraction
 
-            if "choices" in result and len(result["choices"]) > 0:
-                return result["choices"][0]["message"]["content"].strip()
-            else:
-                raise ValueError(f"Unexpected API response: {result}")
+        Returns:
+            Extracted text for each image, in input order ("" if missing)
+        """
+        extraction_prompt = prompt or self.custom_prompt
+        texts: List[str] = []
 
-        except self.requests.exceptions.RequestException as e:
-            raise RuntimeError(f"OpenRouter API request failed: {e}")
+        for start in range(0, len(image_paths), max(1, batch_size)):
+            chunk = image_paths[start:start + max(1, batch_size)]
+
+            if len(chunk) == 1:
+                texts.append(self.extract_text(chunk[0], prompt))
+                continue
+
+            content: List[Dict[str, Any]] = [{
+                "type": "text",
+                "text": (
+                    f"{extraction_prompt}\n\n"
+                    f"You are given {len(chunk)} images. For each image i (1-based, "
+                    f"in the order given), start its text with a line "
+                    f"'{BATCH_IMAGE_MARKER.format(i='i')}'."
+                ),
+            }]
+            for image_path in chunk:
+                if not os.path.exists(image_path):
+                    raise FileNotFoundError(f"Image not found: {image_path}")
+                image_data, _ = self._encode_image(image_path)
+                content.append({"type": "image_url", "image_url": {"url": image_data}})
+
+            reply = self._chat_completion(content)
+            texts.extend(self._split_batch_reply(reply, len(chunk)))
+
+        return texts
+
+    @staticmethod
+    def _split_batch_reply(reply: str, count: int) -> List[str]:
+        """Split a batched reply on its --- IMAGE n --- markers"""
+        parts = BATCH_IMAGE_MARKER_RE.split(reply)
+        by_index: Dict[int, str] = {}
+        # parts = [preamble, n1, text1, n2, text2, ...]
+        for i in range(1, len(parts) - 1, 2):
+            by_index[int(parts[i])] = parts[i + 1].strip()
+        return [by_index.get(i, "") for i in range(1, count + 1)]
+
+    def extract_text_from_url(self, image_url: str, prompt: Optional[str] = None) -> str:
+        """
+        Extract text from image URL using OpenRouter vision model.
+
+        Args:
+            image_url: URL of the image
+            prompt: Optional custom prompt
+
+        Returns:
+            Extracted text
+        """
+        extraction_prompt = prompt or self.custom_prompt
+
+        return self._chat_completion([
+            {"type": "text", "text": extraction_prompt},
+            {"type": "image_url", "image_url": {"url": image_url}},
+        ])
 
     @staticmethod
     def available_models() -> Dict[str, List[str]]:
@@ -297,8 +552,8 @@ class RustOutput:
     @classmethod
     def from_json(cls, json_path: str) -> "RustOutput":
         """Load from JSON output file"""
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(json_path, "rb") as f:
+            data = _json_loads(f.read())
 
         return cls(
             format=data.get("format", "unknown"),
@@ -311,10 +566,11 @@ class RustOutput:
         )
 
     @classmethod
-    def from_mdx(cls, mdx_path: str) -> "RustOutput":
-        """Parse from MDX output file with frontmatter"""
-        with open(mdx_path, "r", encoding="utf-8") as f:
-            content = f.read()
+    def from_mdx(cls, mdx_path: str, *, content: Optional[str] = None) -> "RustOutput":
+        """Parse from MDX output file with frontmatter (content: already-read file text)"""
+        if content is None:
+            with open(mdx_path, "r", encoding="utf-8") as f:
+                content = f.read()
 
         # Parse YAML frontmatter
         metadata = {}
@@ -323,23 +579,12 @@ class RustOutput:
         if content.startswith("---"):
             parts = content.split("---", 2)
             if len(parts) >= 3:
-                # Parse frontmatter
-                frontmatter = parts[1].strip()
-                for line in frontmatter.split("\n"):
-                    if ":" in line:
-                        key, value = line.split(":", 1)
-                        key = key.strip()
-                        value = value.strip().strip('"')
-                        # Convert numeric values
-                        if value.isdigit():
-                            value = int(value)
-                        metadata[key] = value
+                metadata = cls._parse_frontmatter(parts[1])
                 text_content = parts[2].strip()
 
         # Extract image references
         images = []
-        image_pattern = r'!\[(.*?)\]\((.*?)\)'
-        for match in re.finditer(image_pattern, text_content):
+        for match in IMAGE_MD_RE.finditer(text_content):
             alt_text, path = match.groups()
             images.append({
                 "id": Path(path).stem,
@@ -358,6 +603,103 @@ class RustOutput:
             output_dir=str(Path(mdx_path).parent),
         )
 
+    @staticmethod
+    def _parse_frontmatter(frontmatter: str) -> Dict[str, Any]:
+        """Parse YAML frontmatter (PyYAML if available, else flat key: value lines)"""
+        if HAS_YAML:
+            try:
+                loaded = yaml.load(frontmatter, Loader=_YamlLoader)
+            except yaml.YAMLError:
+                loaded = None
+            if isinstance(loaded, dict):
+                # Keep metadata JSON-serializable (YAML turns bare dates into objects)
+                return {
+                    str(key): value.isoformat() if isinstance(value, date) else value
+                    for key, value in loaded.items()
+                }
+
+        metadata: Dict[str, Any] = {}
+        for line in frontmatter.strip().split("\n"):
+            if ":" in line:
+                key, value = line.split(":", 1)
+                key = key.strip()
+                value = value.strip().strip('"')
+                # Convert numeric values
+                if value.isdigit():
+                    value = int(value)
+                metadata[key] = value
+        return metadata
+
+
+class DiskCache:
+    """
+    Persistent OCR cache backed by SQLite.
+
+    Entries are keyed by a hash of the image bytes plus the engine and
+    language, so the same image is only OCR'd once across runs and paths.
+    The database is opened on first use (in WAL mode, so several processes
+    can share it); constructing a cache touches nothing on disk.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(
+            cache_dir or os.environ.get("MDM_OCR_CACHE_DIR") or DEFAULT_CACHE_DIR
+        )
+        self.db_path = self.cache_dir / "ocr_cache.sqlite3"
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open (and create) the database; call with self._lock held"""
+        if self._conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS ocr ("
+                    "hash TEXT, engine TEXT, lang TEXT, text TEXT, meta TEXT, "
+                    "PRIMARY KEY (hash, engine, lang))"
+                )
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def hash_file(path: str) -> str:
+        """BLAKE2b digest of the file contents"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def get(self, key: str, engine: str, lang: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Return (text, metadata) for a cached image, or None"""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT text, meta FROM ocr WHERE hash = ? AND engine = ? AND lang = ?",
+                (key, engine, lang),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], _json_loads(row[1] or "{}")
+
+    def put(self, key: str, engine: str, lang: str, text: str, meta: Dict[str, Any]) -> None:
+        """Store OCR text for an image"""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO ocr (hash, engine, lang, text, meta) VALUES (?, ?, ?, ?, ?)",
+                    (key, engine, lang, text, _json_dumps(meta)),
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
 
 class RustOcrBridge:
     """
@@ -383,6 +725,11 @@ class RustOcrBridge:
         openrouter_api_key: Optional[str] = None,
         openrouter_model: Optional[str] = None,
         use_free_model: bool = True,
+        ocr_concurrency: Optional[int] = None,
+        batch_size: int = 4,
+        use_disk_cache: bool = True,
+        cache_dir: Optional[str] = None,
+        text_probability_threshold: float = DEFAULT_TEXT_PROBABILITY_THRESHOLD,
     ):
         """
         Initialize the OCR bridge.
@@ -399,12 +746,32 @@ class RustOcrBridge:
             openrouter_api_key: API key for OpenRouter (or set OPENROUTER_API_KEY env var)
             openrouter_model: Specific OpenRouter model to use
             use_free_model: Use free-tier OpenRouter model (default: True)
+            ocr_concurrency: Max images OCR'd in parallel
+                (or set OCR_CONCURRENCY env var; defaults to CPU count)
+            batch_size: Images sent per OpenRouter request (default: 4)
+            use_disk_cache: Reuse OCR results across runs, keyed by image content
+            cache_dir: Disk cache location (or set MDM_OCR_CACHE_DIR env var;
+                defaults to ~/.cache/mdm-media/ocr)
+            text_probability_threshold: Minimum share of sharp-edge pixels for an
+                image to be OCR'd; flat images (blank, gradients) are skipped.
+                0 (default) disables the check; 0.001 is a reasonable value
         """
         self.engine_type = ocr_engine.lower()
         self.language = language
         self.min_image_size = min_image_size
         self.confidence_threshold = confidence_threshold
+        self.ocr_concurrency = max(1, (
+            ocr_concurrency
+            or int(os.environ.get("OCR_CONCURRENCY", 0))
+            or os.cpu_count()
+            or 1
+        ))
+        self.batch_size = max(1, batch_size)
+        self.text_probability_threshold = text_probability_threshold
+        self._no_text_skips = 0
         self._ocr_cache: Dict[str, OcrResult] = {}
+        self._cache_lock = threading.Lock()
+        self.disk_cache = DiskCache(cache_dir) if use_disk_cache else None
 
         # Initialize appropriate OCR engine
         if self.engine_type == "openrouter":
@@ -414,16 +781,33 @@ class RustOcrBridge:
                 model=openrouter_model,
                 use_free_model=use_free_model,
             )
+            self.engine_name = f"openrouter:{self.ai_engine.model}"
         else:
-            self.ocr_processor = OcrProcessor(engine=ocr_engine, lang=language)
+            # The bridge keeps its own content-hash cache (see DiskCache)
+            self.ocr_processor = OcrProcessor(engine=ocr_engine, lang=language, use_cache=False)
             self.ai_engine = None
+            self.engine_name = self.ocr_processor.engine
+
+        # Tesseract worker processes, created here rather than from the OCR
+        # threads; spawn so workers never fork a multithreaded parent
+        self._tess_pool: Optional[ProcessPoolExecutor] = None
+        if self._use_tesseract_pool():
+            self._tess_pool = ProcessPoolExecutor(
+                max_workers=self.ocr_concurrency,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_tesseract_worker,
+                initargs=(self.language,),
+            )
 
-    def process_rust_output(self, rust_output_path: str) -> Dict[str, Any]:
+    def process_rust_output(
+        self, rust_output_path: str, content: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Process output from Rust mdm-core parser.
 
         Args:
             rust_output_path: Path to Rust output (JSON or MDX file)
+            content: MDX text if the caller has already read the file
 
         Returns:
             Dict containing:
@@ -436,33 +820,77 @@ class RustOcrBridge:
         if rust_output_path.endswith(".json"):
             rust_output = RustOutput.from_json(rust_output_path)
         elif rust_output_path.endswith((".mdx", ".md")):
-            rust_output = RustOutput.from_mdx(rust_output_path)
+            rust_output = RustOutput.from_mdx(rust_output_path, content=content)
         else:
             raise ValueError(f"Unsupported output format: {rust_output_path}")
 
-        # Process images with OCR
-        ocr_results = []
+        # Resolve image paths up front so OCR can run concurrently
+        with self._cache_lock:
+            self._no_text_skips = 0
         processed_count = 0
         skipped_count = 0
         error_count = 0
+        jobs = []
+        dir_index = self._scan_image_dirs(rust_output.output_dir)
 
         for image_info in rust_output.images:
-            image_path = self._resolve_image_path(image_info, rust_output.output_dir)
+            image_path = self._resolve_image_path(
+                image_info, rust_output.output_dir, dir_index
+            )
 
             if not image_path or not os.path.exists(image_path):
                 skipped_count += 1
                 continue
 
-            try:
-                result = self._process_image(image_info, image_path)
-                if result:
-                    ocr_results.append(result)
-                    processed_count += 1
-                else:
-                    skipped_count += 1
-            except Exception as e:
-                error_count += 1
-                print(f"Warning: Failed to process {image_info.get('id', 'unknown')}: {e}")
+            jobs.append((image_info, image_path))
+
+        # Phase 1: cache lookups and size filter, synchronously (cheap I/O only)
+        results_by_index: List[Optional[OcrResult]] = [None] * len(jobs)
+        cached_count = 0
+        to_process = []
+
+        for index, (image_info, image_path) in enumerate(jobs):
+            cached, content_key = self._lookup_cached(image_info, image_path)
+            if cached is not None:
+                results_by_index[index] = cached
+                processed_count += 1
+                cached_count += 1
+            elif self._is_too_small(image_path):
+                skipped_count += 1
+            else:
+                to_process.append((index, (image_info, image_path, content_key)))
+
+        # Phase 2: OCR only what's left (results keep document order).
+        # OpenRouter gets several images per request; local engines one each.
+        chunk_size = self.batch_size if self.ai_engine else 1
+
+        if to_process:
+            with ThreadPoolExecutor(max_workers=self.ocr_concurrency) as executor:
+                futures = {
+                    executor.submit(
+                        self._process_batch,
+                        [job for _, job in to_process[start:start + chunk_size]],
+                    ): start
+                    for start in range(0, len(to_process), chunk_size)
+                }
+                for future in as_completed(futures):
+                    chunk = to_process[futures[future]:futures[future] + chunk_size]
+                    try:
+                        batch_results = future.result()
+                    except Exception as e:
+                        error_count += len(chunk)
+                        ids = ", ".join(job[0].get("id", "unknown") for _, job in chunk)
+                        print(f"Warning: Failed to process {ids}: {e}")
+                        continue
+
+                    for (index, _), result in zip(chunk, batch_results):
+                        if result:
+                            results_by_index[index] = result
+                            processed_count += 1
+                        else:
+                            skipped_count += 1
+
+        ocr_results = [r for r in results_by_index if r is not None]
 
         # Build enhanced text
         enhanced_text = self._integrate_ocr_results(rust_output.text_content, ocr_results)
@@ -480,14 +908,38 @@ class RustOcrBridge:
             "statistics": {
                 "total_images": len(rust_output.images),
                 "processed": processed_count,
+                "cached": cached_count,
                 "skipped": skipped_count,
+                "skipped_likely_no_text": self._no_text_skips,
                 "errors": error_count,
-                "ocr_engine": self.ocr_processor.engine,
+                "ocr_engine": self.engine_name,
             },
         }
 
+    @staticmethod
+    def _scan_image_dirs(output_dir: Optional[str]) -> List[Dict[str, str]]:
+        """List files in output_dir and output_dir/media once ({name: path} per dir)"""
+        if not output_dir:
+            return []
+
+        index = []
+        for root in (output_dir, os.path.join(output_dir, "media")):
+            files: Dict[str, str] = {}
+            try:
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            files[entry.name] = entry.path
+            except OSError:
+                pass
+            index.append(files)
+        return index
+
     def _resolve_image_path(
-        self, image_info: Dict[str, Any], output_dir: Optional[str]
+        self,
+        image_info: Dict[str, Any],
+        output_dir: Optional[str],
+        dir_index: Optional[List[Dict[str, str]]] = None,
     ) -> Optional[str]:
         """Resolve actual image file path from image info"""
         # Try direct path
@@ -495,18 +947,27 @@ class RustOcrBridge:
         if path and os.path.isabs(path) and os.path.exists(path):
             return path
 
+        filename = image_info.get("filename", "") or image_info.get("id", "")
+
+        # Look up the pre-scanned directory listing (plain file names only)
+        if output_dir and filename and dir_index is not None and not os.path.dirname(filename):
+            for files in dir_index:
+                for ext in IMAGE_EXTENSIONS:
+                    full_path = files.get(filename + ext)
+                    if full_path:
+                        return full_path
+
         # Try relative to output directory
-        if output_dir:
-            filename = image_info.get("filename", "") or image_info.get("id", "")
+        elif output_dir:
             if filename:
-                for ext in ["", ".png", ".jpg", ".jpeg", ".gif", ".bmp"]:
+                for ext in IMAGE_EXTENSIONS:
                     full_path = os.path.join(output_dir, filename + ext)
                     if os.path.exists(full_path):
                         return full_path
 
                 # Check media subdirectory
                 media_path = os.path.join(output_dir, "media", filename)
-                for ext in ["", ".png", ".jpg", ".jpeg", ".gif", ".bmp"]:
+                for ext in IMAGE_EXTENSIONS:
                     full_path = media_path + ext
                     if os.path.exists(full_path):
                         return full_path
@@ -525,12 +986,14 @@ class RustOcrBridge:
 
         # Handle base64 data
         if isinstance(data, str):
-            # Remove data URL prefix if present
-            if data.startswith("data:"):
-                data = data.split(",", 1)[1]
-            image_bytes = base64.b64decode(data)
+            # Skip a data URL prefix by offset instead of splitting off a copy
+            raw = data.encode("ascii")
+            payload = memoryview(raw)
+            if raw.startswith(b"data:"):
+                payload = payload[raw.find(b",") + 1:]
+            image_bytes = base64.b64decode(payload)
         elif isinstance(data, (bytes, bytearray)):
-            image_bytes = bytes(data)
+            image_bytes = data
         else:
             return None
 
@@ -542,42 +1005,162 @@ class RustOcrBridge:
         elif fmt == "gif":
             ext = ".gif"
 
-        # Save to temp file
-        temp_file = tempfile.NamedTemporaryFile(
-            suffix=ext, delete=False, prefix=f"mdm_ocr_{image_info.get('id', 'img')}_"
+        # Save to temp file (unbuffered: the bytes go straight to the fd)
+        fd, temp_path = tempfile.mkstemp(
+            suffix=ext, prefix=f"mdm_ocr_{image_info.get('id', 'img')}_"
         )
-        temp_file.write(image_bytes)
-        temp_file.close()
-        return temp_file.name
+        try:
+            view = memoryview(image_bytes)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        return temp_path
 
     def _process_image(
         self, image_info: Dict[str, Any], image_path: str
     ) -> Optional[OcrResult]:
         """Process a single image with OCR"""
+        cached, content_key = self._lookup_cached(image_info, image_path)
+        if cached is not None:
+            return cached
+        if self._is_too_small(image_path):
+            return None
+        return self._process_batch([(image_info, image_path, content_key)])[0]
+
+    def _lookup_cached(
+        self, image_info: Dict[str, Any], image_path: str
+    ) -> Tuple[Optional[OcrResult], Optional[str]]:
+        """Return (cached result or None, content hash for the disk cache)"""
         # Check cache
-        cache_key = image_path
-        if cache_key in self._ocr_cache:
-            return self._ocr_cache[cache_key]
+        with self._cache_lock:
+            cached = self._ocr_cache.get(image_path)
+        if cached is not None:
+            return cached, None
+
+        # Check persistent cache (same bytes under any path)
+        if self.disk_cache is None:
+            return None, None
+        content_key = self.disk_cache.hash_file(image_path)
+        hit = self.disk_cache.get(content_key, self.engine_name, self.language)
+        if hit is not None:
+            return self._make_result(image_info, image_path, hit[0]), content_key
+        return None, content_key
+
+    def _process_batch(
+        self, batch: List[Tuple[Dict[str, Any], str, Optional[str]]]
+    ) -> List[Optional[OcrResult]]:
+        """OCR uncached images; OpenRouter receives the whole batch in one request"""
+        results: List[Optional[OcrResult]] = [None] * len(batch)
+        pending = []
+
+        for index, (_, image_path, _) in enumerate(batch):
+            # Skip images that almost certainly contain no text
+            if not self._has_probable_text(image_path):
+                with self._cache_lock:
+                    self._no_text_skips += 1
+                continue
 
-        # Skip small images
-        try:
-            from PIL import Image
-            with Image.open(image_path) as img:
-                if img.width < self.min_image_size[0] or img.height < self.min_image_size[1]:
-                    return None
-        except Exception:
-            pass  # Continue anyway if PIL fails
+            pending.append(index)
+
+        if not pending:
+            return results
 
         # Run OCR using appropriate engine
+        paths = [batch[index][1] for index in pending]
         if self.ai_engine:
             # Use OpenRouter AI engine
-            extracted_text = self.ai_engine.extract_text(image_path)
-            engine_name = f"openrouter:{self.ai_engine.model}"
+            texts = self.ai_engine.extract_text_batch(paths, batch_size=len(paths))
+        elif self._tess_pool is not None:
+            # Tesseract in worker processes: real parallelism, no per-call model load
+            texts = list(self._tess_pool.map(_tesseract_worker_extract, paths))
         else:
             # Use local OCR processor
-            extracted_text = self.ocr_processor.extract_text(image_path)
-            engine_name = self.ocr_processor.engine
+            texts = [self.ocr_processor.extract_text(path) for path in paths]
+
+        for index, extracted_text in zip(pending, texts):
+            image_info, image_path, content_key = batch[index]
+            result = self._make_result(image_info, image_path, extracted_text)
+            results[index] = result
+            if result is not None and self.disk_cache is not None and content_key:
+                self.disk_cache.put(
+                    content_key, self.engine_name, self.language,
+                    result.extracted_text, result.metadata,
+                )
+
+        return results
+
+    def _use_tesseract_pool(self) -> bool:
+        return (
+            HAS_TESSEROCR
+            and self.ocr_processor is not None
+            and self.ocr_processor.engine == "tesseract"
+            and self.ocr_concurrency > 1
+        )
 
+    def close(self) -> None:
+        """Release worker processes, HTTP session and cache connection"""
+        if self._tess_pool is not None:
+            self._tess_pool.shutdown()
+            self._tess_pool = None
+        if self.ai_engine is not None:
+            self.ai_engine.close()
+        if self.disk_cache is not None:
+            self.disk_cache.close()
+            self.disk_cache = None
+
+    def __enter__(self) -> "RustOcrBridge":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _is_too_small(self, image_path: str) -> bool:
+        """Check the image against min_image_size (False if it can't be read)"""
+        if HAS_IMAGESIZE:
+            try:
+                width, height = imagesize.get(image_path)
+            except Exception:
+                width = height = -1
+            if width >= 0 and height >= 0:
+                return width < self.min_image_size[0] or height < self.min_image_size[1]
+
+        # Unknown to imagesize (or not installed): let PIL read the header
+        try:
+            from PIL import Image
+            with Image.open(image_path) as img:
+                return img.width < self.min_image_size[0] or img.height < self.min_image_size[1]
+        except Exception:
+            return False  # Continue anyway if PIL fails
+
+    def _has_probable_text(self, image_path: str) -> bool:
+        """Cheap edge-density check; True when unsure (no numpy/PIL, unreadable image)"""
+        if not HAS_NUMPY or self.text_probability_threshold <= 0:
+            return True
+
+        try:
+            from PIL import Image
+            with Image.open(image_path) as img:
+                gray = img.convert("L")
+                # NEAREST keeps glyph edges sharp while shrinking
+                gray.thumbnail((TEXT_CHECK_MAX_SIDE, TEXT_CHECK_MAX_SIDE), Image.NEAREST)
+                pixels = np.asarray(gray, dtype=np.int16)
+        except Exception:
+            return True
+
+        if pixels.shape[0] < 2 or pixels.shape[1] < 2:
+            return True
+
+        edges = (
+            (np.abs(np.diff(pixels, axis=1))[:-1, :] > EDGE_STEP_THRESHOLD)
+            | (np.abs(np.diff(pixels, axis=0))[:, :-1] > EDGE_STEP_THRESHOLD)
+        )
+        return float(edges.mean()) >= self.text_probability_threshold
+
+    def _make_result(
+        self, image_info: Dict[str, Any], image_path: str, extracted_text: str
+    ) -> Optional[OcrResult]:
+        """Build and cache an OcrResult (None if the text is too short)"""
         if not extracted_text or len(extracted_text.strip()) < 2:
             return None
 
@@ -590,12 +1173,13 @@ class RustOcrBridge:
                 "width": image_info.get("width"),
                 "height": image_info.get("height"),
                 "format": image_info.get("format"),
-                "ocr_engine": engine_name,
+                "ocr_engine": self.engine_name,
             },
         )
 
         # Cache result
-        self._ocr_cache[cache_key] = result
+        with self._cache_lock:
+            self._ocr_cache[image_path] = result
         return result
 
     def _integrate_ocr_results(
@@ -606,38 +1190,54 @@ class RustOcrBridge:
             return text_content
 
         # Build OCR content section
-        ocr_section = "\n\n## OCR Extracted Text\n\n"
-        ocr_section += "<details>\n<summary>Extracted text from images</summary>\n\n"
-
-        for result in ocr_results:
-            ocr_section += f"### {result.image_id}\n\n"
-            ocr_section += f"```text\n{result.extracted_text}\n```\n\n"
-
-        ocr_section += "</details>\n"
-
-        # Also try to insert OCR text near image references
-        enhanced_content = text_content
-        for result in ocr_results:
-            # Find image references and add OCR text
-            patterns = [
-                rf'!\[([^\]]*)\]\([^)]*{re.escape(result.image_id)}[^)]*\)',
-                rf'<img[^>]*{re.escape(result.image_id)}[^>]*>',
-            ]
-
-            for pattern in patterns:
-                matches = list(re.finditer(pattern, enhanced_content))
-                for match in reversed(matches):  # Reverse to preserve positions
-                    insert_pos = match.end()
-                    ocr_inline = f"\n\n> **OCR:** {result.extracted_text[:200]}{'...' if len(result.extracted_text) > 200 else ''}\n"
-                    enhanced_content = (
-                        enhanced_content[:insert_pos]
-                        + ocr_inline
-                        + enhanced_content[insert_pos:]
-                    )
-                    break  # Only insert once per result
+        ocr_section = "".join([
+            "\n\n## OCR Extracted Text\n\n",
+            "<details>\n<summary>Extracted text from images</summary>\n\n",
+            *(
+                f"### {result.image_id}\n\n```text\n{result.extracted_text}\n```\n\n"
+                for result in ocr_results
+            ),
+            "</details>\n",
+        ])
+
+        # Also insert OCR text after the last markdown and the last <img>
+        # reference to each image, in one scan of the text. A reference
+        # belongs to a result when its path, file name or stem is the image id.
+        results_by_id: Dict[str, List[int]] = {}
+        for index, result in enumerate(ocr_results):
+            results_by_id.setdefault(result.image_id, []).append(index)
+
+        last_ref: Dict[Tuple[int, bool], int] = {}
+        for match in IMAGE_REF_RE.finditer(text_content):
+            md_path, src = match.groups()
+            is_markdown = md_path is not None
+            # Markdown paths may carry a title: ![alt](path "title")
+            path = (md_path if is_markdown else src).strip().split(maxsplit=1)
+            if not path:
+                continue
+            name = path[0].rsplit("/", 1)[-1]
+            for key in dict.fromkeys((path[0], name, os.path.splitext(name)[0])):
+                for index in results_by_id.get(key, ()):
+                    last_ref[(index, is_markdown)] = match.end()
+
+        inserts: Dict[int, List[str]] = {}
+        for (index, _), insert_pos in sorted(last_ref.items()):
+            result = ocr_results[index]
+            ocr_inline = f"\n\n> **OCR:** {result.extracted_text[:200]}{'...' if len(result.extracted_text) > 200 else ''}\n"
+            # Later results land in front of earlier ones at the same spot
+            inserts.setdefault(insert_pos, []).insert(0, ocr_inline)
+
+        parts = []
+        prev = 0
+        for insert_pos in sorted(inserts):
+            parts.append(text_content[prev:insert_pos])
+            parts.extend(inserts[insert_pos])
+            prev = insert_pos
+        parts.append(text_content[prev:])
 
         # Append full OCR section at the end
-        enhanced_content += ocr_section
+        parts.append(ocr_section)
+        enhanced_content = "".join(parts)
 
         return enhanced_content
 
@@ -646,6 +1246,7 @@ class RustOcrBridge:
         mdx_path: str,
         ocr_results: Optional[Dict[str, Any]] = None,
         output_path: Optional[str] = None,
+        content: Optional[str] = None,
     ) -> str:
         """
         Enhance MDX file with OCR results.
@@ -654,34 +1255,36 @@ class RustOcrBridge:
             mdx_path: Path to MDX file
             ocr_results: Pre-computed OCR results (or None to compute)
             output_path: Optional output path (defaults to original with .ocr.mdx suffix)
+            content: MDX text if the caller has already read the file
 
         Returns:
             Path to enhanced MDX file
         """
+        # Read the source once for both OCR and frontmatter
+        if content is None:
+            with open(mdx_path, "r", encoding="utf-8") as f:
+                content = f.read()
+
         # Process if no results provided
         if ocr_results is None:
-            ocr_results = self.process_rust_output(mdx_path)
-
-        enhanced_text = ocr_results["enhanced_text"]
+            ocr_results = self.process_rust_output(mdx_path, content=content)
 
         # Preserve frontmatter
-        with open(mdx_path, "r", encoding="utf-8") as f:
-            original = f.read()
-
-        if original.startswith("---"):
-            parts = original.split("---", 2)
-            if len(parts) >= 3:
-                frontmatter = f"---{parts[1]}---\n\n"
-                enhanced_text = frontmatter + enhanced_text
+        frontmatter = ""
+        if content.startswith("---"):
+            end = content.find("---", 3)
+            if end != -1:
+                frontmatter = f"---{content[3:end]}---\n\n"
 
         # Determine output path
         if output_path is None:
             base = Path(mdx_path)
             output_path = str(base.parent / f"{base.stem}.ocr{base.suffix}")
 
-        # Write enhanced MDX
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(enhanced_text)
+        # Write enhanced MDX piece by piece (no full-file concatenation)
+        with open(output_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(frontmatter)
+            f.write(ocr_results["enhanced_text"])
 
         return output_path
 
@@ -690,6 +1293,8 @@ class RustOcrBridge:
         input_dir: str,
         output_dir: Optional[str] = None,
         patterns: List[str] = None,
+        results_fp: Optional[TextIO] = None,
+        resume: bool = False,
     ) -> Dict[str, Any]:
         """
         Process all MDX files in a directory.
@@ -698,9 +1303,15 @@ class RustOcrBridge:
             input_dir: Directory containing MDX files
             output_dir: Output directory (defaults to input_dir)
             patterns: File patterns to match (defaults to ["*.mdx", "*.md"])
+            results_fp: Optional text stream; each file's record is written
+                to it as one NDJSON line as soon as the file is done, and the
+                returned summary then keeps only the counts (constant memory)
+            resume: Skip files recorded as done in output_dir/processed_keys.json
+                by an earlier (possibly interrupted) run
 
         Returns:
-            Summary of processing results
+            Summary of processing results: "counts" per status, plus the
+            "processed"/"skipped"/"errors" record lists when results_fp is None
         """
         if patterns is None:
             patterns = ["*.mdx", "*.md"]
@@ -712,41 +1323,104 @@ class RustOcrBridge:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        results = {
-            "processed": [],
-            "skipped": [],
-            "errors": [],
-        }
+        counts = {"processed": 0, "skipped": 0, "errors": 0}
+        results: Dict[str, Any] = {"counts": counts}
+        if results_fp is None:
+            results.update(processed=[], skipped=[], errors=[])
+
+        def emit(kind: str, status: str, record: Dict[str, Any], entry: Any = None) -> None:
+            """Count a file's record and stream it (or keep it when not streaming)"""
+            counts[kind] += 1
+            if results_fp is not None:
+                results_fp.write(_json_dumps({"status": status, **record}) + "\n")
+                results_fp.flush()
+            else:
+                results[kind].append(record if entry is None else entry)
+
+        state_path = output_path / RESUME_STATE_FILE
+        done_keys = self._load_resume_state(state_path) if resume else set()
+        unsaved = 0
 
-        for pattern in patterns:
-            for mdx_file in input_path.glob(pattern):
-                # Skip already processed files
-                if ".ocr." in mdx_file.name:
-                    results["skipped"].append(str(mdx_file))
-                    continue
-
-                try:
-                    print(f"Processing: {mdx_file.name}")
-                    output_file = output_path / f"{mdx_file.stem}.ocr{mdx_file.suffix}"
-
-                    ocr_results = self.process_rust_output(str(mdx_file))
-                    self.enhance_mdx_with_ocr(str(mdx_file), ocr_results, str(output_file))
-
-                    results["processed"].append({
-                        "input": str(mdx_file),
-                        "output": str(output_file),
-                        "images_processed": ocr_results["statistics"]["processed"],
-                    })
-                    print(f"  ✓ Enhanced with {ocr_results['statistics']['processed']} OCR results")
-                except Exception as e:
-                    results["errors"].append({
-                        "file": str(mdx_file),
-                        "error": str(e),
-                    })
-                    print(f"  ✗ Error: {e}")
+        try:
+            for pattern in patterns:
+                for mdx_file in input_path.glob(pattern):
+                    # Skip already processed files
+                    if ".ocr." in mdx_file.name:
+                        emit("skipped", "skipped", {"file": str(mdx_file)}, str(mdx_file))
+                        continue
+
+                    key = self._resume_key(mdx_file)
+                    if key in done_keys:
+                        emit(
+                            "skipped", "skipped",
+                            {"file": str(mdx_file), "reason": "resume"}, str(mdx_file),
+                        )
+                        continue
+
+                    try:
+                        print(f"Processing: {mdx_file.name}")
+                        output_file = output_path / f"{mdx_file.stem}.ocr{mdx_file.suffix}"
+
+                        content = mdx_file.read_text(encoding="utf-8")
+                        ocr_results = self.process_rust_output(str(mdx_file), content=content)
+                        self.enhance_mdx_with_ocr(
+                            str(mdx_file), ocr_results, str(output_file), content=content
+                        )
+
+                        record = {
+                            "input": str(mdx_file),
+                            "output": str(output_file),
+                            "images_processed": ocr_results["statistics"]["processed"],
+                        }
+                        emit("processed", "processed", record)
+                        print(f"  ✓ Enhanced with {ocr_results['statistics']['processed']} OCR results")
+                    except Exception as e:
+                        record = {
+                            "file": str(mdx_file),
+                            "error": str(e),
+                        }
+                        emit("errors", "error", record)
+                        print(f"  ✗ Error: {e}")
+                        continue
+
+                    if resume:
+                        done_keys.add(key)
+                        unsaved += 1
+                        if unsaved >= RESUME_FLUSH_EVERY:
+                            self._save_resume_state(state_path, done_keys)
+                            unsaved = 0
+        finally:
+            if resume and unsaved:
+                self._save_resume_state(state_path, done_keys)
 
         return results
 
+    @staticmethod
+    def _resume_key(mdx_file: Path) -> str:
+        """Identify a source file version (edited files are processed again)"""
+        stat = mdx_file.stat()
+        return f"{mdx_file.name}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    @staticmethod
+    def _load_resume_state(state_path: Path) -> set:
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                return set(json.load(f))
+        except (OSError, ValueError):
+            return set()
+
+    @staticmethod
+    def _save_resume_state(state_path: Path, done_keys: set) -> None:
+        """Write the resume state atomically (temp file + rename)"""
+        fd, temp_path = tempfile.mkstemp(dir=str(state_path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(sorted(done_keys), f)
+            os.replace(temp_path, state_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
 
 def main():
     """CLI entry point"""
@@ -812,6 +1486,43 @@ Examples:
         action="store_true",
         help="List available OpenRouter models",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Max images to OCR in parallel (default: OCR_CONCURRENCY env var or CPU count)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=4,
+        help="Images per OpenRouter request (default: 4)",
+    )
+    parser.add_argument(
+        "--text-probability-threshold",
+        type=float,
+        default=DEFAULT_TEXT_PROBABILITY_THRESHOLD,
+        help="Min share of sharp-edge pixels to OCR an image, skipping blank ones; "
+             f"0 disables the check (default: {DEFAULT_TEXT_PROBABILITY_THRESHOLD}, "
+             f"suggested: {SUGGESTED_TEXT_PROBABILITY_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the persistent OCR cache",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="OCR cache directory (default: MDM_OCR_CACHE_DIR env var or ~/.cache/mdm-media/ocr)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="With a directory input, skip files finished by an earlier run",
+    )
+    parser.add_argument(
+        "--results-ndjson",
+        help="With a directory input, append one JSON line per file to this path as it finishes",
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -843,41 +1554,52 @@ Examples:
         parser.error("Input file or directory is required (or use --list-models)")
 
     try:
-        bridge = RustOcrBridge(
+        with RustOcrBridge(
             ocr_engine=args.engine,
             language=args.lang,
             openrouter_api_key=args.api_key,
             openrouter_model=args.model,
             use_free_model=args.free_model,
-        )
-
-        if args.dir or os.path.isdir(args.input):
-            results = bridge.process_directory(args.input, args.output)
-            if args.json:
-                print(json.dumps(results, indent=2, ensure_ascii=False))
+            ocr_concurrency=args.concurrency,
+            batch_size=args.batch_size,
+            use_disk_cache=not args.no_cache,
+            cache_dir=args.cache_dir,
+            text_probability_threshold=args.text_probability_threshold,
+        ) as bridge:
+            if args.dir or os.path.isdir(args.input):
+                if args.results_ndjson:
+                    with open(args.results_ndjson, "a", encoding="utf-8") as results_fp:
+                        results = bridge.process_directory(
+                            args.input, args.output, results_fp=results_fp, resume=args.resume
+                        )
+                else:
+                    results = bridge.process_directory(args.input, args.output, resume=args.resume)
+                if args.json:
+                    print(_json_dumps(results, indent=True))
+                else:
+                    counts = results["counts"]
+                    print(f"\n✅ Processed {counts['processed']} files")
+                    if counts["errors"]:
+                        print(f"⚠️  {counts['errors']} errors")
             else:
-                print(f"\n✅ Processed {len(results['processed'])} files")
-                if results["errors"]:
-                    print(f"⚠️  {len(results['errors'])} errors")
-        else:
-            results = bridge.process_rust_output(args.input)
+                results = bridge.process_rust_output(args.input)
 
-            if args.json:
-                print(json.dumps(results, indent=2, ensure_ascii=False))
-            else:
-                # Enhance and save
-                if args.output:
-                    output_path = args.output
+                if args.json:
+                    print(_json_dumps(results, indent=True))
                 else:
-                    base = Path(args.input)
-                    output_path = str(base.parent / f"{base.stem}.ocr{base.suffix}")
-
-                bridge.enhance_mdx_with_ocr(args.input, results, output_path)
-
-                print(f"✅ Enhanced MDX saved to: {output_path}")
-                stats = results["statistics"]
-                print(f"   Images processed: {stats['processed']}/{stats['total_images']}")
-                print(f"   OCR engine: {stats['ocr_engine']}")
+                    # Enhance and save
+                    if args.output:
+                        output_path = args.output
+                    else:
+                        base = Path(args.input)
+                        output_path = str(base.parent / f"{base.stem}.ocr{base.suffix}")
+
+                    bridge.enhance_mdx_with_ocr(args.input, results, output_path)
+
+                    print(f"✅ Enhanced MDX saved to: {output_path}")
+                    stats = results["statistics"]
+                    print(f"   Images processed: {stats['processed']}/{stats['total_images']}")
+                    print(f"   OCR engine: {stats['ocr_engine']}")
 
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -6,37 +6,245 @@ Extracts text from images using OCR (Optical Character Recognition)
 import sys
 import os
 import json
+import contextlib
+import functools
+import mmap
+import queue
+import re
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
-# Try to import OCR libraries
 try:
-    import pytesseract
-    from PIL import Image
-    HAS_TESSERACT = True
+    import tesserocr  # In-process Tesseract API (no subprocess per image)
+    HAS_TESSEROCR = True
 except ImportError:
-    HAS_TESSERACT = False
+    HAS_TESSEROCR = False
+
+
+# OCR libraries are imported on first use: importing easyocr pulls in torch,
+# which would otherwise cost seconds on every `import ocr_processor`
+@functools.lru_cache(maxsize=None)
+def _pytesseract():
+    """pytesseract module, or None if it is not installed"""
+    try:
+        import pytesseract
+        return pytesseract
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _easyocr():
+    """easyocr module, or None if it is not installed"""
+    try:
+        import easyocr
+        return easyocr
+    except ImportError:
+        return None
+
+
+def __getattr__(name):
+    # HAS_TESSERACT / HAS_EASYOCR are computed (and the import paid) on access
+    if name == 'HAS_TESSERACT':
+        return _pytesseract() is not None
+    if name == 'HAS_EASYOCR':
+        return _easyocr() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Fixups for number-heavy scans (e.g. Bates stamps) that EasyOCR splits into
+# several boxes: re-join digit runs broken by a line break or a space
+_BATES_FIXUPS = [
+    (re.compile(r'\n(?=\d)'), ''),
+    (re.compile(r'(?<=\d) (?=\d)'), ''),
+]
+
+IMG_EXTS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff'})
+
+# Images below this side length, or with a grayscale standard deviation
+# under the threshold (blank pages, dividers), are not worth OCR'ing
+MIN_OCR_SIDE = 32
+BLANK_STDDEV_THRESHOLD = 5
+
+# Persistent OCR result cache (SQLite DB, keyed by engine, language and image hash)
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'mdm-media', 'ocr_processor.sqlite3')
+
+
+def _open_cache(cache_path):
+    """Open the result cache DB; WAL mode lets several processes share it"""
+    os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+    conn = sqlite3.connect(cache_path, timeout=30, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    with conn:
+        conn.execute('CREATE TABLE IF NOT EXISTS ocr (key TEXT PRIMARY KEY, text TEXT)')
+    return conn
+
+@contextlib.contextmanager
+def _open_image_mmap(image_path):
+    """
+    Open an image over a read-only memory map of the file
+    
+    PIL decodes straight from the mapped pages (kernel readahead, no
+    buffered read loop); the map is released when the block exits.
+    """
+    from PIL import Image
+    
+    with open(image_path, 'rb') as f:
+        try:
+            source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            source = f  # Empty file - nothing to map, let PIL report it
+        try:
+            with Image.open(source) as img:
+                yield img
+        finally:
+            if source is not f:
+                source.close()
+
+
+def _is_blank(image_path):
+    """True for images too small or too uniform to contain text"""
+    from PIL import ImageStat
+    
+    try:
+        with _open_image_mmap(image_path) as img:
+            if img.width < MIN_OCR_SIDE or img.height < MIN_OCR_SIDE:
+                return True
+            # Check a quarter-size image. JPEG can decode straight to a
+            # downscaled grayscale image; only reduce what draft() didn't
+            target_width, target_height = img.width // 4, img.height // 4
+            img.draft('L', (target_width, target_height))
+            gray = img.convert('L')
+            factor = min(gray.width // target_width, gray.height // target_height)
+            if factor > 1:
+                gray = gray.reduce(factor)
+    except Exception:
+        return False  # Let the OCR engine report unreadable files
+    return ImageStat.Stat(gray).stddev[0] < BLANK_STDDEV_THRESHOLD
+
+
+def _detect_device():
+    """Best available torch device for EasyOCR: 'cuda', 'mps' or 'cpu'"""
+    try:
+        import torch
+    except ImportError:
+        return 'cpu'
+    if torch.cuda.is_available():
+        return 'cuda'
+    mps = getattr(torch.backends, 'mps', None)
+    if mps is not None and mps.is_available():
+        return 'mps'
+    return 'cpu'
+
+
+def _quantize_recognizer(reader):
+    """Convert the CRNN recognizer's Linear/LSTM layers to dynamic INT8 (CPU only)"""
+    if reader.device != 'cpu':
+        print("Warning: INT8 quantization is CPU-only; keeping the FP32 recognizer")
+        return
+    import torch
+    
+    if 'fbgemm' in torch.backends.quantized.supported_engines:
+        torch.backends.quantized.engine = 'fbgemm'  # x86 int8 kernels (AVX2/VNNI)
+    reader.recognizer = torch.quantization.quantize_dynamic(
+        reader.recognizer, {torch.nn.Linear, torch.nn.LSTM}, dtype=torch.qint8
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_reader(langs, device, onnx=False, quantize=False):
+    """
+    Shared EasyOCR reader per (languages, device, backend) setting
+    
+    Loading the detector/recognizer weights takes seconds, so every
+    OcrProcessor in the process reuses the same warm reader.
+    """
+    # EasyOCR takes False for CPU or a torch device name
+    gpu = False if device == 'cpu' else device
+    try:
+        reader = _easyocr().Reader(list(langs), gpu=gpu, cudnn_benchmark=True)
+        print(f"EasyOCR device: {device}")
+    except Exception as e:
+        if device == 'cpu':
+            raise
+        print(f"Warning: EasyOCR failed on {device} ({e}); falling back to CPU")
+        reader = _easyocr().Reader(list(langs), gpu=False)
+    
+    if onnx:
+        try:
+            from ._onnx import use_onnx_detector
+        except ImportError:
+            from _onnx import use_onnx_detector
+        use_onnx_detector(reader)
+    if quantize:
+        _quantize_recognizer(reader)
+    return reader
+
+
+# Images per EasyOCR readtext_batched call
+EASYOCR_BATCH_SIZE = 16
+
+# Images decoded ahead of the one EasyOCR is working on
+PREFETCH_DEPTH = 4
+
+# Per-process OcrProcessor used by process_directory's worker pool
+_worker_processor = None
+
+
+def _ocr_worker(job):
+    """
+    Pool worker: OCR one image with a processor built once per process
+
+    Returns (text, error) so one bad image doesn't abort the whole map.
+    """
+    global _worker_processor
+    engine, lang, image_path = job
+    if _worker_processor is None:
+        # The parent process owns the cache and has already dropped
+        # blank images; workers only run OCR
+        _worker_processor = OcrProcessor(engine=engine, lang=lang, use_cache=False, skip_blank=False)
+    try:
+        return _worker_processor.extract_text(image_path), None
+    except Exception as e:
+        return None, str(e)
 
-try:
-    import easyocr
-    HAS_EASYOCR = True
-except ImportError:
-    HAS_EASYOCR = False
 
 class OcrProcessor:
-    def __init__(self, engine='auto', lang='kor+eng'):
+    def __init__(self, engine='auto', lang='kor+eng', use_cache=False, cache_path=None, device='auto',
+                 postprocess=False, onnx=False, quantize=False, skip_blank=True):
         """
         Initialize OCR processor
         
         Args:
             engine: 'tesseract', 'easyocr', or 'auto'
             lang: Language code (default: Korean + English)
+            use_cache: Reuse results for images with identical bytes, across
+                runs, via an on-disk cache (default: False)
+            cache_path: Cache DB path (default: ~/.cache/mdm-media/ocr_processor.sqlite3)
+            device: EasyOCR device - 'cpu', 'cuda', 'mps' or 'auto' (best available)
+            postprocess: Re-join digit runs split across EasyOCR boxes (default: False)
+            onnx: Run the EasyOCR text detector on ONNX Runtime (default: False)
+            quantize: INT8 dynamic quantization of the EasyOCR recognizer, CPU only (default: False)
+            skip_blank: Return '' without OCR for tiny or near-uniform images (default: True)
         """
         self.lang = lang
+        self.postprocess = postprocess
+        self._cache = None
+        self._cache_lock = threading.Lock()
+        if use_cache:
+            cache_path = cache_path or DEFAULT_CACHE_PATH
+            try:
+                self._cache = _open_cache(cache_path)
+            except Exception as e:
+                # e.g. unwritable cache directory - run uncached
+                print(f"Warning: OCR cache disabled ({e})")
         
         if engine == 'auto':
-            if HAS_EASYOCR:
+            if _easyocr() is not None:
                 self.engine = 'easyocr'
-            elif HAS_TESSERACT:
+            elif HAS_TESSEROCR or _pytesseract() is not None:
                 self.engine = 'tesseract'
             else:
                 raise ImportError(
@@ -46,11 +254,24 @@ class OcrProcessor:
         else:
             self.engine = engine
         
-        # Initialize EasyOCR reader if using it
-        if self.engine == 'easyocr' and HAS_EASYOCR:
-            # Parse languages
-            langs = ['ko', 'en'] if 'kor' in lang else ['en']
-            self.reader = easyocr.Reader(langs)
+        # EasyOCR reader settings (the reader itself is loaded on first use)
+        self._langs = ('ko', 'en') if 'kor' in lang else ('en',)
+        self.device = device
+        self.onnx = onnx
+        self.quantize = quantize
+        self.skip_blank = skip_blank
+        # One TessBaseAPI per thread - the API is not reentrant. Every API
+        # created is also listed so close() can end those of other threads
+        self._tess_local = threading.local()
+        self._tess_apis = []
+        self._tess_apis_lock = threading.Lock()
+    
+    @property
+    def reader(self):
+        """Shared EasyOCR reader for this processor's languages"""
+        if self.device == 'auto':
+            self.device = _detect_device()
+        return _get_reader(self._langs, self.device, self.onnx, self.quantize)
     
     def extract_text(self, image_path):
         """
@@ -67,6 +288,19 @@ class OcrProcessor:
         if not image_path.exists():
             raise FileNotFoundError(f"Image not found: {image_path}")
         
+        key = self._cache_key(image_path)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        text = self._run_engine(image_path)
+        self._cache_put(key, text)
+        return text
+    
+    def _run_engine(self, image_path):
+        """Run the configured OCR engine on one image (no caching)"""
+        if self.skip_blank and _is_blank(image_path):
+            return ''
         if self.engine == 'tesseract':
             return self._extract_tesseract(image_path)
         elif self.engine == 'easyocr':
@@ -74,50 +308,219 @@ class OcrProcessor:
         else:
             raise ValueError(f"Unknown engine: {self.engine}")
     
+    def _cache_key(self, image_path):
+        """Cache key from engine, language and a BLAKE2b digest of the image bytes"""
+        if self._cache is None:
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        with open(image_path, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    digest.update(mapped)
+            except ValueError:
+                pass  # Empty file
+        suffix = ':pp' if self.postprocess else ''
+        if self.quantize and self.engine == 'easyocr':
+            suffix += ':int8'
+        return f"{self.engine}:{self.lang}:{digest.hexdigest()}{suffix}"
+    
+    def _cache_get(self, key):
+        if key is None:
+            return None
+        with self._cache_lock:
+            row = self._cache.execute('SELECT text FROM ocr WHERE key = ?', (key,)).fetchone()
+        return row[0] if row is not None else None
+    
+    def _cache_put(self, key, text):
+        if key is None:
+            return
+        with self._cache_lock, self._cache:
+            self._cache.execute('INSERT OR REPLACE INTO ocr (key, text) VALUES (?, ?)', (key, text))
+    
+    def close(self):
+        """Flush and close the result cache and end every thread's Tesseract API"""
+        with self._cache_lock:
+            if self._cache is not None:
+                self._cache.close()
+                self._cache = None
+        with self._tess_apis_lock:
+            apis, self._tess_apis = self._tess_apis, []
+            # Threads that OCR again after close() get a fresh API
+            self._tess_local = threading.local()
+        for api in apis:
+            api.End()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
     def _extract_tesseract(self, image_path):
         """Extract text using Tesseract"""
-        if not HAS_TESSERACT:
+        if HAS_TESSEROCR:
+            local = self._tess_local
+            api = getattr(local, 'api', None)
+            if api is None:
+                api = local.api = tesserocr.PyTessBaseAPI(lang=self.lang)
+                with self._tess_apis_lock:
+                    self._tess_apis.append(api)
+            api.SetImageFile(str(image_path))
+            return api.GetUTF8Text().strip()
+        pytesseract = _pytesseract()
+        if pytesseract is None:
             raise ImportError("pytesseract not installed")
         
-        image = Image.open(image_path)
-        text = pytesseract.image_to_string(image, lang=self.lang)
+        with _open_image_mmap(image_path) as image:
+            text = pytesseract.image_to_string(image, lang=self.lang)
         return text.strip()
     
     def _extract_easyocr(self, image_path):
         """Extract text using EasyOCR"""
-        if not HAS_EASYOCR:
+        if _easyocr() is None:
+            raise ImportError("easyocr not installed")
+        
+        return self._join_results(self.reader.readtext(str(image_path)))
+    
+    def _join_results(self, results):
+        """Join EasyOCR (bbox, text, confidence) results into one string"""
+        text = '\n'.join(result[1] for result in results)
+        if self.postprocess:
+            for pattern, replacement in _BATES_FIXUPS:
+                text = pattern.sub(replacement, text)
+        return text
+    
+    def extract_text_batch(self, image_paths, n_width=None, n_height=None, batch_size=EASYOCR_BATCH_SIZE):
+        """
+        Extract text from several images in one EasyOCR batched call
+        
+        Images must share a size unless n_width/n_height are given (then
+        EasyOCR resizes them). Other engines, or a batch that runs out of
+        GPU memory, fall back to one call per image.
+        
+        Args:
+            image_paths: Paths to image files
+            n_width, n_height: Optional common size to resize to
+            batch_size: Images per GPU batch
+            
+        Returns:
+            List of extracted text, in input order
+        """
+        if self.engine != 'easyocr':
+            return [self.extract_text(path) for path in image_paths]
+        if _easyocr() is None:
             raise ImportError("easyocr not installed")
         
-        results = self.reader.readtext(str(image_path))
-        texts = [result[1] for result in results]
-        return '\n'.join(texts)
+        try:
+            batched = self.reader.readtext_batched(
+                [str(path) for path in image_paths],
+                n_width=n_width, n_height=n_height, batch_size=batch_size,
+            )
+        except RuntimeError as e:
+            if 'out of memory' not in str(e).lower():
+                raise
+            return [self._extract_easyocr(Path(path)) for path in image_paths]
+        
+        return [self._join_results(results) for results in batched]
+    
+    def warmup(self, batch_size=EASYOCR_BATCH_SIZE, width=800, height=600):
+        """Run one dummy EasyOCR batch so model load / cuDNN tuning happen up front"""
+        if self.engine != 'easyocr' or _easyocr() is None:
+            return
+        import numpy as np
+        self.reader.readtext_batched(
+            np.zeros([batch_size, height, width, 3], dtype=np.uint8), batch_size=batch_size
+        )
     
-    def process_directory(self, input_dir, output_file=None):
+    def process_directory(self, input_dir, output_file=None, max_workers=None):
         """
         Process all images in a directory
         
+        Cached images are answered up front. Of the rest, Tesseract runs in
+        a process pool (one processor per worker process), EasyOCR in
+        same-size GPU batches - or, on CPU, in a process pool sharing one
+        reader's weights - and anything else in a thread pool.
+        
         Args:
             input_dir: Directory containing images
             output_file: Optional output file for combined text
+            max_workers: Pool size (default: CPU count)
             
         Returns:
             Dict mapping image names to extracted text
         """
-        input_path = Path(input_dir)
         results = {}
         
-        image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff'}
+        # scandir hands back names/paths (and file type) without a Path per entry
+        names = []
+        image_files = []
+        with os.scandir(input_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                dot = name.rfind('.')
+                if dot > 0 and name[dot:].lower() in IMG_EXTS and entry.is_file():
+                    names.append(name)
+                    image_files.append(entry.path)
+        max_workers = max_workers or os.cpu_count() or 1
         
-        for image_file in input_path.iterdir():
-            if image_file.suffix.lower() in image_extensions:
-                print(f"Processing: {image_file.name}")
+        # Answer cache hits before starting any OCR
+        outcomes = [None] * len(image_files)
+        keys = [self._cache_key(image_file) for image_file in image_files]
+        misses = []
+        for index, key in enumerate(keys):
+            cached = self._cache_get(key)
+            if cached is not None:
+                outcomes[index] = (cached, None)
+            else:
+                misses.append(index)
+        if self.skip_blank:
+            blank = {index for index in misses if _is_blank(image_files[index])}
+            for index in blank:
+                outcomes[index] = ('', None)
+            misses = [index for index in misses if index not in blank]
+        miss_files = [image_files[index] for index in misses]
+        
+        if self.engine == 'tesseract' and max_workers > 1 and len(miss_files) > 1:
+            jobs = [(self.engine, self.lang, image_file) for image_file in miss_files]
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                miss_outcomes = list(executor.map(_ocr_worker, jobs, chunksize=4))
+        elif self.engine == 'easyocr' and _easyocr() is not None:
+            reader = self.reader  # resolves self.device
+            if self._use_easyocr_pool(len(miss_files), max_workers):
                 try:
-                    text = self.extract_text(image_file)
-                    results[image_file.name] = text
-                    print(f"  ✓ Extracted {len(text)} characters")
+                    from ._pool import EasyOcrPool
+                except ImportError:
+                    from _pool import EasyOcrPool
+                with EasyOcrPool(reader, processes=max_workers) as pool:
+                    miss_outcomes = [
+                        (None, error) if error is not None else (self._join_results(found), None)
+                        for found, error in pool.map(miss_files)
+                    ]
+            else:
+                miss_outcomes = self._process_easyocr_batches(miss_files)
+        else:
+            def run(image_file):
+                try:
+                    return self.extract_text(image_file), None
                 except Exception as e:
-                    print(f"  ✗ Error: {e}")
-                    results[image_file.name] = f"Error: {e}"
+                    return None, str(e)
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                miss_outcomes = list(executor.map(run, miss_files))
+        
+        for index, (text, error) in zip(misses, miss_outcomes):
+            outcomes[index] = (text, error)
+            if error is None:
+                self._cache_put(keys[index], text)
+        
+        for name, (text, error) in zip(names, outcomes):
+            print(f"Processing: {name}")
+            if error is None:
+                results[name] = text
+                print(f"  ✓ Extracted {len(text)} characters")
+            else:
+                print(f"  ✗ Error: {error}")
+                results[name] = f"Error: {error}"
         
         if output_file:
             with open(output_file, 'w', encoding='utf-8') as f:
@@ -126,6 +529,97 @@ class OcrProcessor:
             print(f"✓ Saved combined output to: {output_file}")
         
         return results
+    
+    def _use_easyocr_pool(self, image_count, max_workers):
+        """
+        Whether process_directory should OCR on CPU through an EasyOcrPool
+
+        The pool shares the reader's torch modules with spawned workers, so
+        it can't take an ONNX Runtime detector (no share_memory, session
+        can't be pickled) or a quantized recognizer.
+        """
+        return (
+            self.device == 'cpu'
+            and not (self.onnx or self.quantize)
+            and max_workers > 1
+            and image_count > max_workers
+        )
+    
+    def _process_easyocr_batches(self, image_files):
+        """
+        Batch same-sized images through EasyOCR; the rest run one at a time
+        with prefetched decoding. Returns (text, error) per image.
+        """
+        from PIL import Image
+        
+        outcomes = [None] * len(image_files)
+        singles = []
+        groups = {}
+        for index, image_file in enumerate(image_files):
+            try:
+                with Image.open(image_file) as img:
+                    size = img.size
+            except Exception:
+                size = None  # Unreadable here; let EasyOCR report it on its own
+            groups.setdefault(size, []).append(index)
+        
+        for size, indices in groups.items():
+            chunks = [indices] if size is None else [
+                indices[i:i + EASYOCR_BATCH_SIZE]
+                for i in range(0, len(indices), EASYOCR_BATCH_SIZE)
+            ]
+            for chunk in chunks:
+                if size is not None and len(chunk) > 1:
+                    try:
+                        texts = self.extract_text_batch([image_files[i] for i in chunk])
+                        for i, text in zip(chunk, texts):
+                            outcomes[i] = (text, None)
+                        continue
+                    except Exception:
+                        pass  # Retry one by one to attribute the failure
+                singles.extend(chunk)
+        
+        single_outcomes = self._readtext_prefetched([image_files[i] for i in singles])
+        for i, outcome in zip(singles, single_outcomes):
+            outcomes[i] = outcome
+        return outcomes
+    
+    def _readtext_prefetched(self, image_files, depth=PREFETCH_DEPTH):
+        """
+        EasyOCR images one at a time while a background thread decodes the next
+        
+        Image decoding overlaps with detection/recognition (torch releases
+        the GIL), so the device isn't left idle between images.
+        
+        Returns:
+            (text, error) per image, in input order
+        """
+        import numpy as np
+        
+        decoded = queue.Queue(maxsize=depth)
+        
+        def produce():
+            for image_file in image_files:
+                try:
+                    with _open_image_mmap(image_file) as img:
+                        decoded.put((np.asarray(img.convert('RGB')), None))
+                except Exception as e:
+                    decoded.put((None, str(e)))
+        
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        outcomes = []
+        for _ in image_files:
+            pixels, error = decoded.get()
+            if error is None:
+                try:
+                    outcomes.append((self._join_results(self.reader.readtext(pixels)), None))
+                except Exception as e:
+                    outcomes.append((None, str(e)))
+            else:
+                outcomes.append((None, error))
+        producer.join()
+        return outcomes
 
 def main():
     if len(sys.argv) < 2:
@@ -150,18 +644,17 @@ def main():
         args = args[:idx] + args[idx+2:]
     
     try:
-        processor = OcrProcessor(engine=engine)
-        
-        if args[0] == '--dir':
-            input_dir = args[1]
-            output_file = args[2] if len(args) > 2 else None
-            results = processor.process_directory(input_dir, output_file)
-            print(f"\n✅ Processed {len(results)} images")
-        else:
-            image_path = args[0]
-            text = processor.extract_text(image_path)
-            print("\n=== Extracted Text ===")
-            print(text)
+        with OcrProcessor(engine=engine, use_cache=True) as processor:
+            if args[0] == '--dir':
+                input_dir = args[1]
+                output_file = args[2] if len(args) > 2 else None
+                results = processor.process_directory(input_dir, output_file)
+                print(f"\n✅ Processed {len(results)} images")
+            else:
+                image_path = args[0]
+                text = processor.extract_text(image_path)
+                print("\n=== Extracted Text ===")
+                print(text)
     except ImportError as e:
         print(f"❌ {e}")
         sys.exit(1)
@@ -1,13 +1,95 @@
 import sys
 import os
+import re
+import functools
+import hashlib
+import operator
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 try:
-    import pdfplumber
+    import pypdfium2 as pdfium
 except ImportError:
-    pdfplumber = None
+    pdfium = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+@functools.lru_cache(maxsize=None)
+def _pdfplumber():
+    """pdfplumber module (imported on first use), or None if not installed"""
+    try:
+        import pdfplumber
+        return pdfplumber
+    except ImportError:
+        return None
+
+
+# Upper bound on threads used for page text extraction
+MAX_TEXT_WORKERS = 8
+
+# Bounding box of a pdfplumber image object, fetched in one call
+BBOX_FIELDS = ('x0', 'top', 'x1', 'bottom')
+_bbox_of = operator.itemgetter(*BBOX_FIELDS)
+
+# Text cleanup: collapse runs of spaces/tabs (line breaks are kept) and
+# re-join words hyphenated across a line break
+_HYPHEN_BREAK_RE = re.compile(r'-\n')
+_SPACE_RUN_RE = re.compile(r'[ \t]+')
+
+_SPACE_RUN, _HYPHEN_BREAK = 0, 1
+_CLEANUP_REPLACEMENTS = {_SPACE_RUN: b' ', _HYPHEN_BREAK: b''}
+_cleanup_db = None
+if hyperscan is not None:
+    _cleanup_db = hyperscan.Database()
+    _cleanup_db.compile(
+        expressions=[rb'[ \t]+', rb'-\n'],
+        ids=[_SPACE_RUN, _HYPHEN_BREAK],
+        elements=2,
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * 2,
+    )
+
+
+def cleanup_text(text):
+    """
+    Normalize extracted PDF text
+
+    Collapses space/tab runs to one space and removes hyphenated line
+    breaks. Uses a Hyperscan database (one SIMD pass for both patterns)
+    when hyperscan is installed, precompiled re patterns otherwise.
+    """
+    if _cleanup_db is None:
+        return _HYPHEN_BREAK_RE.sub('', _SPACE_RUN_RE.sub(' ', text))
+
+    data = text.encode('utf-8')
+    # Hyperscan reports every match end, e.g. (5,6), (5,7), (5,8) for one
+    # run of three spaces; keep the longest match per start offset
+    spans = {}
+
+    def on_match(pattern_id, start, end, flags, context):
+        if end > spans.get(start, (None, -1))[1]:
+            spans[start] = (pattern_id, end)
+
+    _cleanup_db.scan(data, match_event_handler=on_match)
+
+    out = bytearray()
+    pos = 0
+    for start in sorted(spans):
+        if start < pos:
+            continue  # Inside a run already replaced
+        pattern_id, end = spans[start]
+        out += data[pos:start]
+        out += _CLEANUP_REPLACEMENTS[pattern_id]
+        pos = end
+    out += data[pos:]
+    return out.decode('utf-8')
 
 class PdfProcessor:
-    def __init__(self, file_path):
+    def __init__(self, file_path, max_workers=None):
         self.file_path = file_path
+        self.max_workers = max_workers or min(MAX_TEXT_WORKERS, os.cpu_count() or 1)
         self.validate_file()
 
     def validate_file(self):
@@ -20,50 +102,189 @@ class PdfProcessor:
         """
         Extract text from PDF
         """
+        pdfplumber = _pdfplumber()
         if not pdfplumber:
             print("pdfplumber not installed")
             return
 
         with pdfplumber.open(self.file_path) as pdf:
-            text = []
+            page_count = len(pdf.pages)
+        if self.max_workers <= 1 or page_count < 2:
+            return "\n".join(self.iter_page_text())
+
+        # Each worker opens its own handle on a contiguous page range;
+        # a single pdfplumber document is not safe to share across threads
+        workers = min(self.max_workers, page_count)
+        step = -(-page_count // workers)
+        ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            chunks = list(executor.map(self._extract_page_range, ranges))
+        return "\n".join(text for chunk in chunks for text in chunk)
+
+    def iter_page_text(self):
+        """
+        Yield each page's text in order
+
+        Pages are closed as soon as they are read, so only one page's
+        character data is held in memory at a time.
+        """
+        pdfplumber = _pdfplumber()
+        with pdfplumber.open(self.file_path) as pdf:
             for page in pdf.pages:
-                text.append(page.extract_text())
-            return "\n".join(text)
+                try:
+                    yield page.extract_text() or ""
+                finally:
+                    page.close()
+
+    def write_text(self, out_path):
+        """
+        Stream the PDF's text to out_path page by page
+
+        Returns the number of pages written.
+        """
+        pdfplumber = _pdfplumber()
+        if not pdfplumber:
+            print("pdfplumber not installed")
+            return 0
+
+        page_count = 0
+        with open(out_path, 'w', encoding='utf-8') as f:
+            for text in self.iter_page_text():
+                if page_count:
+                    f.write("\n")
+                f.write(text)
+                page_count += 1
+        return page_count
+
+    def extract_text_fast(self):
+        """
+        Extract text through PDFium's native text layer
+
+        Skips pdfplumber's per-character layout objects entirely; falls
+        back to extract_text() when pypdfium2 is not installed. Lines come
+        in content-stream order, so text drawn out of reading order (e.g.
+        footers written before the body) may be placed differently than
+        extract_text() places it.
+        """
+        if not pdfium:
+            return self.extract_text()
+
+        # PDFium is not thread-safe, so pages are read sequentially
+        pdf = pdfium.PdfDocument(self.file_path)
+        try:
+            texts = []
+            for i in range(len(pdf)):
+                page = pdf.get_page(i)
+                textpage = page.get_textpage()
+                try:
+                    # PDFium ends lines with \r\n; match pdfplumber's \n
+                    text = textpage.get_text_range()
+                    texts.append(text.replace("\r\n", "\n").replace("\r", "\n"))
+                finally:
+                    textpage.close()
+                    page.close()
+            return "\n".join(texts)
+        finally:
+            pdf.close()
+
+    def _extract_page_range(self, page_range):
+        """Extract text for pages [start, end) with a private pdfplumber handle"""
+        start, end = page_range
+        texts = []
+        pdfplumber = _pdfplumber()
+        with pdfplumber.open(self.file_path) as pdf:
+            for i in range(start, end):
+                page = pdf.pages[i]
+                texts.append(page.extract_text() or "")
+                page.close()
+        return texts
 
     def extract_images(self, output_dir):
         """
         Extract images from PDF
+
+        An image embedded on several pages (logos, headers) is listed once;
+        its 'pages' field names every page it appears on.
         """
         os.makedirs(output_dir, exist_ok=True)
         
+        pdfplumber = _pdfplumber()
         if not pdfplumber:
             print("pdfplumber not installed - cannot extract images")
             return []
         
         images = []
+        seen = {}
+        # Join the directory once; per-image paths are plain concatenation
+        prefix = os.path.join(output_dir, '')
         
         with pdfplumber.open(self.file_path) as pdf:
             for page_num, page in enumerate(pdf.pages):
                 if hasattr(page, 'images'):
                     for img_num, img in enumerate(page.images):
+                        key = self._image_key(img)
+                        entry = seen.get(key)
+                        if entry is not None:
+                            if entry['pages'][-1] != page_num + 1:
+                                entry['pages'].append(page_num + 1)
+                            continue
+                        
                         # Save image info
                         img_filename = f"page{page_num+1}_img{img_num+1}.png"
-                        img_path = os.path.join(output_dir, img_filename)
+                        img_path = prefix + img_filename
                         
-                        images.append({
+                        entry = {
                             'page': page_num + 1,
+                            'pages': [page_num + 1],
                             'filename': img_filename,
                             'path': img_path,
-                            'bbox': (img.get('x0'), img.get('top'), 
-                                   img.get('x1'), img.get('bottom'))
-                        })
+                            'bbox': _bbox_of(img)
+                        }
+                        seen[key] = entry
+                        images.append(entry)
         
         return images
     
+    @staticmethod
+    def bbox_columns(images):
+        """
+        Bounding boxes of extract_images() results as per-field columns
+
+        Returns {'x0', 'top', 'x1', 'bottom': float32 column, 'filename': list},
+        so callers can select regions with array predicates (e.g. tops < 100
+        for page headers) instead of looping over dicts. Columns are NumPy
+        arrays when numpy is installed, array('f') otherwise.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        boxes = [image['bbox'] for image in images]
+        if np is not None:
+            table = np.array(boxes, dtype=np.float32).reshape(-1, len(BBOX_FIELDS))
+            columns = {field: np.ascontiguousarray(table[:, i]) for i, field in enumerate(BBOX_FIELDS)}
+        else:
+            columns = {field: array('f', (box[i] for box in boxes)) for i, field in enumerate(BBOX_FIELDS)}
+        columns['filename'] = [image['filename'] for image in images]
+        return columns
+    
+    @staticmethod
+    def _image_key(img):
+        """Identity of an embedded image: its PDF object id, else a content hash"""
+        stream = img.get('stream')
+        if stream is None:
+            return object()  # Nothing to compare; never deduplicated
+        if stream.objid is not None:
+            return stream.objid
+        # Inline images have no object id
+        return hashlib.blake2b(stream.get_rawdata() or b'', digest_size=16).digest()
+    
     def extract_metadata(self):
         """
         Extract PDF metadata
         """
+        pdfplumber = _pdfplumber()
         if not pdfplumber:
             return {}
         
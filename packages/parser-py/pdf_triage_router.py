@@ -349,7 +349,8 @@ class TriageRouter:
             except ImportError:
                 from .ocr_processor import OcrProcessor  # type: ignore
             lang = self.lang if cjk_hint else "eng"
-            return OcrProcessor(engine=self.engine, lang=lang).extract_text(str(image_path))
+            with OcrProcessor(engine=self.engine, lang=lang) as processor:
+                return processor.extract_text(str(image_path))
 
         if self.engine == "openrouter":
             try:
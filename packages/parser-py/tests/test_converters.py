@@ -7,6 +7,7 @@ import os
 import sys
 import tempfile
 import shutil
+import threading
 from pathlib import Path
 
 # Add parent directory to path
@@ -36,6 +37,52 @@ class TestHwpToSvg(unittest.TestCase):
                 HwpToSvgConverter(temp_path)
         finally:
             os.unlink(temp_path)
+        
+        # Empty HWP files are rejected up front
+        with tempfile.NamedTemporaryFile(suffix='.hwp', delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            with self.assertRaises(ValueError):
+                HwpToSvgConverter(temp_path)
+        finally:
+            os.unlink(temp_path)
+    
+    def test_render_table_to_svg(self):
+        """Test table rendering produces a well-formed SVG"""
+        import xml.etree.ElementTree as ET
+        import hwp_to_svg
+        
+        if not (hwp_to_svg.HAS_LXML or hwp_to_svg.HAS_SVGWRITE):
+            self.skipTest("lxml or svgwrite required")
+        
+        test_dir = tempfile.mkdtemp()
+        try:
+            hwp_path = os.path.join(test_dir, 'sample.hwp')
+            with open(hwp_path, 'wb') as f:
+                f.write(b'\xd0\xcf\x11\xe0')
+            svg_path = os.path.join(test_dir, 'table.svg')
+            
+            converter = hwp_to_svg.HwpToSvgConverter(hwp_path)
+            converter.render_table_to_svg(
+                {'rows': [['A', 'B', 'C'], ['1', '2', '3']]}, svg_path
+            )
+            
+            root = ET.parse(svg_path).getroot()
+            self.assertEqual(root.tag, '{http://www.w3.org/2000/svg}svg')
+            rects = root.findall('{http://www.w3.org/2000/svg}rect')
+            texts = root.findall('{http://www.w3.org/2000/svg}text')
+            self.assertEqual(len(rects), 7)  # background + 6 cells
+            self.assertEqual([t.text for t in texts], ['A', 'B', 'C', '1', '2', '3'])
+            
+            # Tiny tables take the template fast path; text must stay escaped
+            converter.render_table_to_svg({'rows': [['<a & b>'], ['x']]}, svg_path)
+            root = ET.parse(svg_path).getroot()
+            texts = root.findall('{http://www.w3.org/2000/svg}text')
+            self.assertEqual([t.text for t in texts], ['<a & b>', 'x'])
+            self.assertEqual(root.get('width'), '140')
+        finally:
+            shutil.rmtree(test_dir)
 
 class TestPdfProcessor(unittest.TestCase):
     """Test PDF processor"""
@@ -51,6 +98,112 @@ class TestPdfProcessor(unittest.TestCase):
         
         with self.assertRaises(FileNotFoundError):
             PdfProcessor('nonexistent.pdf')
+    
+    def test_parallel_text_matches_sequential(self):
+        """Test threaded page extraction keeps page order"""
+        import pdf_processor
+        
+        sample = Path(__file__).resolve().parents[3] / 'tests' / 'pdf_benchmark' / 'test_headers_footers.pdf'
+        if pdf_processor._pdfplumber() is None or not sample.exists():
+            self.skipTest("pdfplumber and sample PDF required")
+        
+        sequential = pdf_processor.PdfProcessor(str(sample), max_workers=1).extract_text()
+        parallel = pdf_processor.PdfProcessor(str(sample), max_workers=2).extract_text()
+        self.assertEqual(parallel, sequential)
+        self.assertTrue(sequential.strip())
+    
+    def test_fast_text_matches_pdfplumber_text(self):
+        """Test PDFium text path (or its fallback) gives the same lines"""
+        import pdf_processor
+        
+        sample = Path(__file__).resolve().parents[3] / 'tests' / 'pdf_benchmark' / 'test_comprehensive.pdf'
+        if pdf_processor._pdfplumber() is None or not sample.exists():
+            self.skipTest("pdfplumber and sample PDF required")
+        
+        def lines(text):
+            return [' '.join(line.split()) for line in text.splitlines() if line.strip()]
+        
+        processor = pdf_processor.PdfProcessor(str(sample), max_workers=1)
+        fast = processor.extract_text_fast()
+        self.assertNotIn('\r', fast)
+        self.assertTrue(lines(fast))
+        self.assertEqual(lines(fast), lines(processor.extract_text()))
+    
+    def test_write_text_streams_same_text(self):
+        """Test streamed page output matches extract_text"""
+        import pdf_processor
+        
+        sample = Path(__file__).resolve().parents[3] / 'tests' / 'pdf_benchmark' / 'test_headers_footers.pdf'
+        if pdf_processor._pdfplumber() is None or not sample.exists():
+            self.skipTest("pdfplumber and sample PDF required")
+        
+        processor = pdf_processor.PdfProcessor(str(sample), max_workers=1)
+        with tempfile.TemporaryDirectory() as tmp:
+            out_path = os.path.join(tmp, 'out.txt')
+            pages = processor.write_text(out_path)
+            with open(out_path, encoding='utf-8') as f:
+                self.assertEqual(f.read(), processor.extract_text())
+        self.assertEqual(pages, processor.extract_metadata()['pages'])
+    
+    def test_shared_image_is_listed_once(self):
+        """Test an image XObject drawn on every page yields one entry"""
+        import pdf_processor
+        
+        if pdf_processor._pdfplumber() is None:
+            self.skipTest("pdfplumber required")
+        
+        # Two pages drawing the same 1x1 image object (5 0 R)
+        content = b"q 10 0 0 10 0 0 cm /Im0 Do Q"
+        objects = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [3 0 R 4 0 R] /Count 2 >>",
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 50 50] /Contents 6 0 R "
+            b"/Resources << /XObject << /Im0 5 0 R >> >> >>",
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 50 50] /Contents 6 0 R "
+            b"/Resources << /XObject << /Im0 5 0 R >> >> >>",
+            b"<< /Type /XObject /Subtype /Image /Width 1 /Height 1 /ColorSpace /DeviceGray "
+            b"/BitsPerComponent 8 /Length 1 >>\nstream\n\x80\nendstream",
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+        ]
+        pdf = bytearray(b"%PDF-1.4\n")
+        offsets = []
+        for number, body in enumerate(objects, 1):
+            offsets.append(len(pdf))
+            pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+        xref = len(pdf)
+        pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+        pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'logo.pdf')
+            with open(path, 'wb') as f:
+                f.write(pdf)
+            images = pdf_processor.PdfProcessor(path).extract_images(tmp)
+        
+        self.assertEqual(len(images), 1)
+        self.assertEqual(images[0]['pages'], [1, 2])
+    
+    def test_bbox_columns(self):
+        """Test image boxes are split into per-field columns"""
+        from pdf_processor import PdfProcessor
+        
+        images = [
+            {'filename': 'page1_img1.png', 'bbox': (0.0, 10.0, 50.0, 40.0)},
+            {'filename': 'page1_img2.png', 'bbox': (5.0, 300.0, 80.0, 420.0)},
+        ]
+        columns = PdfProcessor.bbox_columns(images)
+        
+        self.assertEqual(list(columns['top']), [10.0, 300.0])
+        self.assertEqual(list(columns['x1']), [50.0, 80.0])
+        self.assertEqual(columns['filename'], ['page1_img1.png', 'page1_img2.png'])
+        self.assertEqual(len(PdfProcessor.bbox_columns([])['x0']), 0)
+    
+    def test_cleanup_text(self):
+        """Test whitespace collapse and de-hyphenation"""
+        from pdf_processor import cleanup_text
+        
+        self.assertEqual(cleanup_text("exam-\nple  text\t\there\nnext"), "example text here\nnext")
 
 class TestOcrProcessor(unittest.TestCase):
     """Test OCR processor"""
@@ -62,12 +215,160 @@ class TestOcrProcessor(unittest.TestCase):
     
     def test_engine_detection(self):
         """Test OCR engine detection"""
-        from ocr_processor import HAS_TESSERACT, HAS_EASYOCR
+        from ocr_processor import _pytesseract, _easyocr
         
         # At least report available engines
         print(f"\nOCR Engines available:")
-        print(f"  Tesseract: {HAS_TESSERACT}")
-        print(f"  EasyOCR: {HAS_EASYOCR}")
+        print(f"  Tesseract: {_pytesseract() is not None}")
+        print(f"  EasyOCR: {_easyocr() is not None}")
+    
+    def test_process_directory_collects_every_image(self):
+        """Test the pooled directory run keeps one entry per image"""
+        from ocr_processor import OcrProcessor
+        
+        class FakeOcrProcessor(OcrProcessor):
+            def extract_text(self, image_path):
+                if Path(image_path).stem == 'bad':
+                    raise ValueError('unreadable')
+                return Path(image_path).stem.upper()
+        
+        test_dir = tempfile.mkdtemp()
+        try:
+            for name in ['a.png', 'b.JPG', 'bad.png', 'notes.txt']:
+                Path(test_dir, name).write_bytes(b'')
+            
+            processor = FakeOcrProcessor(engine='fake', use_cache=False)
+            results = processor.process_directory(test_dir, max_workers=2)
+            
+            self.assertEqual(results['a.png'], 'A')
+            self.assertEqual(results['b.JPG'], 'B')
+            self.assertEqual(results['bad.png'], 'Error: unreadable')
+            self.assertNotIn('notes.txt', results)
+        finally:
+            shutil.rmtree(test_dir)
+
+    def test_result_cache_skips_repeated_images(self):
+        """Test identical image bytes are OCR'd once, across paths and instances"""
+        from ocr_processor import OcrProcessor
+        
+        calls = []
+        
+        class CountingOcrProcessor(OcrProcessor):
+            def _run_engine(self, image_path):
+                calls.append(image_path.name)
+                return 'logo text'
+        
+        test_dir = tempfile.mkdtemp()
+        try:
+            for name in ['p1.png', 'p2.png']:
+                Path(test_dir, name).write_bytes(b'same bytes')
+            cache_path = os.path.join(test_dir, 'cache', 'ocr.sqlite3')
+            
+            with CountingOcrProcessor(engine='fake', use_cache=True, cache_path=cache_path) as processor:
+                self.assertEqual(processor.extract_text(Path(test_dir, 'p1.png')), 'logo text')
+                self.assertEqual(processor.extract_text(Path(test_dir, 'p2.png')), 'logo text')
+            with CountingOcrProcessor(engine='fake', use_cache=True, cache_path=cache_path) as processor:
+                processor.extract_text(Path(test_dir, 'p1.png'))
+            
+            self.assertEqual(calls, ['p1.png'])
+        finally:
+            shutil.rmtree(test_dir)
+    
+    def test_blank_images_skip_ocr(self):
+        """Test tiny and uniform images are answered without running OCR"""
+        from PIL import Image, ImageDraw
+        from ocr_processor import OcrProcessor
+        
+        class CountingOcrProcessor(OcrProcessor):
+            def _extract_tesseract(self, image_path):
+                return Path(image_path).name
+        
+        test_dir = tempfile.mkdtemp()
+        try:
+            Image.new('L', (800, 600), 255).save(os.path.join(test_dir, 'blank.png'))
+            Image.new('L', (16, 16), 0).save(os.path.join(test_dir, 'tiny.png'))
+            text = Image.new('L', (400, 200), 255)
+            ImageDraw.Draw(text).text((20, 80), "Hello OCR 123", fill=0)
+            text.save(os.path.join(test_dir, 'text.png'))
+            # One line of text in a small JPEG: draft() already shrinks it,
+            # so it must not be reduced again
+            caption = Image.new('L', (400, 200), 255)
+            ImageDraw.Draw(caption).text((10, 95), "Invoice 12345 total", fill=0)
+            caption.save(os.path.join(test_dir, 'caption.jpg'), quality=90)
+            
+            processor = CountingOcrProcessor(engine='tesseract', use_cache=False)
+            results = processor.process_directory(test_dir, max_workers=1)
+            
+            self.assertEqual(results, {
+                'blank.png': '', 'tiny.png': '', 'text.png': 'text.png', 'caption.jpg': 'caption.jpg',
+            })
+        finally:
+            shutil.rmtree(test_dir)
+    
+    def test_postprocess_rejoins_split_numbers(self):
+        """Test Bates-style fixups merge digit runs split across boxes"""
+        from ocr_processor import OcrProcessor
+        
+        results = [(None, 'ABC 00', 0.9), (None, '123 45', 0.9), (None, 'page', 0.9)]
+        plain = OcrProcessor(engine='fake', use_cache=False)
+        fixed = OcrProcessor(engine='fake', use_cache=False, postprocess=True)
+        
+        self.assertEqual(plain._join_results(results), 'ABC 00\n123 45\npage')
+        self.assertEqual(fixed._join_results(results), 'ABC 0012345\npage')
+    
+    def test_close_ends_tesseract_apis_of_all_threads(self):
+        """Test close() ends the per-thread Tesseract APIs created by worker threads"""
+        import ocr_processor
+        from concurrent.futures import ThreadPoolExecutor
+        
+        class FakeApi:
+            created = []
+            
+            def __init__(self, lang):
+                self.ended = False
+                FakeApi.created.append(self)
+            
+            def SetImageFile(self, path):
+                pass
+            
+            def GetUTF8Text(self):
+                return 'text'
+            
+            def End(self):
+                self.ended = True
+        
+        class FakeTesserocr:
+            PyTessBaseAPI = FakeApi
+        
+        for name, value in [('HAS_TESSEROCR', True), ('tesserocr', FakeTesserocr)]:
+            self.addCleanup(setattr, ocr_processor, name, getattr(ocr_processor, name, None))
+            setattr(ocr_processor, name, value)
+        
+        processor = ocr_processor.OcrProcessor(engine='tesseract', skip_blank=False)
+        barrier = threading.Barrier(3)
+        
+        def run(_):
+            barrier.wait()  # one API per thread
+            return processor._extract_tesseract('image.png')
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            self.assertEqual(list(executor.map(run, range(3))), ['text'] * 3)
+        processor.close()
+        
+        self.assertEqual(len(FakeApi.created), 3)
+        self.assertTrue(all(api.ended for api in FakeApi.created))
+    
+    def test_easyocr_pool_not_used_with_onnx_or_quantize(self):
+        """Test the shared-weights CPU pool is skipped for ONNX/INT8 readers"""
+        from ocr_processor import OcrProcessor
+        
+        plain = OcrProcessor(engine='easyocr', use_cache=False, device='cpu')
+        onnx = OcrProcessor(engine='easyocr', use_cache=False, device='cpu', onnx=True)
+        quantized = OcrProcessor(engine='easyocr', use_cache=False, device='cpu', quantize=True)
+        
+        self.assertTrue(plain._use_easyocr_pool(10, max_workers=2))
+        self.assertFalse(onnx._use_easyocr_pool(10, max_workers=2))
+        self.assertFalse(quantized._use_easyocr_pool(10, max_workers=2))
 
 class TestIntegration(unittest.TestCase):
     """Integration tests"""
@@ -0,0 +1,322 @@
+"""Unit tests for ocr_bridge that don't need a real OCR engine.
+
+The local OCR processor is swapped for a fake that "reads" the image file
+as text, so the bridge's own logic (path resolution, concurrency, result
+integration) is exercised without Tesseract/EasyOCR installed.
+"""
+from __future__ import annotations
+
+import base64
+import io
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+sys.path.insert(0, str(REPO_ROOT / "packages" / "parser-py"))
+
+import ocr_bridge  # noqa: E402
+
+
+class FakeOcrProcessor:
+    """Returns the image file's contents as the OCR text."""
+
+    def __init__(self, engine="auto", lang="kor+eng", use_cache=True):
+        self.engine = "fake"
+        self.lang = lang
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def extract_text(self, image_path):
+        with self._lock:
+            self.calls.append(str(image_path))
+        return Path(image_path).read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def bridge(monkeypatch, tmp_path):
+    monkeypatch.setattr(ocr_bridge, "OcrProcessor", FakeOcrProcessor)
+    return ocr_bridge.RustOcrBridge(
+        ocr_engine="auto", ocr_concurrency=4, cache_dir=str(tmp_path / "cache")
+    )
+
+
+def _write_mdx(tmp_path: Path, image_texts: dict) -> Path:
+    body = ["---", "format: hwp", "---", "", "# Doc", ""]
+    for name, text in image_texts.items():
+        (tmp_path / f"{name}.png").write_text(text, encoding="utf-8")
+        body.append(f"![{name}]({name}.png)")
+        body.append("")
+    mdx = tmp_path / "doc.mdx"
+    mdx.write_text("\n".join(body), encoding="utf-8")
+    return mdx
+
+
+class TestProcessRustOutput:
+    def test_results_keep_document_order(self, bridge, tmp_path):
+        texts = {f"img{i}": f"text {i}" for i in range(8)}
+        mdx = _write_mdx(tmp_path, texts)
+
+        out = bridge.process_rust_output(str(mdx))
+
+        assert [r["image_id"] for r in out["ocr_results"]] == list(texts)
+        assert out["statistics"]["processed"] == 8
+        assert out["statistics"]["errors"] == 0
+
+    def test_missing_and_empty_images_are_skipped(self, bridge, tmp_path):
+        mdx = _write_mdx(tmp_path, {"full": "hello", "blank": ""})
+        mdx.write_text(
+            mdx.read_text(encoding="utf-8") + "\n![gone](gone.png)\n", encoding="utf-8"
+        )
+
+        out = bridge.process_rust_output(str(mdx))
+
+        assert [r["image_id"] for r in out["ocr_results"]] == ["full"]
+        assert out["statistics"]["skipped"] == 2
+
+    def test_images_resolve_from_media_subdirectory(self, bridge, tmp_path):
+        (tmp_path / "media").mkdir()
+        (tmp_path / "media" / "fig1.jpg").write_text("from media", encoding="utf-8")
+        mdx = tmp_path / "doc.mdx"
+        mdx.write_text("# Doc\n\n![fig](fig1)\n", encoding="utf-8")
+
+        out = bridge.process_rust_output(str(mdx))
+
+        assert out["ocr_results"][0]["source_path"] == str(tmp_path / "media" / "fig1.jpg")
+
+    def test_embedded_base64_image_is_written_to_temp_file(self, bridge):
+        payload = b"embedded text" * 1000
+        data = "data:image/png;base64," + base64.b64encode(payload).decode("ascii")
+
+        path = bridge._resolve_image_path({"id": "emb", "data": data}, None)
+
+        try:
+            assert Path(path).read_bytes() == payload
+        finally:
+            Path(path).unlink()
+
+    def test_ocr_concurrency_env_default(self, monkeypatch):
+        monkeypatch.setattr(ocr_bridge, "OcrProcessor", FakeOcrProcessor)
+        monkeypatch.setenv("OCR_CONCURRENCY", "3")
+        assert ocr_bridge.RustOcrBridge(use_disk_cache=False).ocr_concurrency == 3
+
+    def test_disk_cache_is_opened_on_first_use(self, bridge, tmp_path):
+        assert not (tmp_path / "cache").exists()
+
+        bridge.process_rust_output(str(_write_mdx(tmp_path, {"a": "text"})))
+
+        assert (tmp_path / "cache" / "ocr_cache.sqlite3").exists()
+
+    def test_disk_cache_survives_new_bridge(self, bridge, tmp_path):
+        mdx = _write_mdx(tmp_path, {"a": "same text", "b": "same text"})
+        bridge.process_rust_output(str(mdx))
+        # A new instance has an empty in-memory cache, so hits come from disk
+        fresh = ocr_bridge.RustOcrBridge(cache_dir=str(tmp_path / "cache"))
+
+        out = fresh.process_rust_output(str(mdx))
+
+        assert fresh.ocr_processor.calls == []
+        assert out["statistics"]["cached"] == 2
+        assert [r["extracted_text"] for r in out["ocr_results"]] == ["same text"] * 2
+
+    def test_ai_engine_receives_batches(self, bridge, tmp_path):
+        class FakeAiEngine:
+            model = "fake/model"
+
+            def __init__(self):
+                self.batches = []
+
+            def extract_text_batch(self, image_paths, batch_size=4, prompt=None):
+                self.batches.append(len(image_paths))
+                return [Path(p).read_text(encoding="utf-8") for p in image_paths]
+
+        bridge.ai_engine = FakeAiEngine()
+        bridge.batch_size = 3
+        texts = {f"img{i}": f"text {i}" for i in range(7)}
+        mdx = _write_mdx(tmp_path, texts)
+
+        out = bridge.process_rust_output(str(mdx))
+
+        assert sorted(bridge.ai_engine.batches) == [1, 3, 3]
+        assert [r["extracted_text"] for r in out["ocr_results"]] == list(texts.values())
+
+
+class TestIntegrateOcrResults:
+    def test_inline_text_follows_matching_path_only(self, bridge):
+        results = [
+            ocr_bridge.OcrResult(image_id="1", source_path="1.png", extracted_text="one"),
+            ocr_bridge.OcrResult(image_id="chart", source_path="chart.png", extracted_text="bars"),
+        ]
+        text = (
+            "![figure 1 of chart](media/other.png)\n"
+            "![a](media/1.png)\n"
+            '<img alt="chart" src="media/chart.jpg">\n'
+        )
+
+        out = bridge._integrate_ocr_results(text, results)
+
+        body = out.split("\n\n## OCR Extracted Text")[0]
+        assert body == (
+            "![figure 1 of chart](media/other.png)\n"
+            "![a](media/1.png)\n\n> **OCR:** one\n\n"
+            '<img alt="chart" src="media/chart.jpg">\n\n> **OCR:** bars\n\n'
+        )
+
+
+class TestProcessDirectory:
+    def test_enhanced_file_keeps_frontmatter_and_streams_ndjson(self, bridge, tmp_path):
+        import json
+
+        _write_mdx(tmp_path, {"fig": "chart label"})
+        out_dir = tmp_path / "out"
+        log = io.StringIO()
+
+        results = bridge.process_directory(str(tmp_path), str(out_dir), results_fp=log)
+
+        enhanced = (out_dir / "doc.ocr.mdx").read_text(encoding="utf-8")
+        assert enhanced.startswith("---\nformat: hwp\n---\n\n# Doc")
+        assert "> **OCR:** chart label" in enhanced
+        records = [json.loads(line) for line in log.getvalue().splitlines()]
+        assert [r["status"] for r in records] == ["processed"]
+        assert records[0]["output"] == str(out_dir / "doc.ocr.mdx")
+        # Streamed runs keep only counters, not per-file records
+        assert results == {"counts": {"processed": 1, "skipped": 0, "errors": 0}}
+
+    def test_resume_skips_files_done_by_earlier_run(self, bridge, tmp_path):
+        _write_mdx(tmp_path, {"fig": "chart label"})
+        out_dir = tmp_path / "out"
+        bridge.process_directory(str(tmp_path), str(out_dir), resume=True)
+        assert (out_dir / "processed_keys.json").exists()
+
+        again = bridge.process_directory(str(tmp_path), str(out_dir), resume=True)
+
+        assert again["processed"] == []
+        assert again["skipped"] == [str(tmp_path / "doc.mdx")]
+        assert again["counts"] == {"processed": 0, "skipped": 1, "errors": 0}
+
+
+class TestHasProbableText:
+    @pytest.fixture(autouse=True)
+    def _needs_imaging(self):
+        pytest.importorskip("PIL")
+        pytest.importorskip("numpy")
+
+    def test_check_is_off_by_default(self, bridge, tmp_path):
+        from PIL import Image, ImageDraw
+
+        # One thin, low-contrast caption in a large scan: too few edge pixels
+        # for the density check, so it must only run when asked for
+        path = tmp_path / "caption.png"
+        img = Image.new("L", (2400, 1600), 255)
+        ImageDraw.Draw(img).text((100, 500), "Thin caption 2024", fill=120)
+        img.save(path)
+
+        assert bridge._has_probable_text(str(path))
+
+    def test_flat_and_gradient_images_are_skipped(self, bridge, tmp_path):
+        from PIL import Image
+
+        bridge.text_probability_threshold = ocr_bridge.SUGGESTED_TEXT_PROBABILITY_THRESHOLD
+
+        blank = tmp_path / "blank.png"
+        Image.new("L", (400, 200), 255).save(blank)
+        gradient = tmp_path / "gradient.png"
+        Image.linear_gradient("L").resize((400, 200)).save(gradient)
+
+        assert not bridge._has_probable_text(str(blank))
+        assert not bridge._has_probable_text(str(gradient))
+
+    def test_text_like_strokes_are_kept(self, bridge, tmp_path):
+        from PIL import Image, ImageDraw
+
+        bridge.text_probability_threshold = ocr_bridge.SUGGESTED_TEXT_PROBABILITY_THRESHOLD
+        path = tmp_path / "text.png"
+        img = Image.new("L", (400, 200), 255)
+        ImageDraw.Draw(img).text((20, 80), "Hello OCR 123", fill=0)
+        img.save(path)
+
+        assert bridge._has_probable_text(str(path))
+
+
+class TestSplitBatchReply:
+    def test_splits_on_markers(self):
+        reply = "--- IMAGE 1 ---\nfirst\n--- IMAGE 2 ---\nsecond\n"
+        assert ocr_bridge.OpenRouterOcrEngine._split_batch_reply(reply, 2) == ["first", "second"]
+
+    def test_missing_sections_are_empty(self):
+        reply = "--- IMAGE 2 ---\nonly second"
+        assert ocr_bridge.OpenRouterOcrEngine._split_batch_reply(reply, 3) == ["", "only second", ""]
+
+
+class TestReadStream:
+    class FakeResponse:
+        def __init__(self, lines):
+            self.lines = lines
+
+        def iter_lines(self):
+            return iter(self.lines)
+
+    def test_accumulates_deltas_until_finish_reason(self):
+        engine = ocr_bridge.OpenRouterOcrEngine.__new__(ocr_bridge.OpenRouterOcrEngine)
+        tokens = []
+        engine.on_token = tokens.append
+        response = self.FakeResponse([
+            b": OPENROUTER PROCESSING",
+            b"",
+            b'data: {"choices": [{"delta": {"content": "Hello "}}]}',
+            b'data: {"choices": [{"delta": {"content": "world"}, "finish_reason": "stop"}]}',
+            b'data: {"choices": [{"delta": {"content": "ignored"}}]}',
+            b"data: [DONE]",
+        ])
+
+        assert engine._read_stream(response) == "Hello world"
+        assert tokens == ["Hello ", "world"]
+
+
+class TestPrepareImageForApi:
+    @pytest.fixture
+    def engine(self):
+        pytest.importorskip("PIL")
+        # Skip __init__: it needs an API key and the requests library
+        return ocr_bridge.OpenRouterOcrEngine.__new__(ocr_bridge.OpenRouterOcrEngine)
+
+    def test_large_png_is_downscaled_to_jpeg(self, engine, tmp_path):
+        from PIL import Image
+
+        path = tmp_path / "big.png"
+        Image.new("RGBA", (3000, 1500), "white").save(path)
+
+        data_url, mime_type = engine._encode_image(str(path))
+
+        assert mime_type == "image/jpeg"
+        with Image.open(io.BytesIO(base64.b64decode(data_url.split(",", 1)[1]))) as img:
+            assert img.size == (1280, 640)
+
+    def test_small_jpeg_is_sent_unchanged(self, engine, tmp_path):
+        from PIL import Image
+
+        path = tmp_path / "small.jpg"
+        Image.new("RGB", (200, 100), "white").save(path)
+
+        assert engine._prepare_image_for_api(str(path), io.BytesIO()) is False
+
+
+class TestFromMdx:
+    def test_frontmatter_keeps_nested_values(self, tmp_path):
+        pytest.importorskip("yaml")
+        mdx = tmp_path / "doc.mdx"
+        mdx.write_text(
+            "---\nformat: hwp\nversion: 5\ncreated: 2024-01-02\n"
+            "authors:\n  - Kim\n  - Lee\n---\n\n# Title\n",
+            encoding="utf-8",
+        )
+
+        out = ocr_bridge.RustOutput.from_mdx(str(mdx))
+
+        assert out.format == "hwp"
+        assert out.version == "5"
+        assert out.metadata["authors"] == ["Kim", "Lee"]
+        assert out.metadata["created"] == "2024-01-02"
+        assert out.text_content == "# Title"
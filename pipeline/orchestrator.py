@@ -19,16 +19,426 @@ MDM E2E Pipeline Orchestrator
     result = pipeline.convert("document.hwp", output_dir="./output")
 """
 
+import asyncio
+import hashlib
 import json
 import os
 import shutil
 import subprocess
+import sys
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import lru_cache
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+
+# Python 변환기(table_to_svg_enhanced, chart_to_png) 경로는 모듈 로드 시 한 번만 추가
+CONVERTERS_DIR = Path(__file__).parent.parent / "converters"
+if str(CONVERTERS_DIR) not in sys.path:
+    sys.path.insert(0, str(CONVERTERS_DIR))
+
+
+@lru_cache(maxsize=None)
+def _table_svg_module():
+    """table_to_svg_enhanced 모듈 (첫 호출 때 임포트)."""
+    import table_to_svg_enhanced
+    return table_to_svg_enhanced
+
+
+@lru_cache(maxsize=None)
+def _chart_png_module():
+    """chart_to_png 모듈 (첫 호출 때 임포트, matplotlib 로드 포함)."""
+    import chart_to_png
+    return chart_to_png
+
+
+# 문서 안의 테이블 SVG 렌더링에 공유하는 스레드 풀 (프로세스마다 첫 사용 때 생성)
+_TABLE_POOL: Optional[ThreadPoolExecutor] = None
+_TABLE_POOL_LOCK = threading.Lock()
+
+
+def _table_pool() -> ThreadPoolExecutor:
+    global _TABLE_POOL
+    with _TABLE_POOL_LOCK:
+        if _TABLE_POOL is None:
+            _TABLE_POOL = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 2),
+                thread_name_prefix="mdm-table-svg",
+            )
+        return _TABLE_POOL
+
+
+def _reset_table_pool_in_child() -> None:
+    """fork된 자식에는 부모의 풀 스레드가 없으므로 풀/락을 새로 만들게 함."""
+    global _TABLE_POOL, _TABLE_POOL_LOCK
+    _TABLE_POOL = None
+    _TABLE_POOL_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_table_pool_in_child)
+
+
+# 렌더링 결과(SVG/PNG) 캐시: 내용 해시 → 파일, 용량 초과 시 오래 안 쓴 것부터 삭제
+# (MDM_RENDER_CACHE_DIR로 위치 변경 가능, 예: 테스트/CI에서 임시 디렉토리)
+DEFAULT_RENDER_CACHE_DIR = Path.home() / ".cache" / "mdm-media"
+RENDER_CACHE_MAX_BYTES = int(os.environ.get("MDM_RENDER_CACHE_MB", "256")) << 20
+
+
+def _render_cache_dir() -> Path:
+    return Path(os.environ.get("MDM_RENDER_CACHE_DIR") or DEFAULT_RENDER_CACHE_DIR)
+
+
+@lru_cache(maxsize=None)
+def _renderer_version(module: Any) -> str:
+    """렌더러 모듈 소스와 그리기 라이브러리 버전의 해시 (코드가 바뀌면 캐시 키도 바뀜)."""
+    digest = hashlib.blake2b(digest_size=8)
+    with open(module.__file__, "rb") as f:
+        digest.update(f.read())
+    for name in ("matplotlib", "svgwrite"):
+        lib = sys.modules.get(name)
+        digest.update(f"\0{name}={getattr(lib, '__version__', '')}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _render_key(data: Any, theme: str, renderer: str = "") -> str:
+    """테이블/차트 데이터, 테마, 렌더러 버전/스타일(renderer)의 BLAKE2b 해시."""
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16)
+    digest.update(b"\0" + theme.encode("utf-8"))
+    digest.update(b"\0" + renderer.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _render_cached(cache_path: Optional[Path], output_path: Path, render) -> None:
+    """
+    캐시에 있으면 복사하고, 없으면 render()로 만든 뒤 캐시에 저장합니다.
+    
+    캐시 기록은 임시 파일 + os.replace로 원자적으로 하며, 캐시 실패는
+    변환 결과에 영향을 주지 않습니다.
+    """
+    if cache_path is not None:
+        try:
+            shutil.copyfile(cache_path, output_path)
+            os.utime(cache_path)  # LRU 정리를 위해 사용 시각 갱신
+            return
+        except OSError:
+            pass
+    
+    render()
+    
+    if cache_path is not None:
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            os.close(fd)
+            shutil.copyfile(output_path, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
+def _evict_render_cache(cache_dir: Path, max_bytes: int = RENDER_CACHE_MAX_BYTES) -> None:
+    """캐시 디렉토리가 max_bytes를 넘으면 mtime이 오래된 파일부터 삭제합니다."""
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [(e.stat().st_mtime, e.stat().st_size, e.path) for e in it if e.is_file()]
+    except OSError:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+            total -= size
+        except OSError:
+            pass
+
+
+# tesseract 한 번 실행에 묶는 최대 이미지 수
+OCR_BATCH_MAX = 16
+
+
+def _ocr_concurrency() -> int:
+    """동시 OCR 프로세스 수 (MDM_OCR_CONCURRENCY 환경 변수, 기본값 CPU 수)."""
+    return int(os.environ.get("MDM_OCR_CONCURRENCY", os.cpu_count() or 1))
+
+
+async def _ocr_one(tesseract: str, image: str, lang: str, sem: asyncio.Semaphore) -> str:
+    """tesseract 서브프로세스 하나로 이미지 한 장을 OCR합니다."""
+    async with sem:
+        proc = await asyncio.create_subprocess_exec(
+            tesseract, image, "stdout", "-l", lang,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(stderr.decode("utf-8", errors="replace").strip())
+    return stdout.decode("utf-8", errors="replace").strip()
+
+
+async def _ocr_batch(
+    tesseract: str, images: List[str], lang: str, sem: asyncio.Semaphore
+) -> List[Union[str, Exception]]:
+    """
+    이미지 여러 장을 tesseract 한 번 실행(리스트 파일 모드)으로 OCR합니다.
+    
+    프로세스 생성/언어 데이터 로드 비용을 이미지 수만큼이 아니라 한 번만
+    냅니다. 결과가 이미지 수와 맞지 않으면 실패한 이미지를 가려내기 위해
+    한 장씩 다시 실행합니다.
+    """
+    if len(images) > 1:
+        fd, list_path = tempfile.mkstemp(prefix="mdm-ocr-", suffix=".txt")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(images) + "\n")
+            async with sem:
+                proc = await asyncio.create_subprocess_exec(
+                    tesseract, list_path, "stdout", "-l", lang,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+                stdout, _ = await proc.communicate()
+        finally:
+            os.unlink(list_path)
+        
+        # 페이지마다 폼 피드(\f) 구분자가 붙음
+        pages = stdout.decode("utf-8", errors="replace").split("\f")
+        if pages and not pages[-1].strip():
+            pages.pop()
+        if proc.returncode == 0 and len(pages) == len(images):
+            return [page.strip() for page in pages]
+    
+    return list(await asyncio.gather(
+        *[_ocr_one(tesseract, image, lang, sem) for image in images],
+        return_exceptions=True,
+    ))
+
+
+RUST_TIMEOUT = 300  # 문서 하나당 Rust 파서 타임아웃 (초)
+
+
+STDERR_TAIL_LINES = 200  # 실패 메시지용으로 보관하는 Rust stderr 마지막 줄 수
+
+
+class _RustProcess:
+    """
+    문서 하나를 변환하는 Rust CLI 프로세스.
+    
+    결과 JSON은 파일로 쓰이므로 stdout(상태 출력)은 버리고, stderr는
+    백그라운드 스레드가 계속 읽어 (파이프가 차서 멈추지 않도록) 마지막
+    줄들만 보관합니다. 출력 크기와 무관하게 메모리 사용이 일정합니다.
+    """
+    
+    def __init__(self, cmd: List[str]):
+        self._proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+        )
+        self._stderr_tail: deque = deque(maxlen=STDERR_TAIL_LINES)
+        self._drain = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._drain.start()
+    
+    def _drain_stderr(self) -> None:
+        with self._proc.stderr:
+            for line in self._proc.stderr:
+                self._stderr_tail.append(line)
+    
+    @property
+    def stderr(self) -> str:
+        return "".join(self._stderr_tail)
+    
+    def wait(self, timeout: float = RUST_TIMEOUT) -> int:
+        """
+        종료를 기다려 종료 코드를 반환합니다. 타임아웃이면 프로세스를
+        종료하고 subprocess.TimeoutExpired를 발생시킵니다.
+        """
+        try:
+            returncode = self._proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+            raise
+        # stderr를 물려받은 자식 프로세스가 남아 있어도 오래 기다리지 않음
+        self._drain.join(timeout=1)
+        return returncode
+
+
+@lru_cache(maxsize=None)
+def _supports_serve(rust_cli: str) -> bool:
+    """Rust CLI가 `serve` 서브커맨드(상주 모드)를 지원하는지 확인합니다."""
+    try:
+        proc = subprocess.run(
+            [rust_cli, "serve", "--help"],
+            capture_output=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return proc.returncode == 0
+
+
+class _RustDaemon:
+    """
+    `hwp2mdm serve` 상주 프로세스와 줄 단위 JSON으로 통신합니다.
+    
+    문서마다 프로세스를 새로 띄우는 비용을 없애기 위해 파이프라인당
+    하나를 유지합니다. 요청은 한 번에 하나씩 (락으로) 보냅니다.
+    """
+    
+    def __init__(self, rust_cli: Path):
+        self._proc = subprocess.Popen(
+            [str(rust_cli), "serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+        )
+        self._lock = threading.Lock()
+    
+    @property
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+    
+    def convert(self, request: Dict[str, Any], timeout: float = RUST_TIMEOUT) -> Dict[str, Any]:
+        """변환 요청 하나를 보내고 응답을 기다립니다."""
+        self.send(request, timeout)
+        return self.receive()
+    
+    def send(self, request: Dict[str, Any], timeout: float = RUST_TIMEOUT) -> None:
+        """
+        변환 요청을 보내고 바로 반환합니다. 반드시 receive()와 짝을 이뤄야
+        하며, 그 사이에는 다른 스레드의 요청이 대기합니다.
+        
+        timeout이 지나면 프로세스를 종료하고, receive()가
+        subprocess.TimeoutExpired를 발생시킵니다 (다음 요청 때 새로 띄웁니다).
+        """
+        self._lock.acquire()
+        self._timeout = timeout
+        self._timer = threading.Timer(timeout, self._proc.kill)
+        self._timer.start()
+        try:
+            self._proc.stdin.write(json.dumps(request, ensure_ascii=False) + "\n")
+            self._proc.stdin.flush()
+        except BaseException:
+            self._timer.cancel()
+            self._lock.release()
+            raise
+    
+    def receive(self) -> Dict[str, Any]:
+        """send()로 보낸 요청의 응답을 기다립니다."""
+        try:
+            while True:
+                line = self._proc.stdout.readline()
+                if not line:
+                    if not self._timer.is_alive():
+                        raise subprocess.TimeoutExpired(self._proc.args, self._timeout)
+                    raise RuntimeError(f"Rust daemon exited (code {self._proc.wait()})")
+                # stdout 억제가 안 되는 플랫폼에서는 상태 출력이 섞일 수 있음
+                if line.startswith("{"):
+                    return json.loads(line)
+        finally:
+            self._timer.cancel()
+            self._lock.release()
+    
+    def close(self) -> None:
+        """stdin을 닫아 정상 종료시키고, 응답이 없으면 강제 종료합니다."""
+        if self._proc.poll() is None:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+                self._proc.wait()
+
+
+def _read_rust_json(json_path: Path) -> Dict[str, Any]:
+    """
+    Rust JSON 출력에서 tables/charts/metadata만 읽습니다.
+    
+    ijson이 있으면 필요한 부분만 스트리밍으로 읽어 본문 등 나머지
+    트리를 메모리에 올리지 않습니다 (키마다 파일을 처음부터 다시 읽음).
+    """
+    if not HAS_IJSON:
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return {
+            "tables": data.get("tables", []),
+            "charts": data.get("charts", []),
+            "metadata": data.get("metadata", {}),
+        }
+    
+    parsed: Dict[str, Any] = {}
+    with open(json_path, "rb") as f:
+        for key in ("tables", "charts"):
+            f.seek(0)
+            # use_float: 숫자를 Decimal이 아닌 float로 (json.load와 동일)
+            parsed[key] = list(ijson.items(f, f"{key}.item", use_float=True))
+        f.seek(0)
+        parsed["metadata"] = next(ijson.items(f, "metadata", use_float=True), {})
+    return parsed
+
+
+def _publish_staged(staging_dir: Path, output_dir: Path) -> None:
+    """
+    작업 디렉토리의 파일을 출력 디렉토리로 옮깁니다.
+    
+    같은 파일시스템이면 os.replace(rename)로, 아니면 출력 쪽 임시 파일에
+    복사한 뒤 os.replace하므로 반쯤 쓰인 파일이 출력에 남지 않습니다.
+    """
+    for root, _dirs, files in os.walk(staging_dir):
+        target_root = output_dir / Path(root).relative_to(staging_dir)
+        target_root.mkdir(parents=True, exist_ok=True)
+        for name in files:
+            source, target = os.path.join(root, name), target_root / name
+            try:
+                os.replace(source, target)
+            except OSError:
+                fd, tmp = tempfile.mkstemp(dir=target_root, prefix=f".{name}.", suffix=".tmp")
+                os.close(fd)
+                try:
+                    shutil.copy2(source, tmp)
+                    os.replace(tmp, target)
+                except BaseException:
+                    os.unlink(tmp)
+                    raise
+
+
+def _rebase(paths: List[str], old_root: Path, new_root: Path) -> List[str]:
+    """old_root 아래 경로들을 new_root 아래의 같은 상대 경로로 바꿉니다."""
+    return [str(new_root / Path(path).relative_to(old_root)) for path in paths]
+
+
+# assets 스캔 시 이미지로 취급하는 확장자 (소문자)
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg", ".bmp"})
+
+
+def _default_batch_workers() -> int:
+    """일괄 변환 워커 수 (MDM_BATCH_WORKERS 환경 변수, 기본값 CPU 수)."""
+    return int(os.environ.get("MDM_BATCH_WORKERS", os.cpu_count() or 1))
+
+
+# Python 3.10+: __slots__ 데이터클래스 (인스턴스 __dict__ 없음 → 메모리/속성 접근 절약)
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class OutputFormat(Enum):
     """출력 포맷."""
@@ -45,7 +455,7 @@ class DocumentType(Enum):
     DOCX = "docx"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ConversionOptions:
     """변환 옵션 설정."""
     output_format: OutputFormat = OutputFormat.MDX
@@ -56,10 +466,14 @@ class ConversionOptions:
     image_quality: int = 85
     svg_theme: str = "default"  # default, dark, minimal
     chart_theme: str = "default"  # default, dark, minimal, presentation
+    ocr_lang: str = "kor+eng"  # tesseract 언어 코드
+    render_cache: bool = True  # 같은 테이블/차트는 캐시된 SVG/PNG 재사용
+    scan_assets: bool = False  # 렌더링 결과 대신 assets 디렉토리를 스캔해 이미지 목록 작성
+    tempdir: Optional[str] = None  # 빠른 로컬 작업 디렉토리 (성공 시 결과를 출력 디렉토리로 이동)
     verbose: bool = False
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ConversionResult:
     """변환 결과."""
     success: bool
@@ -103,43 +517,70 @@ class MdmPipeline:
         Path(__file__).parent.parent / "core" / "target" / "release" / "hwp2mdm",
         Path(__file__).parent.parent / "core" / "target" / "debug" / "hwp2mdm",
         Path("/usr/local/bin/hwp2mdm"),
-        Path("hwp2mdm"),  # PATH에 있는 경우
+        Path("hwp2mdm"),  # 현재 디렉토리 (PATH는 _find_rust_cli에서 shutil.which로 탐색)
     ]
     
-    def __init__(self, rust_cli_path: Optional[str] = None):
+    def __init__(self, rust_cli_path: Optional[str] = None, use_daemon: bool = True):
         """
         파이프라인 초기화.
         
         Args:
             rust_cli_path: Rust CLI 바이너리 경로 (None이면 자동 탐색)
+            use_daemon: Rust CLI를 `serve` 상주 프로세스로 재사용할지 여부
+                (CLI가 지원하지 않으면 문서마다 새로 실행)
         """
         self.rust_cli = self._find_rust_cli(rust_cli_path)
-        self.converters_dir = Path(__file__).parent.parent / "converters"
+        self.converters_dir = CONVERTERS_DIR
+        self.use_daemon = use_daemon
+        self._daemon: Optional[_RustDaemon] = None
         
-    def _find_rust_cli(self, custom_path: Optional[str] = None) -> Optional[Path]:
-        """Rust CLI 바이너리를 찾습니다."""
+    def close(self) -> None:
+        """상주 중인 Rust 프로세스를 종료합니다."""
+        if self._daemon is not None:
+            self._daemon.close()
+            self._daemon = None
+    
+    def __enter__(self) -> "MdmPipeline":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _get_daemon(self) -> Optional[_RustDaemon]:
+        """필요하면 Rust 상주 프로세스를 (다시) 띄웁니다. 지원하지 않으면 None."""
+        if not self.use_daemon or not _supports_serve(str(self.rust_cli)):
+            return None
+        if self._daemon is None or not self._daemon.alive:
+            self._daemon = _RustDaemon(self.rust_cli)
+        return self._daemon
+        
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _find_rust_cli(cls, custom_path: Optional[str] = None) -> Optional[Path]:
+        """
+        Rust CLI 바이너리를 찾습니다.
+        
+        결과는 클래스 단위로 캐시되어, 파이프라인을 여러 번 만들어도
+        파일시스템 탐색은 경로별로 한 번만 합니다.
+        """
         if custom_path:
             path = Path(custom_path)
             if path.exists() and path.is_file():
                 return path
         
-        for path in self.RUST_CLI_PATHS:
+        for path in cls.RUST_CLI_PATHS:
             if path.exists() and path.is_file():
                 return path
         
-        # which/where로 찾기
-        try:
-            result = subprocess.run(
-                ["which", "hwp2mdm"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                return Path(result.stdout.strip())
-        except Exception:
-            pass
-        
-        return None
+        # PATH에서 찾기 (which 프로세스 없이)
+        found = shutil.which("hwp2mdm")
+        return Path(found) if found else None
+    
+    @classmethod
+    def reset_cli_cache(cls) -> None:
+        """Rust CLI 탐색 캐시를 비웁니다 (CLI를 새로 빌드/설치한 뒤, 테스트용)."""
+        cls._find_rust_cli.cache_clear()
+        _supports_serve.cache_clear()
     
     def convert(
         self,
@@ -179,58 +620,96 @@ class MdmPipeline:
         result.metadata["document_type"] = doc_type.value
         result.metadata["input_file"] = str(input_path)
         
-        # 출력 디렉토리 생성
-        output_dir.mkdir(parents=True, exist_ok=True)
-        assets_dir = output_dir / "assets"
-        assets_dir.mkdir(exist_ok=True)
-        result.assets_dir = str(assets_dir)
+        result.assets_dir = str(output_dir / "assets")
+        
+        # tempdir이 있으면 모든 단계를 그 아래 작업 디렉토리에서 실행하고,
+        # 성공했을 때만 결과를 출력 디렉토리로 옮김 (실패 시 출력은 그대로)
+        staging_dir = None
+        if options.tempdir:
+            staging_dir = Path(tempfile.mkdtemp(prefix="mdm-", dir=options.tempdir))
+        work_dir = staging_dir or output_dir
+        assets_dir = work_dir / "assets"
         
         try:
             # Step 1: Rust 파서로 기본 변환
             if options.verbose:
                 print(f"📄 Step 1: Parsing {input_path.name} with Rust parser...")
             
-            rust_result = self._run_rust_parser(input_path, output_dir, options)
+            # Rust 파서를 먼저 시작하고, 실행되는 동안 출력 디렉토리를 준비
+            # (Rust CLI는 출력 디렉토리를 스스로 만들므로 순서 무관)
+            try:
+                rust_run = self._start_rust_parser(input_path, work_dir, options)
+            except Exception as e:
+                result.errors.append(f"Rust parser error: {str(e)}")
+                return result
+            try:
+                output_dir.mkdir(parents=True, exist_ok=True)
+                assets_dir.mkdir(parents=True, exist_ok=True)
+            finally:
+                rust_result = self._finish_rust_parser(rust_run, input_path, work_dir)
             if not rust_result["success"]:
                 result.errors.extend(rust_result.get("errors", []))
                 return result
             
             result.metadata.update(rust_result.get("metadata", {}))
             
-            # Step 2: 테이블 → SVG 변환
-            if options.convert_tables_to_svg and rust_result.get("tables"):
-                if options.verbose:
-                    print(f"📊 Step 2: Converting {len(rust_result['tables'])} tables to SVG...")
+            # Step 2~4는 서로 독립적이므로 동시에 실행 (합계가 아닌 가장 긴 단계만큼 소요)
+            with ThreadPoolExecutor(max_workers=3, thread_name_prefix="mdm-stage") as stages:
+                table_future = chart_future = ocr_future = None
                 
-                table_results = self._convert_tables_to_svg(
-                    rust_result["tables"],
-                    assets_dir,
-                    options.svg_theme,
-                )
-                result.tables = table_results
-            
-            # Step 3: 차트 → PNG 변환
-            if options.convert_charts_to_png and rust_result.get("charts"):
-                if options.verbose:
-                    print(f"📈 Step 3: Converting {len(rust_result['charts'])} charts to PNG...")
+                # Step 2: 테이블 → SVG 변환
+                if options.convert_tables_to_svg and rust_result.get("tables"):
+                    if options.verbose:
+                        print(f"📊 Step 2: Converting {len(rust_result['tables'])} tables to SVG...")
+                    
+                    table_future = stages.submit(
+                        self._convert_tables_to_svg,
+                        rust_result["tables"],
+                        assets_dir,
+                        options.svg_theme,
+                        options.render_cache,
+                    )
                 
-                chart_results = self._convert_charts_to_png(
-                    rust_result["charts"],
-                    assets_dir,
-                    options.chart_theme,
-                )
-                result.charts = chart_results
-            
-            # Step 4: OCR 처리 (필요시)
-            if options.enable_ocr and rust_result.get("images_for_ocr"):
-                if options.verbose:
-                    print(f"🔍 Step 4: Running OCR on images...")
+                # Step 3: 차트 → PNG 변환
+                if options.convert_charts_to_png and rust_result.get("charts"):
+                    if options.verbose:
+                        print(f"📈 Step 3: Converting {len(rust_result['charts'])} charts to PNG...")
+                    
+                    chart_future = stages.submit(
+                        self._convert_charts_to_png,
+                        rust_result["charts"],
+                        assets_dir,
+                        options.chart_theme,
+                        options.render_cache,
+                    )
+                
+                # Step 4: OCR 처리 (필요시)
+                if options.enable_ocr and rust_result.get("images_for_ocr"):
+                    if options.verbose:
+                        print(f"🔍 Step 4: Running OCR on images...")
+                    
+                    ocr_future = stages.submit(
+                        self._run_ocr, rust_result["images_for_ocr"], options
+                    )
                 
-                ocr_results = self._run_ocr(rust_result["images_for_ocr"], options)
-                result.metadata["ocr_results"] = ocr_results
+                if table_future:
+                    result.tables = table_future.result()
+                if chart_future:
+                    result.charts = chart_future.result()
+                if ocr_future:
+                    result.metadata["ocr_results"] = ocr_future.result()
             
-            # Step 5: 이미지 목록 수집
-            result.images = self._collect_images(assets_dir)
+            # Step 5: 이미지 목록 (Step 2~3에서 만든 파일 경로로 구성, 디렉토리 스캔 생략)
+            if options.scan_assets:
+                result.images = self._collect_images(assets_dir)
+            else:
+                result.images = sorted(result.tables + result.charts)
+            
+            if staging_dir:
+                _publish_staged(staging_dir, output_dir)
+                result.tables = _rebase(result.tables, staging_dir, output_dir)
+                result.charts = _rebase(result.charts, staging_dir, output_dir)
+                result.images = _rebase(result.images, staging_dir, output_dir)
             
             # Step 6: 최종 출력 파일 경로 설정
             stem = input_path.stem
@@ -250,6 +729,9 @@ class MdmPipeline:
             
         except Exception as e:
             result.errors.append(f"Pipeline error: {str(e)}")
+        finally:
+            if staging_dir:
+                shutil.rmtree(staging_dir, ignore_errors=True)
         
         return result
     
@@ -271,75 +753,112 @@ class MdmPipeline:
         options: ConversionOptions,
     ) -> Dict[str, Any]:
         """Rust 파서를 실행합니다."""
-        result = {
-            "success": False,
+        try:
+            handle = self._start_rust_parser(input_path, output_dir, options)
+        except Exception as e:
+            return self._rust_result(f"Rust parser error: {str(e)}")
+        return self._finish_rust_parser(handle, input_path, output_dir)
+    
+    @staticmethod
+    def _rust_result(error: Optional[str] = None) -> Dict[str, Any]:
+        """Rust 파서 결과 (error가 있으면 실패 결과)."""
+        return {
+            "success": error is None,
             "tables": [],
             "charts": [],
             "images_for_ocr": [],
             "metadata": {},
-            "errors": [],
+            "errors": [error] if error else [],
         }
+    
+    def _start_rust_parser(
+        self,
+        input_path: Path,
+        output_dir: Path,
+        options: ConversionOptions,
+    ) -> Union[None, _RustDaemon, _RustProcess]:
+        """
+        Rust 파서를 시작하고 끝나기를 기다리지 않고 반환합니다.
         
+        반환값(상주 프로세스 또는 _RustProcess, CLI가 없으면 None)을
+        _finish_rust_parser에 넘겨 결과를 받습니다.
+        """
         if not self.rust_cli:
-            result["errors"].append("Rust CLI not found. Please build the core package first.")
-            return result
+            return None
+        
+        output_format = "json" if options.output_format == OutputFormat.JSON else "mdx"
+        daemon = self._get_daemon()
+        if daemon is not None:
+            # 상주 프로세스에 요청 (프로세스 시작 비용 없음)
+            daemon.send({
+                "input": str(input_path),
+                "output": str(output_dir),
+                "format": output_format,
+                "extract_images": options.extract_images,
+            })
+            return daemon
+        
+        # Rust CLI 실행
+        cmd = [
+            str(self.rust_cli),
+            "convert",
+            str(input_path),
+            "-o", str(output_dir),
+            "-f", output_format,
+        ]
+        
+        if options.extract_images:
+            cmd.append("--extract-images")
+        
+        return _RustProcess(cmd)
+    
+    def _finish_rust_parser(
+        self,
+        handle: Union[None, _RustDaemon, _RustProcess],
+        input_path: Path,
+        output_dir: Path,
+    ) -> Dict[str, Any]:
+        """_start_rust_parser로 시작한 Rust 파서를 기다려 결과를 읽습니다."""
+        if handle is None:
+            return self._rust_result("Rust CLI not found. Please build the core package first.")
         
         try:
-            # Rust CLI 실행
-            cmd = [
-                str(self.rust_cli),
-                "convert",
-                str(input_path),
-                "-o", str(output_dir),
-                "-f", "json" if options.output_format == OutputFormat.JSON else "mdx",
-            ]
+            if isinstance(handle, _RustDaemon):
+                reply = handle.receive()
+                if not reply.get("ok"):
+                    return self._rust_result(f"Rust parser failed: {reply.get('error', '')}")
+            elif handle.wait(RUST_TIMEOUT) != 0:
+                return self._rust_result(f"Rust parser failed: {handle.stderr}")
             
-            if options.extract_images:
-                cmd.append("--extract-images")
-            
-            proc = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5분 타임아웃
-            )
-            
-            if proc.returncode != 0:
-                result["errors"].append(f"Rust parser failed: {proc.stderr}")
-                return result
+            result = self._rust_result()
             
             # JSON 출력 파싱 (있는 경우)
             json_path = output_dir / f"{input_path.stem}.json"
             if json_path.exists():
-                with open(json_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    result["tables"] = data.get("tables", [])
-                    result["charts"] = data.get("charts", [])
-                    result["metadata"] = data.get("metadata", {})
+                result.update(_read_rust_json(json_path))
             
-            result["success"] = True
+            return result
             
         except subprocess.TimeoutExpired:
-            result["errors"].append("Rust parser timed out")
+            return self._rust_result("Rust parser timed out")
         except Exception as e:
-            result["errors"].append(f"Rust parser error: {str(e)}")
-        
-        return result
+            return self._rust_result(f"Rust parser error: {str(e)}")
     
     def _convert_tables_to_svg(
         self,
         tables: List[Dict[str, Any]],
         output_dir: Path,
         theme: str,
+        use_cache: bool = True,
     ) -> List[str]:
         """테이블을 SVG로 변환합니다."""
         converted = []
+        cache_dir = _render_cache_dir() / "tables"
         
         try:
-            # table_to_svg_enhanced 모듈 동적 임포트
-            import sys
-            sys.path.insert(0, str(self.converters_dir))
-            from table_to_svg_enhanced import TableSvgRenderer, Table, TableStyle, CellStyle
+            table_svg = _table_svg_module()
+            TableSvgRenderer, Table = table_svg.TableSvgRenderer, table_svg.Table
+            TableStyle, CellStyle = table_svg.TableStyle, table_svg.CellStyle
             
             # 테마 설정
             if theme == "dark":
@@ -374,20 +893,40 @@ class MdmPipeline:
             else:
                 style = TableStyle()
             
+            # 렌더러는 style 외에 상태가 없어 스레드 간에 공유해도 안전함
             renderer = TableSvgRenderer(style)
+            # 렌더러 코드나 스타일 기본값이 바뀌면 이전 캐시 항목을 쓰지 않음
+            renderer_tag = f"{_renderer_version(table_svg)}:{style!r}"
             
-            for i, table_data in enumerate(tables):
+            def render_one(i: int, table_data: Dict[str, Any]) -> str:
+                output_path = output_dir / f"table_{i+1}.svg"
+                cache_path = (
+                    cache_dir / f"{_render_key(table_data, theme, renderer_tag)}.svg"
+                    if use_cache else None
+                )
+                _render_cached(
+                    cache_path,
+                    output_path,
+                    lambda: renderer.render(Table.from_rust_output(table_data), output_path),
+                )
+                return os.fspath(output_path)
+            
+            futures = [
+                _table_pool().submit(render_one, i, table_data)
+                for i, table_data in enumerate(tables)
+            ]
+            # 테이블 순서대로 결과 수집
+            for i, future in enumerate(futures):
                 try:
-                    table = Table.from_rust_output(table_data)
-                    output_path = output_dir / f"table_{i+1}.svg"
-                    renderer.render(table, str(output_path))
-                    converted.append(str(output_path))
+                    converted.append(future.result())
                 except Exception as e:
                     print(f"Warning: Failed to convert table {i+1}: {e}")
             
         except ImportError as e:
             print(f"Warning: table_to_svg_enhanced not available: {e}")
         
+        if use_cache and converted:
+            _evict_render_cache(cache_dir)
         return converted
     
     def _convert_charts_to_png(
@@ -395,14 +934,15 @@ class MdmPipeline:
         charts: List[Dict[str, Any]],
         output_dir: Path,
         theme: str,
+        use_cache: bool = True,
     ) -> List[str]:
         """차트를 PNG로 변환합니다."""
         converted = []
+        cache_dir = _render_cache_dir() / "charts"
         
         try:
-            import sys
-            sys.path.insert(0, str(self.converters_dir))
-            from chart_to_png import ChartRenderer, ChartStyle
+            chart_png = _chart_png_module()
+            ChartRenderer, ChartStyle = chart_png.ChartRenderer, chart_png.ChartStyle
             
             # 테마 설정
             if theme == "dark":
@@ -415,18 +955,33 @@ class MdmPipeline:
                 style = ChartStyle()
             
             renderer = ChartRenderer(style)
+            # 렌더러 코드, 스타일 기본값, 선택된 폰트가 바뀌면 이전 캐시 항목을 쓰지 않음
+            renderer_tag = (
+                f"{_renderer_version(chart_png)}:{style!r}:"
+                f"{chart_png.plt.rcParams['font.family']}"
+            )
             
             for i, chart_data in enumerate(charts):
                 try:
                     output_path = output_dir / f"chart_{i+1}.png"
-                    renderer.render(chart_data, str(output_path))
-                    converted.append(str(output_path))
+                    cache_path = (
+                        cache_dir / f"{_render_key(chart_data, theme, renderer_tag)}.png"
+                        if use_cache else None
+                    )
+                    _render_cached(
+                        cache_path,
+                        output_path,
+                        lambda: renderer.render(chart_data, output_path),
+                    )
+                    converted.append(os.fspath(output_path))
                 except Exception as e:
                     print(f"Warning: Failed to convert chart {i+1}: {e}")
             
         except ImportError as e:
             print(f"Warning: chart_to_png not available: {e}")
         
+        if use_cache and converted:
+            _evict_render_cache(cache_dir)
         return converted
     
     def _run_ocr(
@@ -435,72 +990,144 @@ class MdmPipeline:
         options: ConversionOptions,
     ) -> Dict[str, str]:
         """이미지에 OCR을 실행합니다."""
-        results = {}
+        return asyncio.run(self._run_ocr_async(images, options))
+    
+    async def _run_ocr_async(
+        self,
+        images: List[str],
+        options: ConversionOptions,
+    ) -> Dict[str, str]:
+        """
+        모든 이미지의 OCR을 동시에 실행합니다.
         
-        try:
-            # OCR 브릿지 임포트 시도
-            from packages.parser_py.ocr_bridge import RustOcrBridge
-            
-            bridge = RustOcrBridge()
-            for img_path in images:
-                try:
-                    text = bridge.process_image(img_path)
-                    results[img_path] = text
-                except Exception as e:
-                    results[img_path] = f"OCR failed: {e}"
-                    
-        except ImportError:
+        tesseract 프로세스들을 asyncio.gather로 한꺼번에 띄우고, 세마포어로
+        동시 실행 수를 MDM_OCR_CONCURRENCY로 제한합니다. 이미지가 동시 실행
+        수의 두 배 이하면 한 장씩 바로 실행하고, 그보다 많으면 여러 장을
+        한 프로세스에 묶어(최대 OCR_BATCH_MAX장) 프로세스 생성 비용을 줄입니다.
+        """
+        tesseract = shutil.which("tesseract")
+        if not tesseract:
             # OCR 미설치 시 스킵
-            for img_path in images:
-                results[img_path] = "OCR not available"
+            return {img_path: "OCR not available" for img_path in images}
         
-        return results
+        concurrency = _ocr_concurrency()
+        sem = asyncio.Semaphore(concurrency)
+        batch_size = max(1, min(OCR_BATCH_MAX, len(images) // (2 * concurrency)))
+        batches = [images[i:i + batch_size] for i in range(0, len(images), batch_size)]
+        batch_outcomes = await asyncio.gather(
+            *[_ocr_batch(tesseract, batch, options.ocr_lang, sem) for batch in batches]
+        )
+        outcomes = [outcome for batch in batch_outcomes for outcome in batch]
+        return {
+            img_path: f"OCR failed: {outcome}" if isinstance(outcome, Exception) else outcome
+            for img_path, outcome in zip(images, outcomes)
+        }
     
     def _collect_images(self, assets_dir: Path) -> List[str]:
-        """assets 디렉토리의 이미지 목록을 수집합니다."""
-        images = []
-        image_extensions = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg", ".bmp"}
+        """
+        assets 디렉토리의 이미지 목록을 수집합니다.
         
-        if assets_dir.exists():
-            for f in assets_dir.iterdir():
-                if f.suffix.lower() in image_extensions:
-                    images.append(str(f))
+        파이프라인 외부에서 assets에 넣은 파일까지 포함해야 할 때만
+        사용합니다 (ConversionOptions.scan_assets).
+        """
+        if not assets_dir.exists():
+            return []
         
-        return sorted(images)
+        # os.scandir: 항목마다 Path를 만들지 않고 DirEntry 이름으로 판별
+        with os.scandir(assets_dir) as entries:
+            images = [
+                entry.path
+                for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+                and entry.is_file()
+            ]
+        images.sort()
+        return images
     
     def batch_convert(
         self,
         input_pattern: str,
         output_dir: Union[str, Path] = "./output",
         options: Optional[ConversionOptions] = None,
+        max_workers: Optional[int] = None,
     ) -> List[ConversionResult]:
         """
         여러 파일을 일괄 변환합니다.
         
+        파일마다 독립적이므로 프로세스 풀에서 병렬로 변환합니다. 파일은
+        디렉토리를 탐색하면서 찾는 즉시 풀에 넘기므로, 큰 트리에서도 탐색이
+        끝나기 전에 변환이 시작됩니다.
+        
         Args:
             input_pattern: glob 패턴 (예: "*.hwp", "docs/**/*.hwp")
             output_dir: 출력 디렉토리
             options: 변환 옵션
+            max_workers: 워커 프로세스 수 (None이면 MDM_BATCH_WORKERS 또는 CPU 수)
             
         Returns:
-            List[ConversionResult]: 변환 결과 목록
+            List[ConversionResult]: 변환 결과 목록 (입력 파일 경로 순서)
         """
         import glob
+        from itertools import chain, islice
         
-        results = []
         output_dir = Path(output_dir)
+        files = (Path(file_path) for file_path in glob.iglob(input_pattern, recursive=True))
+        workers = max_workers or _default_batch_workers()
+        rust_cli = str(self.rust_cli) if self.rust_cli else None
         
-        files = glob.glob(input_pattern, recursive=True)
+        # 파일이 하나뿐이면 프로세스 풀을 띄울 필요 없음
+        head = list(islice(files, 2))
+        files = chain(head, files)
+        converted: Dict[Path, ConversionResult] = {}
         
-        for file_path in files:
-            file_path = Path(file_path)
-            file_output_dir = output_dir / file_path.stem
-            
-            print(f"Converting: {file_path}")
-            result = self.convert(file_path, file_output_dir, options)
-            results.append(result)
+        if workers <= 1 or len(head) < 2:
+            for file_path in files:
+                print(f"Converting: {file_path}")
+                converted[file_path] = self.convert(file_path, output_dir / file_path.stem, options)
+            return [converted[file_path] for file_path in sorted(converted, key=str)]
         
-        return results
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # 탐색과 변환이 겹치도록 찾는 즉시 제출
+            futures = {
+                executor.submit(
+                    _convert_one, file_path, output_dir / file_path.stem, options, rust_cli
+                ): file_path
+                for file_path in files
+            }
+            # 제출 순서가 아니라 완료되는 순서대로 진행 상황 출력
+            for done, future in enumerate(as_completed(futures), 1):
+                file_path = futures[future]
+                try:
+                    converted[file_path] = future.result()
+                except Exception as e:
+                    converted[file_path] = ConversionResult(
+                        success=False, errors=[f"Worker error: {e}"]
+                    )
+                print(f"[{done}/{len(futures)}] Converted: {file_path}")
+        
+        return [converted[file_path] for file_path in sorted(converted, key=str)]
+
+
+_worker_pipeline: Optional["MdmPipeline"] = None
+
+
+def _convert_one(
+    input_path: Path,
+    output_dir: Path,
+    options: Optional[ConversionOptions],
+    rust_cli_path: Optional[str],
+) -> ConversionResult:
+    """
+    프로세스 풀 워커: 파일 하나를 변환합니다.
+    
+    피클 가능하도록 모듈 레벨에 두고, 부모가 찾은 Rust CLI 경로를 받아
+    워커에서 다시 탐색하지 않습니다. 파이프라인(과 Rust 상주 프로세스)은
+    워커 프로세스마다 하나를 만들어 이후 파일에 재사용합니다.
+    """
+    global _worker_pipeline
+    if _worker_pipeline is None:
+        _worker_pipeline = MdmPipeline(rust_cli_path)
+    return _worker_pipeline.convert(input_path, output_dir, options)
 
 
 # CLI 인터페이스
@@ -525,6 +1152,8 @@ Examples:
     parser.add_argument("-f", "--format", choices=["mdx", "json", "html"],
                        default="mdx", help="Output format")
     parser.add_argument("--batch", action="store_true", help="Batch convert mode")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                       help="Batch worker processes (default: $MDM_BATCH_WORKERS or CPU count)")
     parser.add_argument("--ocr", action="store_true", help="Enable OCR")
     parser.add_argument("--no-tables", action="store_true", help="Skip table conversion")
     parser.add_argument("--no-charts", action="store_true", help="Skip chart conversion")
@@ -532,6 +1161,8 @@ Examples:
                        default="default", help="SVG theme for tables")
     parser.add_argument("--chart-theme", choices=["default", "dark", "minimal", "presentation"],
                        default="default", help="Chart theme")
+    parser.add_argument("--tempdir", default=None,
+                        help="Fast local scratch directory; outputs are moved to -o on success")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
     
     args = parser.parse_args()
@@ -544,24 +1175,24 @@ Examples:
         enable_ocr=args.ocr,
         svg_theme=args.svg_theme,
         chart_theme=args.chart_theme,
+        tempdir=args.tempdir,
         verbose=args.verbose,
     )
     
-    pipeline = MdmPipeline()
-    
-    if args.batch:
-        results = pipeline.batch_convert(args.input, args.output, options)
-        success_count = sum(1 for r in results if r.success)
-        print(f"\n📊 Batch complete: {success_count}/{len(results)} succeeded")
-    else:
-        result = pipeline.convert(args.input, args.output, options)
-        if result.success:
-            print(f"\n✅ Conversion successful!")
-            print(f"   Output: {result.output_path}")
+    with MdmPipeline() as pipeline:
+        if args.batch:
+            results = pipeline.batch_convert(args.input, args.output, options, args.workers)
+            success_count = sum(1 for r in results if r.success)
+            print(f"\n📊 Batch complete: {success_count}/{len(results)} succeeded")
         else:
-            print(f"\n❌ Conversion failed:")
-            for error in result.errors:
-                print(f"   - {error}")
+            result = pipeline.convert(args.input, args.output, options)
+            if result.success:
+                print(f"\n✅ Conversion successful!")
+                print(f"   Output: {result.output_path}")
+            else:
+                print(f"\n❌ Conversion failed:")
+                for error in result.errors:
+                    print(f"   - {error}")
 
 
 if __name__ == "__main__":
@@ -167,7 +167,14 @@ test_python_components() {
     log_info "Running Python tests..."
     cd "$PROJECT_ROOT/tests"
 
-    if python3 -m pytest test_pipeline.py -v 2>/dev/null; then
+    # pytest-xdist가 있으면 TestCase 클래스 단위로 여러 프로세스에 분배
+    # (클래스들은 상태를 공유하지 않음; 클래스 내 setUpClass는 한 워커에서 한 번만)
+    local xdist_args=()
+    if python3 -c "import xdist" 2>/dev/null; then
+        xdist_args=(-n auto --dist=loadscope)
+    fi
+
+    if python3 -m pytest test_pipeline.py -v "${xdist_args[@]}" 2>/dev/null; then
         log_success "Python component tests"
     else
         log_failure "Python component tests"
@@ -13,12 +13,49 @@
 
 import argparse
 import json
+import multiprocessing
+import os
 import re
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# orjson이 있으면 expected.json을 bytes에서 바로 파싱 (str 디코딩 생략)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# google-re2가 있으면 선형 시간 DFA 엔진 사용 (alt 텍스트 백트래킹 방지)
+try:
+    import re2 as re_engine
+except ImportError:
+    re_engine = re
+
+# 마크다운 이미지: ![alt](src "title"){attrs}
+_IMG_RE = re_engine.compile(r'!\[([^\]]*)\]\(([^)\s]+)(?:\s+"([^"]*)")?\)(?:\{([^}]*)\})?')
+_PRESET_RE = re_engine.compile(r"preset=(\w+)")
+
+# YouTube/Vimeo 등 embed URL
+_EMBED_RE = re.compile(r"youtube\.com|youtu\.be|vimeo\.com")
+
+# 확장자(점 제외, 소문자) → 리소스 타입
+_TYPE_MAP = {
+    # 이미지
+    "jpg": "image", "jpeg": "image", "png": "image",
+    "gif": "image", "webp": "image", "svg": "image",
+    "avif": "image", "bmp": "image",
+    # 비디오
+    "mp4": "video", "webm": "video", "mov": "video",
+    "avi": "video", "mkv": "video",
+    # 오디오
+    "mp3": "audio", "wav": "audio", "ogg": "audio",
+    "m4a": "audio", "flac": "audio",
+}
+
 
 # 색상 코드
 class Colors:
@@ -43,35 +80,96 @@ class TestResult:
         return self.passed + self.failed + self.skipped
 
 
+# 워커 하나에 한 번에 넘기는 테스트 수 (IPC 비용 분산)
+POOL_CHUNKSIZE = 8
+
+
+def _run_one_test(task):
+    """
+    프로세스 풀 워커: 테스트 하나를 실행하고 (결과, 로그 줄) 반환
+
+    로그는 부모가 카테고리 순서대로 출력하도록 버퍼에 모읍니다.
+    """
+    spec_dir, verbose, category, test_name = task
+    runner = SpecTestRunner(verbose=verbose)
+    runner.spec_dir = spec_dir
+    runner._log_buffer = []
+    runner.run_test(category, test_name)
+    return runner.result, runner._log_buffer
+
+
 class SpecTestRunner:
     """스펙 테스트 러너"""
 
-    def __init__(self, verbose: bool = False, filter_pattern: Optional[str] = None):
+    def __init__(
+        self,
+        verbose: bool = False,
+        filter_pattern: Optional[str] = None,
+        jobs: Optional[int] = None,
+    ):
         self.spec_dir = Path(__file__).parent.parent / "spec"
         self.verbose = verbose
         self.filter = filter_pattern
+        self.jobs = jobs or os.cpu_count() or 1
         self.result = TestResult()
+        self._log_buffer: Optional[List[str]] = None
 
     def log(self, msg: str, color: str = "RESET") -> None:
         """컬러 로깅"""
         color_code = getattr(Colors, color, Colors.RESET)
-        print(f"{color_code}{msg}{Colors.RESET}")
+        line = f"{color_code}{msg}{Colors.RESET}"
+        if self._log_buffer is not None:
+            self._log_buffer.append(line)
+        else:
+            print(line)
 
     def run(self) -> int:
         """모든 테스트 실행"""
         self.log("\n📋 MDM Spec Tests (Python)\n", "CYAN")
         self.log("=" * 50)
 
-        categories = self.get_categories()
+        categories = [
+            category
+            for category in self.get_categories()
+            if not (self.filter and self.filter not in category)
+        ]
+        tests = {category: self.get_tests(category) for category in categories}
+        total = sum(len(names) for names in tests.values())
 
-        for category in categories:
-            if self.filter and self.filter not in category:
-                continue
-            self.run_category(category)
+        # 테스트가 청크 하나 분량 이하면 프로세스 시작 비용이 더 큼
+        if self.jobs <= 1 or total <= POOL_CHUNKSIZE:
+            for category in categories:
+                self.run_category(category)
+        else:
+            self.run_parallel(categories, tests)
 
         self.print_summary()
         return 1 if self.result.failed > 0 else 0
 
+    def run_parallel(self, categories: List[str], tests: Dict[str, List[str]]) -> None:
+        """모든 테스트를 프로세스 풀에 분배하고, 출력은 카테고리 순서대로"""
+        tasks = [
+            (self.spec_dir, self.verbose, category, test_name)
+            for category in categories
+            for test_name in tests[category]
+        ]
+        with multiprocessing.Pool(min(self.jobs, len(tasks))) as pool:
+            outcomes = pool.imap(_run_one_test, tasks, chunksize=POOL_CHUNKSIZE)
+            for category in categories:
+                self.log(f"\n📁 {category}/", "BLUE")
+                for _ in tests[category]:
+                    result, lines = next(outcomes)
+                    for line in lines:
+                        print(line)
+                    self.merge(result)
+
+    def merge(self, result: TestResult) -> None:
+        """워커 결과 합산"""
+        self.result.passed += result.passed
+        self.result.failed += result.failed
+        self.result.skipped += result.skipped
+        self.result.errors.extend(result.errors)
+
     def get_categories(self) -> List[str]:
         """테스트 카테고리 목록"""
         if not self.spec_dir.exists():
@@ -82,14 +180,16 @@ class SpecTestRunner:
             if d.is_dir() and not d.name.startswith(".")
         ]
 
+    def get_tests(self, category: str) -> List[str]:
+        """카테고리의 테스트 이름 목록 (정렬)"""
+        return [test_file.stem for test_file in sorted((self.spec_dir / category).glob("*.md"))]
+
     def run_category(self, category: str) -> None:
         """카테고리별 테스트 실행"""
-        category_path = self.spec_dir / category
         self.log(f"\n📁 {category}/", "BLUE")
 
-        test_files = sorted(category_path.glob("*.md"))
-        for test_file in test_files:
-            self.run_test(category, test_file.stem)
+        for test_name in self.get_tests(category):
+            self.run_test(category, test_name)
 
     def run_test(self, category: str, test_name: str) -> None:
         """개별 테스트 실행"""
@@ -109,7 +209,7 @@ class SpecTestRunner:
                 self.result.skipped += 1
                 return
 
-            expected = json.loads(expected_path.read_text(encoding="utf-8"))
+            expected = _json_loads(expected_path.read_bytes())
 
             # 사이드카 파일 (있는 경우)
             sidecar = None
@@ -154,9 +254,7 @@ class SpecTestRunner:
         resources: Dict[str, Dict[str, Any]] = {}
 
         # 마크다운에서 이미지 추출
-        pattern = r'!\[([^\]]*)\]\(([^)\s]+)(?:\s+"([^"]*)")?\)(?:\{([^}]*)\})?'
-
-        for match in re.finditer(pattern, markdown):
+        for match in _IMG_RE.finditer(markdown):
             alt, src, title, attrs = match.groups()
             filename = Path(src).name
 
@@ -169,7 +267,7 @@ class SpecTestRunner:
 
             # 속성 파싱
             if attrs:
-                preset_match = re.search(r"preset=(\w+)", attrs)
+                preset_match = _PRESET_RE.search(attrs)
                 if preset_match:
                     resource["preset"] = preset_match.group(1)
 
@@ -187,28 +285,15 @@ class SpecTestRunner:
 
     def detect_type(self, src: str) -> str:
         """파일 확장자로 타입 감지"""
-        ext = Path(src).suffix.lower()
-
-        type_map = {
-            # 이미지
-            ".jpg": "image", ".jpeg": "image", ".png": "image",
-            ".gif": "image", ".webp": "image", ".svg": "image",
-            ".avif": "image", ".bmp": "image",
-            # 비디오
-            ".mp4": "video", ".webm": "video", ".mov": "video",
-            ".avi": "video", ".mkv": "video",
-            # 오디오
-            ".mp3": "audio", ".wav": "audio", ".ogg": "audio",
-            ".m4a": "audio", ".flac": "audio",
-        }
-
-        # YouTube/Vimeo 등 embed 감지
-        if "youtube.com" in src or "youtu.be" in src:
-            return "embed"
-        if "vimeo.com" in src:
+        # YouTube/Vimeo 등 embed 감지 (한 번의 스캔)
+        if _EMBED_RE.search(src):
             return "embed"
 
-        return type_map.get(ext, "unknown")
+        # 확장자 없는 경로(예: a.b/file)는 "b/file"이 되어 unknown으로 처리됨
+        _, dot, ext = src.rpartition(".")
+        if not dot:
+            return "unknown"
+        return _TYPE_MAP.get(ext.lower(), "unknown")
 
     def compare_results(
         self, expected: Dict[str, Any], actual: Dict[str, Any]
@@ -262,10 +347,13 @@ def main():
     parser = argparse.ArgumentParser(description="MDM Spec Test Runner (Python)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--filter", "-f", help="Filter tests by category name")
+    parser.add_argument(
+        "--jobs", "-j", type=int, help="Worker processes (default: CPU count)"
+    )
 
     args = parser.parse_args()
 
-    runner = SpecTestRunner(verbose=args.verbose, filter_pattern=args.filter)
+    runner = SpecTestRunner(verbose=args.verbose, filter_pattern=args.filter, jobs=args.jobs)
     sys.exit(runner.run())
 
 
@@ -21,20 +21,132 @@ MDM Pipeline Component Tests
 1.7 오케스트레이터 통합 테스트는 해당 작업 완료 후 추가됩니다.
 """
 
+import io
 import os
+import re
 import sys
 import json
+import multiprocessing
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib import import_module
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
 
 # 프로젝트 루트를 PATH에 추가
 PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))  # allows `import pipeline` (package)
-sys.path.insert(0, str(PROJECT_ROOT / "converters"))
-sys.path.insert(0, str(PROJECT_ROOT / "packages" / "parser-py"))
-sys.path.insert(0, str(PROJECT_ROOT / "pipeline"))
+# 앞쪽이 우선 (pipeline > parser-py > converters > 루트). 한 번에 추가하고,
+# 다시 임포트돼도 (예: xdist 워커) 중복 항목을 만들지 않음
+_TEST_PATHS = [
+    str(PROJECT_ROOT / "pipeline"),
+    str(PROJECT_ROOT / "packages" / "parser-py"),
+    str(PROJECT_ROOT / "converters"),
+    str(PROJECT_ROOT),  # allows `import pipeline` (package)
+]
+sys.path[:0] = [path for path in _TEST_PATHS if path not in sys.path]
+
+# setUpModule에서 미리 임포트할 모듈 (각 테스트 본문에서 지연 임포트됨)
+_WARMUP_MODULES = (
+    "table_to_svg_enhanced",
+    "chart_to_png",
+    "ocr_bridge",
+    "docx_converter",
+    "hwp_converter",
+    "pdf_converter",
+    "pipeline.orchestrator",
+)
+
+# 마크다운 이미지 참조: ![alt](path)
+_IMG_REF_RE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# 차트 테스트가 공유하는 데이터 (setUpClass에서 한 번만 ChartData로 변환)
+_SAMPLE_CHART_DICT = {
+    "type": "bar",
+    "title": "Test Chart",
+    "categories": ["A", "B", "C"],
+    "series": [
+        {"name": "Series 1", "values": [1, 2, 3]}
+    ]
+}
+
+# 여러 테이블 테스트가 공유하는 마크다운 픽스처
+_TABLE_MARKDOWN = "| A | B |\n| --- | --- |\n| 1 | 2 |"
+
+# Rust 출력 픽스처 (모듈 로드 시 한 번만 인코딩)
+_RUST_JSON_FIXTURE = json.dumps({
+    "format": "hwp",
+    "version": "5.0",
+    "metadata": {"title": "테스트"},
+    "text": "Hello World",
+    "images": [],
+    "tables": []
+}, ensure_ascii=False).encode("utf-8")
+
+_RUST_MDX_FIXTURE = """---
+title: "Test Document"
+format: hwp
+---
+
+# Heading
+
+![Image](image1.png)
+
+Some text content.
+""".encode("utf-8")
+
+
+class _StubOcrProcessor:
+    """OCR 엔진 없이 RustOcrBridge를 초기화하기 위한 최소 스텁"""
+
+    engine = "stub"
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+def _try_import(name):
+    try:
+        import_module(name)
+    except Exception:  # 없는 모듈은 해당 테스트가 직접 skip 처리
+        pass
+
+
+def _submit_to_table_pool():
+    """fork된 자식에서 테이블 렌더링 풀이 동작하는지 확인용"""
+    from pipeline.orchestrator import _table_pool
+    return _table_pool().submit(sum, [1, 2]).result(timeout=10)
+
+
+_saved_env = {}
+_render_cache_tmp = None
+
+
+def setUpModule():
+    """변환기 모듈을 스레드 풀에서 미리 임포트
+
+    첫 테스트가 matplotlib/svgwrite 등의 .pyc/.so 로드 비용을 혼자 떠안지
+    않도록 함. 네이티브 확장 로드 중에는 GIL이 풀려 병렬로 진행됨.
+    """
+    # 렌더링 캐시는 홈 디렉토리 대신 임시 디렉토리에 (tearDownModule에서 삭제)
+    global _render_cache_tmp
+    _render_cache_tmp = tempfile.TemporaryDirectory(prefix="mdm-render-cache-")
+    _saved_env["MDM_RENDER_CACHE_DIR"] = os.environ.get("MDM_RENDER_CACHE_DIR")
+    os.environ["MDM_RENDER_CACHE_DIR"] = _render_cache_tmp.name
+
+    with ThreadPoolExecutor(max_workers=len(_WARMUP_MODULES)) as executor:
+        list(executor.map(_try_import, _WARMUP_MODULES))
+
+
+def tearDownModule():
+    for name, value in _saved_env.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+    _render_cache_tmp.cleanup()
 
 
 class TestPipelineOrchestratorDryRun(unittest.TestCase):
@@ -50,270 +162,296 @@ class TestPipelineOrchestratorDryRun(unittest.TestCase):
         self.assertFalse(res.success)
         self.assertTrue(any("Input file not found" in e for e in res.errors))
 
+    def test_batch_convert_keeps_input_order(self):
+        from pipeline import MdmPipeline
+
+        src = Path(tempfile.mkdtemp())
+        for name in ["a.hwp", "b.hwp", "c.hwp"]:
+            (src / name).write_bytes(b"")
+
+        p = MdmPipeline()
+        if p.rust_cli:
+            self.skipTest("Rust CLI가 설치된 환경")
+        results = p.batch_convert(str(src / "*.hwp"), src / "out", max_workers=2)
+
+        self.assertEqual(
+            [r.metadata["input_file"] for r in results],
+            sorted(str(src / n) for n in ["a.hwp", "b.hwp", "c.hwp"]),
+        )
+        self.assertTrue(all("Rust CLI not found" in r.errors[0] for r in results))
+
+    def test_rust_daemon_is_reused_across_documents(self):
+        from pipeline.orchestrator import ConversionOptions, MdmPipeline
+
+        tmp = Path(tempfile.mkdtemp())
+        fake_cli = tmp / "hwp2mdm"
+        fake_cli.write_text(
+            f"#!{sys.executable}\n"
+            "import json, sys\n"
+            "if '--help' in sys.argv: sys.exit(0)\n"
+            "for line in sys.stdin:\n"
+            "    print(json.dumps({'ok': True}), flush=True)\n",
+            encoding="utf-8",
+        )
+        fake_cli.chmod(0o755)
+
+        with MdmPipeline(str(fake_cli)) as p:
+            daemons = []
+            for name in ["a.hwp", "b.hwp"]:
+                result = p._run_rust_parser(tmp / name, tmp / "out", ConversionOptions())
+                self.assertTrue(result["success"], result["errors"])
+                daemons.append(p._daemon)
+            daemon = daemons[0]
+            self.assertIs(daemons[1], daemon)
+            self.assertTrue(daemon.alive)
+        self.assertFalse(daemon.alive)
+
+    @unittest.skipUnless(
+        "fork" in multiprocessing.get_all_start_methods(), "fork start method not available"
+    )
+    def test_table_pool_works_in_forked_child(self):
+        """부모가 쓰던 테이블 풀을 fork된 자식에서도 쓸 수 있어야 함"""
+        from pipeline.orchestrator import _table_pool
+
+        _table_pool().submit(sum, [1]).result()
+        with multiprocessing.get_context("fork").Pool(1) as pool:
+            self.assertEqual(pool.apply_async(_submit_to_table_pool).get(timeout=30), 3)
+
+    def test_publish_staged_moves_tree_into_output(self):
+        from pipeline.orchestrator import _publish_staged
+
+        staging = Path(tempfile.mkdtemp())
+        output = Path(tempfile.mkdtemp())
+        (staging / "assets").mkdir()
+        (staging / "doc.mdx").write_text("new", encoding="utf-8")
+        (staging / "assets" / "table_1.svg").write_text("<svg/>", encoding="utf-8")
+        (output / "doc.mdx").write_text("old", encoding="utf-8")
+
+        _publish_staged(staging, output)
+
+        self.assertEqual((output / "doc.mdx").read_text(encoding="utf-8"), "new")
+        self.assertTrue((output / "assets" / "table_1.svg").exists())
+        self.assertFalse((staging / "doc.mdx").exists())
+
+    def test_render_cache_dir_follows_env(self):
+        from pipeline.orchestrator import _render_cache_dir
+
+        self.assertEqual(_render_cache_dir(), Path(os.environ["MDM_RENDER_CACHE_DIR"]))
+
+    def test_render_cache_reuses_identical_output(self):
+        from pipeline.orchestrator import _render_cached, _render_key, _evict_render_cache
+
+        tmp = Path(tempfile.mkdtemp())
+        cache_path = tmp / "cache" / f"{_render_key({'rows': [['a']]}, 'default')}.svg"
+        calls = []
+
+        def render(path):
+            calls.append(path)
+            path.write_text("<svg/>", encoding="utf-8")
+
+        for name in ["table_1.svg", "table_2.svg"]:
+            out = tmp / name
+            _render_cached(cache_path, out, lambda: render(out))
+            self.assertEqual(out.read_text(encoding="utf-8"), "<svg/>")
+
+        self.assertEqual(calls, [tmp / "table_1.svg"])
+        self.assertNotEqual(_render_key({"rows": [["a"]]}, "dark"), cache_path.stem)
+        # 렌더러 버전/스타일이 바뀌면 키도 바뀜
+        self.assertNotEqual(_render_key({"rows": [["a"]]}, "default", "v2"), cache_path.stem)
+
+        _evict_render_cache(cache_path.parent, max_bytes=0)
+        self.assertFalse(cache_path.exists())
+
 
 class TestTableSvgEnhanced(unittest.TestCase):
     """table_to_svg_enhanced.py 테스트"""
 
-    def setUp(self):
-        """테스트 환경 설정"""
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """테스트 환경 정리"""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @classmethod
+    def setUpClass(cls):
+        # 모듈은 클래스당 한 번만 임포트 (없으면 클래스 전체 스킵)
+        try:
+            import table_to_svg_enhanced
+        except ImportError as e:
+            raise unittest.SkipTest(f"table_to_svg_enhanced not available: {e}")
+        cls.mod = table_to_svg_enhanced
+        # 같은 픽스처 문자열은 한 번만 파싱 (렌더러는 Table을 읽기만 함)
+        parse = lru_cache(maxsize=None)(table_to_svg_enhanced.Table.from_markdown)
+        cls.parse_markdown = staticmethod(parse)
 
     def test_table_from_markdown(self):
         """마크다운 테이블 파싱 테스트"""
-        try:
-            from table_to_svg_enhanced import Table
-
-            markdown = """| A | B |
-| --- | --- |
-| 1 | 2 |"""
-
-            table = Table.from_markdown(markdown)
-            self.assertEqual(table.row_count, 2)
-            self.assertEqual(table.col_count, 2)
-            self.assertTrue(table.has_header)
-        except ImportError:
-            self.skipTest("table_to_svg_enhanced not available")
+        table = self.parse_markdown(_TABLE_MARKDOWN)
+        self.assertEqual(table.row_count, 2)
+        self.assertEqual(table.col_count, 2)
+        self.assertTrue(table.has_header)
 
     def test_table_from_rust_output(self):
         """Rust 출력 형식 파싱 테스트"""
-        try:
-            from table_to_svg_enhanced import Table
-
-            rust_data = {
-                "rows": [
-                    ["Header1", "Header2"],
-                    ["Cell1", "Cell2"]
-                ],
-                "has_header": True
-            }
-
-            table = Table.from_rust_output(rust_data)
-            self.assertEqual(table.row_count, 2)
-            self.assertEqual(table.col_count, 2)
-        except ImportError:
-            self.skipTest("table_to_svg_enhanced not available")
+        rust_data = {
+            "rows": [
+                ["Header1", "Header2"],
+                ["Cell1", "Cell2"]
+            ],
+            "has_header": True
+        }
+
+        table = self.mod.Table.from_rust_output(rust_data)
+        self.assertEqual(table.row_count, 2)
+        self.assertEqual(table.col_count, 2)
 
     def test_cell_span_support(self):
         """병합 셀 지원 테스트"""
-        try:
-            from table_to_svg_enhanced import Table, TableCell
-
-            rust_data = {
-                "cells": [
-                    {"content": "Merged", "row": 0, "col": 0, "row_span": 2, "col_span": 1},
-                    {"content": "B", "row": 0, "col": 1},
-                    {"content": "C", "row": 1, "col": 1},
-                ],
-                "row_count": 2,
-                "col_count": 2,
-            }
-
-            table = Table.from_rust_output(rust_data)
-            merged_cell = table.cells[0]
-            self.assertEqual(merged_cell.row_span, 2)
-        except ImportError:
-            self.skipTest("table_to_svg_enhanced not available")
+        rust_data = {
+            "cells": [
+                {"content": "Merged", "row": 0, "col": 0, "row_span": 2, "col_span": 1},
+                {"content": "B", "row": 0, "col": 1},
+                {"content": "C", "row": 1, "col": 1},
+            ],
+            "row_count": 2,
+            "col_count": 2,
+        }
+
+        table = self.mod.Table.from_rust_output(rust_data)
+        merged_cell = table.cells[0]
+        self.assertEqual(merged_cell.row_span, 2)
 
     def test_svg_rendering(self):
         """SVG 렌더링 테스트"""
-        try:
-            from table_to_svg_enhanced import Table, TableSvgRenderer
+        if not self.mod.HAS_SVGWRITE:
+            self.skipTest("svgwrite not available")
 
-            markdown = "| A | B |\n| --- | --- |\n| 1 | 2 |"
-            table = Table.from_markdown(markdown)
-            renderer = TableSvgRenderer()
+        table = self.parse_markdown(_TABLE_MARKDOWN)
+        renderer = self.mod.TableSvgRenderer()
 
-            output_path = os.path.join(self.temp_dir, "test_table.svg")
-            result = renderer.render(table, output_path)
+        # 디스크를 거치지 않고 메모리 버퍼로 렌더링
+        buf = io.BytesIO()
+        renderer.render(table, buf)
 
-            self.assertTrue(os.path.exists(result))
-            with open(result, 'r') as f:
-                content = f.read()
-                self.assertIn("<svg", content)
-                self.assertIn("</svg>", content)
-        except ImportError:
-            self.skipTest("table_to_svg_enhanced or svgwrite not available")
+        # 여는 태그는 앞에서, 닫는 태그는 끝에서 찾아 전체 재스캔을 피함
+        svg = buf.getvalue()
+        self.assertGreaterEqual(svg.find(b"<svg"), 0)
+        self.assertGreaterEqual(svg.rfind(b"</svg>"), 0)
 
 
 class TestChartToPng(unittest.TestCase):
     """chart_to_png.py 테스트"""
 
-    def setUp(self):
-        """테스트 환경 설정"""
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        """테스트 환경 정리"""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @classmethod
+    def setUpClass(cls):
+        # matplotlib 임포트가 무거우므로 클래스당 한 번만 (없으면 클래스 전체 스킵)
+        try:
+            import chart_to_png
+        except ImportError as e:
+            raise unittest.SkipTest(f"chart_to_png or matplotlib not available: {e}")
+        cls.mod = chart_to_png
+        # 렌더러(와 그 Figure)를 클래스 전체에서 재사용.
+        # 테스트는 파일 크기보다 속도: 가장 빠른 PNG 압축 수준 사용
+        cls.renderer = chart_to_png.ChartRenderer(compress_level=1)
+        # ChartData는 불변이므로 복사 없이 테스트 간에 공유
+        cls.sample_chart = chart_to_png.ChartData.from_dict(_SAMPLE_CHART_DICT)
 
     def test_chart_data_from_dict(self):
         """차트 데이터 딕셔너리 파싱 테스트"""
-        try:
-            from chart_to_png import ChartData, ChartType
-
-            data = {
-                "type": "bar",
-                "title": "Test Chart",
-                "categories": ["A", "B", "C"],
-                "series": [
-                    {"name": "Series 1", "values": [1, 2, 3]}
-                ]
-            }
-
-            chart = ChartData.from_dict(data)
-            self.assertEqual(chart.chart_type, ChartType.BAR)
-            self.assertEqual(chart.title, "Test Chart")
-            self.assertEqual(len(chart.series), 1)
-        except ImportError:
-            self.skipTest("chart_to_png not available")
+        chart = self.sample_chart
+        self.assertEqual(chart.chart_type, self.mod.ChartType.BAR)
+        self.assertEqual(chart.title, "Test Chart")
+        self.assertEqual(len(chart.series), 1)
 
     def test_chart_types(self):
         """지원되는 차트 유형 테스트"""
-        try:
-            from chart_to_png import ChartType
-
-            expected_types = ["bar", "line", "pie", "scatter", "area"]
-            for chart_type in expected_types:
-                enum_type = ChartType(chart_type)
-                self.assertIsNotNone(enum_type)
-        except ImportError:
-            self.skipTest("chart_to_png not available")
+        expected_types = {"bar", "line", "pie", "scatter", "area"}
+        supported = {chart_type.value for chart_type in self.mod.ChartType}
+        self.assertLessEqual(expected_types, supported)
 
     def test_chart_style_themes(self):
         """차트 스타일 테마 테스트"""
-        try:
-            from chart_to_png import ChartStyle
+        ChartStyle = self.mod.ChartStyle
 
-            dark = ChartStyle.dark_theme()
-            self.assertIsNotNone(dark.background_color)
+        dark = ChartStyle.dark_theme()
+        self.assertIsNotNone(dark.background_color)
 
-            minimal = ChartStyle.minimal_theme()
-            self.assertIsNotNone(minimal.background_color)
+        minimal = ChartStyle.minimal_theme()
+        self.assertIsNotNone(minimal.background_color)
 
-            presentation = ChartStyle.presentation_theme()
-            self.assertIsNotNone(presentation.background_color)
-        except ImportError:
-            self.skipTest("chart_to_png not available")
+        presentation = ChartStyle.presentation_theme()
+        self.assertIsNotNone(presentation.background_color)
 
     def test_chart_rendering(self):
         """차트 PNG 렌더링 테스트"""
-        try:
-            from chart_to_png import ChartRenderer, ChartData
-
-            data = {
-                "type": "bar",
-                "title": "Test",
-                "categories": ["A", "B"],
-                "series": [{"name": "Data", "values": [10, 20]}]
-            }
-
-            chart_data = ChartData.from_dict(data)
-            renderer = ChartRenderer()
-            output_path = os.path.join(self.temp_dir, "test_chart.png")
-
-            result = renderer.render(chart_data, output_path)
-
-            self.assertTrue(os.path.exists(result))
-            # PNG 파일 시그니처 확인
-            with open(result, 'rb') as f:
-                signature = f.read(8)
-                self.assertEqual(signature[:4], b'\x89PNG')
-        except ImportError:
-            self.skipTest("chart_to_png or matplotlib not available")
+        # 디스크를 거치지 않고 메모리 버퍼로 렌더링
+        buf = io.BytesIO()
+        self.renderer.render(self.sample_chart, buf)
+
+        # PNG 파일 시그니처 확인
+        self.assertEqual(buf.getvalue()[:8], PNG_SIGNATURE)
+
+    def test_chart_rendering_non_png_path(self):
+        """PNG가 아닌 확장자 (SVG) 렌더링 테스트"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = self.renderer.render(self.sample_chart, Path(temp_dir) / "chart.svg")
+
+            svg = Path(result).read_bytes()
+            self.assertGreaterEqual(svg.find(b"<svg"), 0)
+            self.assertNotEqual(svg[:8], PNG_SIGNATURE)
 
 
 class TestOcrBridge(unittest.TestCase):
     """ocr_bridge.py 테스트"""
 
+    @classmethod
+    def setUpClass(cls):
+        # 모듈은 클래스당 한 번만 임포트 (없으면 클래스 전체 스킵)
+        try:
+            import ocr_bridge
+        except ImportError as e:
+            raise unittest.SkipTest(f"ocr_bridge not available: {e}")
+        cls.mod = ocr_bridge
+
     def test_rust_output_parsing_json(self):
         """Rust JSON 출력 파싱 테스트"""
-        try:
-            from ocr_bridge import RustOutput
-
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                json.dump({
-                    "format": "hwp",
-                    "version": "5.0",
-                    "metadata": {"title": "Test"},
-                    "text": "Hello World",
-                    "images": [],
-                    "tables": []
-                }, f)
-                f.flush()
-
-                output = RustOutput.from_json(f.name)
-                self.assertEqual(output.format, "hwp")
-                self.assertEqual(output.text_content, "Hello World")
-
-                os.unlink(f.name)
-        except ImportError:
-            self.skipTest("ocr_bridge not available")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path = Path(temp_dir) / "output.json"
+            json_path.write_bytes(_RUST_JSON_FIXTURE)
+
+            output = self.mod.RustOutput.from_json(json_path)
+            self.assertEqual(output.format, "hwp")
+            self.assertEqual(output.text_content, "Hello World")
+            self.assertEqual(output.metadata["title"], "테스트")
 
     def test_rust_output_parsing_mdx(self):
         """Rust MDX 출력 파싱 테스트"""
-        try:
-            from ocr_bridge import RustOutput
+        with tempfile.TemporaryDirectory() as temp_dir:
+            mdx_path = Path(temp_dir) / "output.mdx"
+            mdx_path.write_bytes(_RUST_MDX_FIXTURE)
 
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.mdx', delete=False) as f:
-                f.write("""---
-title: "Test Document"
-format: hwp
----
-
-# Heading
-
-![Image](image1.png)
-
-Some text content.
-""")
-                f.flush()
-
-                output = RustOutput.from_mdx(f.name)
-                self.assertEqual(output.format, "hwp")
-                self.assertIn("Heading", output.text_content)
-                self.assertEqual(len(output.images), 1)
-
-                os.unlink(f.name)
-        except ImportError:
-            self.skipTest("ocr_bridge not available")
+            output = self.mod.RustOutput.from_mdx(mdx_path)
+            self.assertEqual(output.format, "hwp")
+            self.assertIn("Heading", output.text_content)
+            self.assertEqual(len(output.images), 1)
 
     def test_ocr_result_structure(self):
         """OCR 결과 구조 테스트"""
-        try:
-            from ocr_bridge import OcrResult
-
-            result = OcrResult(
-                image_id="img_001",
-                source_path="/path/to/image.png",
-                extracted_text="Hello World",
-                confidence=0.95,
-                language="kor"
-            )
-
-            result_dict = result.to_dict()
-            self.assertEqual(result_dict["image_id"], "img_001")
-            self.assertEqual(result_dict["extracted_text"], "Hello World")
-            self.assertEqual(result_dict["confidence"], 0.95)
-        except ImportError:
-            self.skipTest("ocr_bridge not available")
-
-    @patch('ocr_bridge.OcrProcessor')
-    def test_ocr_bridge_initialization(self, mock_processor):
+        result = self.mod.OcrResult(
+            image_id="img_001",
+            source_path="/path/to/image.png",
+            extracted_text="Hello World",
+            confidence=0.95,
+            language="kor"
+        )
+
+        result_dict = result.to_dict()
+        self.assertEqual(result_dict["image_id"], "img_001")
+        self.assertEqual(result_dict["extracted_text"], "Hello World")
+        self.assertEqual(result_dict["confidence"], 0.95)
+
+    def test_ocr_bridge_initialization(self):
         """OCR 브릿지 초기화 테스트"""
-        try:
-            from ocr_bridge import RustOcrBridge
+        # mock 대신 단순 스텁으로 교체하고 테스트 후 복원
+        self.addCleanup(setattr, self.mod, "OcrProcessor", self.mod.OcrProcessor)
+        self.mod.OcrProcessor = _StubOcrProcessor
 
-            mock_processor.return_value = MagicMock()
-            bridge = RustOcrBridge(ocr_engine="auto")
-            self.assertIsNotNone(bridge)
-        except ImportError:
-            self.skipTest("ocr_bridge not available")
+        bridge = self.mod.RustOcrBridge(ocr_engine="auto", use_disk_cache=False)
+        self.assertIsNotNone(bridge)
 
 
 class TestDocxConverter(unittest.TestCase):
@@ -372,10 +510,6 @@ title: "테스트 문서"
 
     def test_image_reference_format(self):
         """이미지 참조 형식 검증"""
-        # 마크다운 이미지 형식: ![alt](path)
-        import re
-        pattern = r'!\[([^\]]*)\]\(([^)]+)\)'
-
         samples = [
             "![이미지](./assets/image1.png)",
             "![](media/photo.jpg)",
@@ -383,7 +517,7 @@ title: "테스트 문서"
         ]
 
         for sample in samples:
-            match = re.match(pattern, sample)
+            match = _IMG_REF_RE.match(sample)
             self.assertIsNotNone(match, f"Failed to match: {sample}")
 
     def test_table_markdown_format(self):